@@ -0,0 +1,104 @@
+# UTILITÁRIO: Ângulo sólido de malhas (triângulos avaliados em lote, fórmula analítica)
+from manim import *
+import numpy as np
+
+
+def triangle_solid_angles(a, b, c):
+    """
+    Ângulo sólido com sinal de cada triângulo visto da origem
+    (fórmula de Van Oosterom e Strackee):
+
+        tan(Ω/2) = a·(b×c) / (|a||b||c| + (a·b)|c| + (a·c)|b| + (b·c)|a|)
+
+    Parâmetros:
+    a, b, c: vértices dos triângulos relativos ao observador (T, 3)
+
+    Retorna:
+    Ângulos sólidos (T,) em esferorradianos; o sinal segue a orientação do triângulo
+    """
+    la = np.linalg.norm(a, axis=1)
+    lb = np.linalg.norm(b, axis=1)
+    lc = np.linalg.norm(c, axis=1)
+    numerator = np.einsum("ij,ij->i", a, np.cross(b, c))
+    denominator = (
+        la * lb * lc
+        + np.einsum("ij,ij->i", a, b) * lc
+        + np.einsum("ij,ij->i", a, c) * lb
+        + np.einsum("ij,ij->i", b, c) * la
+    )
+    return 2 * np.arctan2(numerator, denominator)
+
+
+def mesh_triangles(mesh):
+    """
+    Triângulos (T, 3, 3) de uma malha de quadriláteros: um GridSurface, uma
+    Surface do manim (faces com vértices nos pontos 0, 4, 8 e 12) ou um array
+    de quadriláteros (F, 4, 3). Cada quadrilátero vira dois triângulos.
+    """
+    if hasattr(mesh, "get_face_corners"):
+        corners = mesh.get_face_corners()
+    elif isinstance(mesh, Mobject):
+        corners = np.array([face.points[[0, 4, 8, 12]] for face in mesh])
+    else:
+        corners = np.asarray(mesh, dtype=float)
+    return np.concatenate([
+        corners[:, [0, 1, 2]],
+        corners[:, [0, 2, 3]],
+    ])
+
+
+class SolidAngle:
+    """
+    Ângulo sólido Ω subtendido por uma malha, visto de qualquer ponto.
+
+    Os triângulos da malha só são extraídos de novo quando os pontos da malha
+    mudam (a comparação é uma única operação sobre o array de pontos); cada
+    consulta avalia todos eles em uma só passada vetorizada (milhares de
+    triângulos por quadro).
+
+    Parâmetros:
+    mesh: malha (ver mesh_triangles)
+    observer: ponto de observação padrão (array) ou mobject cujo centro é usado
+    """
+
+    def __init__(self, mesh, observer=ORIGIN):
+        self.mesh = mesh
+        self.observer = observer
+        self.refresh_geometry()
+
+    def _mesh_points(self):
+        if isinstance(self.mesh, Mobject):
+            return self.mesh.get_all_points()
+        return np.asarray(self.mesh, dtype=float)
+
+    def refresh_geometry(self):
+        """Extrai de novo os triângulos da malha."""
+        self._points = self._mesh_points().copy()
+        self.triangles = mesh_triangles(self.mesh)
+        return self
+
+    def update_geometry(self):
+        """Extrai de novo os triângulos apenas se os pontos da malha mudaram."""
+        if not np.array_equal(self._mesh_points(), self._points):
+            self.refresh_geometry()
+        return self
+
+    def _observer_point(self, observer):
+        if observer is None:
+            observer = self.observer
+        if isinstance(observer, Mobject):
+            observer = observer.get_center()
+        return np.asarray(observer, dtype=float)
+
+    def get_value(self, observer=None):
+        """
+        Retorna Ω (em esferorradianos) visto do observador.
+        Para uma malha aberta com orientação consistente, |Σ Ω_triângulo|.
+        """
+        self.update_geometry()
+        relative = self.triangles - self._observer_point(observer)
+        return float(abs(triangle_solid_angles(relative[:, 0], relative[:, 1], relative[:, 2]).sum()))
+
+    def get_fraction(self, observer=None):
+        """Fração da esfera completa (Ω / 4π)."""
+        return self.get_value(observer) / (4 * PI)
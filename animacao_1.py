@@ -1,11 +1,33 @@
 # ANIMAÇÃO 1: Fluxo do campo elétrico através de uma superfície plana
-from manim import *
+from manim import (
+    Arrow3D, BLUE, Circumscribe, Create, DEGREES, DL, DOWN, DR, DecimalNumber, FadeIn,
+    FadeOut, LEFT, Line, MathTex, ORIGIN, PI, PURE_BLUE, ParametricFunction, Prism, RED,
+    RIGHT, UL, UR, VGroup, ValueTracker, WHITE, YELLOW, rotation_matrix, smooth,
+)
 import numpy as np
+from glifos import FieldGlyphs, grid_points
+from visibilidade import BoxVisibility
+from hud import HudScene
+from leitura import LiveReadout
+from transformacoes import bind_partial, bind_transform
+from lod import lod_resolution
 from math import degrees
 import math
 
-class open_flux(ThreeDScene):
+class open_flux(HudScene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "angle_start": PI/2,                              # Ângulo inicial da superfície
+        "first_angles": (PI/4, 0),                        # Rotações da primeira parte
+        "second_angles": (PI/4, PI/2, 3*PI/4, PI),        # Rotações com o indicador do ângulo
+        "x_range": (-2.0, 2.0, 1.5),                      # Grade de vetores: (início, fim, passo)
+        "y_range": (-2.5, 1.25, 1.5),
+        "z_range": (-1.5, 1.5, 0.75),
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ============================================================
         # 1. CONFIGURAÇÃO INICIAL DA CENA E CONTROLES INTERATIVOS
         # ============================================================
@@ -17,7 +39,7 @@ class open_flux(ThreeDScene):
         scale_factor_tracker = ValueTracker(1)
         
         # Rastreador para controlar o ângulo de rotação da superfície (inicia em 90 graus = PI/2 rad)
-        angle_tracker = ValueTracker(PI/2)
+        angle_tracker = ValueTracker(p["angle_start"])
         
         # Display numérico que mostra o ângulo atual em graus. Atualiza automaticamente.
         angle_display = DecimalNumber(
@@ -28,9 +50,7 @@ class open_flux(ThreeDScene):
             unit=r"^\circ"                          # Símbolo de graus
         ).add_updater(
             lambda d: d.set_value(np.degrees(angle_tracker.get_value()))  # Atualiza o valor em graus
-        ).to_corner(3 * DR).add_updater(  # Posiciona no canto inferior direito
-            lambda v: self.add_fixed_in_frame_mobjects(v)  # Mantém o objeto fixo na tela (não gira com a cena 3D)
-        )
+        ).to_corner(3 * DR)  # Posiciona no canto inferior direito (fixo na tela via HUD)
 
         # ============================================================
         # 2. CONSTRUÇÃO DO INDICADOR VISUAL DO ÂNGULO (linhas e arco)
@@ -39,28 +59,32 @@ class open_flux(ThreeDScene):
         # Linha de referência fixa (horizontal, eixo X positivo)
         line_initial = Line(ORIGIN, RIGHT*0.5, color=WHITE)
         
-        # Linha que rotaciona de acordo com o ângulo. É redesenhada continuamente.
-        line_rotating = always_redraw(lambda: Line(
-            ORIGIN,
-            [0.5*np.cos(angle_tracker.get_value()),
-             0,
-             0.5*np.sin(angle_tracker.get_value())],
-            color=WHITE
-        ))
+        # Rotação em torno do eixo -Y pelo ângulo atual: leva o eixo X positivo
+        # ao vetor [cos(θ), 0, sin(θ)]
+        def angle_rotation():
+            return rotation_matrix(angle_tracker.get_value(), DOWN)
+
+        # Linha que rotaciona de acordo com o ângulo. Construída uma vez sobre o
+        # eixo X; a cada quadro apenas a rotação é aplicada aos seus pontos.
+        line_rotating = bind_transform(Line(ORIGIN, RIGHT*0.5, color=WHITE), angle_rotation)
         
-        # Arco amarelo que ilustra o ângulo entre as duas linhas
-        arc_angle = always_redraw(lambda: ParametricFunction(
-            lambda t: np.array([
-                0.5*np.cos(t),
-                0,
-                0.5*np.sin(t)
-            ]),
-            t_range=[0, angle_tracker.get_value()],  # O arco se estende do eixo X até a linha rotacionada
-            color=YELLOW
-        ))
+        # Arco amarelo que ilustra o ângulo entre as duas linhas. O arco completo
+        # (0 a π) é construído uma vez e exibido parcialmente até o ângulo atual.
+        arc_angle = bind_partial(
+            ParametricFunction(
+                lambda t: np.array([
+                    0.5*np.cos(t),
+                    0,
+                    0.5*np.sin(t)
+                ]),
+                t_range=[0, PI],
+                color=YELLOW
+            ),
+            lambda: angle_tracker.get_value() / PI  # O arco se estende do eixo X até a linha rotacionada
+        )
 
         # Rótulo do ângulo (símbolo theta). Fixo no canto superior esquerdo.
-        theta_arc_label = MathTex(r"\theta").move_to(UL*2.5).add_updater(lambda v: self.add_fixed_in_frame_mobjects(v))
+        theta_arc_label = MathTex(r"\theta").move_to(UL*2.5)
         theta_arc_label.set_color(YELLOW)
 
         # Agrupa os elementos visuais do ângulo para facilitar o gerenciamento
@@ -82,13 +106,14 @@ class open_flux(ThreeDScene):
         # 4. DEFINIÇÃO DOS VETORES PRINCIPAIS
         # ============================================================
         
-        # Vetor normal (n̂) à superfície. Atualiza sua direção conforme o ângulo muda.
-        normal_arrow = always_redraw(lambda: Arrow3D(
+        # Vetor normal (n̂) à superfície. Construído uma vez sobre o eixo X e
+        # rotacionado conforme o ângulo muda.
+        normal_arrow = bind_transform(Arrow3D(
             start=sq.get_center(),
-            end=[1.0 * np.cos(angle_tracker.get_value()), 0, 1.0 * np.sin(angle_tracker.get_value())],
+            end=RIGHT,
             color=PURE_BLUE,
-            resolution=8  # Número de segmentos para suavizar a seta 3D
-        ))
+            resolution=lod_resolution(8)  # Segmentos da seta 3D (conforme a qualidade)
+        ), angle_rotation, about_point=sq.get_center())
         normal_arrow.set_z_index(+10)
         normal_arrow.set_opacity(0.9)
 
@@ -97,12 +122,16 @@ class open_flux(ThreeDScene):
         # ============================================================
         
         # Cria uma cópia da superfície que será usada para animações de rotação e escala.
-        # É redesenhada continuamente para refletir mudanças no ângulo e no tamanho.
-        rotating_prism = always_redraw(lambda: sq.copy().move_to(ORIGIN).rotate(
-            angle_tracker.get_value() + PI/2,  # Rotação adicional de 90 graus
-            axis=DOWN,                         # Eixo de rotação (para baixo)
-            about_point=ORIGIN                 # Ponto de origem da rotação
-        ).scale(scale_factor_tracker.get_value()))  # Aplica o fator de escala
+        # A cópia é feita uma única vez; a cada quadro a matriz de rotação e escala
+        # derivada dos rastreadores é aplicada aos seus pontos.
+        rotating_prism = bind_transform(
+            sq.copy().move_to(ORIGIN),
+            lambda: scale_factor_tracker.get_value() * rotation_matrix(
+                angle_tracker.get_value() + PI/2,  # Rotação adicional de 90 graus
+                DOWN,                              # Eixo de rotação (para baixo)
+            ),                                     # Aplica o fator de escala
+            about_point=ORIGIN                     # Ponto de origem da rotação
+        )
 
         # Agrupa a superfície rotacionada com o vetor normal
         norma_plano = VGroup(rotating_prism, normal_arrow)
@@ -125,18 +154,19 @@ class open_flux(ThreeDScene):
             num_decimal_places=1,
             include_sign=False,
             color=WHITE,
-        ).to_corner(3 * DR).add_updater(
-            lambda v: self.add_fixed_in_frame_mobjects(v)  # Mantém fixo na tela
-        )
+        ).to_corner(3 * DR)
 
         # ============================================================
         # 7. EQUAÇÃO DO FLUXO (ATUALIZADA DINAMICAMENTE)
         # ============================================================
         
-        # Versão inicial da equação, posicionada abaixo do mostrador de ângulo
-        flux_equation = MathTex(
-            r"\Phi =|\vec{E}| \cdot |\vec{A}| \cdot \cos(\theta)",
-            substrings_to_isolate=[r"\cos(\theta)", r"|\vec{E}|", r"|\vec{A}|", r"\Phi"],
+        # Leitura numérica do fluxo, posicionada abaixo do mostrador de ângulo.
+        # O prefixo "\Phi =" é composto uma única vez; os dígitos vêm de um atlas
+        # de glifos e só são remontados quando o valor exibido muda.
+        flux_equation = LiveReadout(
+            r"\Phi = ",  # Símbolo do fluxo
+            lambda: math.cos(angle_tracker.get_value()) * scale_factor_tracker.get_value(),  # Valor calculado: cos(θ) * A
+            num_decimal_places=2,
         ).next_to(angle_display, DOWN*2)
 
         # Versão fixa da equação, posicionada no canto superior direito (não atualiza)
@@ -145,26 +175,15 @@ class open_flux(ThreeDScene):
             substrings_to_isolate=[r"\cos(\theta)", r"|\vec{E}|", r"|\vec{A}|", r"\Phi"],
         ).to_corner(UR).set_color(YELLOW)
 
-        # Atualizador que substitui a equação por uma versão com o valor numérico calculado
-        flux_equation.add_updater(
-            lambda m: m.become(
-                MathTex(
-                    r"\Phi = "  # Símbolo do fluxo
-                    + f"{math.cos(angle_tracker.get_value()) * scale_factor_tracker.get_value():.2f}"  # Valor calculado: cos(θ) * A
-                ).move_to(m.get_center())
-            )
-        ).add_updater(
-            lambda v: self.add_fixed_in_frame_mobjects(v)  # Mantém fixo na tela
-        )
-
         # Unidade do fluxo (N.m²/C)
-        flux_unit = MathTex(r"N.m^2/C", font_size=25).add_updater(lambda v: self.add_fixed_in_frame_mobjects(v))
+        flux_unit = MathTex(r"N.m^2/C", font_size=25)
         flux_unit.move_to(flux_equation, RIGHT)
 
         # Rótulo "θ =" ao lado do mostrador numérico
-        angle_label = MathTex(r"\theta =").next_to(angle_display, LEFT).add_updater(
-            lambda v: self.add_fixed_in_frame_mobjects(v)
-        )
+        angle_label = MathTex(r"\theta =").next_to(angle_display, LEFT)
+
+        # Elementos fixos na tela (HUD) são registrados uma única vez com self.add_hud,
+        # rasterizados em cache e redesenhados somente quando seu conteúdo muda
 
         # ============================================================
         # 8. RÓTULOS E LEGENDAS PARA OS ELEMENTOS DA CENA
@@ -179,47 +198,30 @@ class open_flux(ThreeDScene):
         # 9. CRIAÇÃO DO CAMPO VETORIAL (LINHAS DE CAMPO ELÉTRICO)
         # ============================================================
         
-        # Função que cria um vetor individual do campo
-        def create_vector(x, y, z):
-            direction = np.array([2.0, 0.0, 0.0]) / 2  # Direção constante (eixo X)
-            start_point = np.array([x, y, z])
-            end_point = start_point + direction
-            arrow = Arrow3D(
-                start=start_point,
-                end=end_point,
-                color=RED,
-                thickness=0.01,
-                resolution=8,  # Suavidade da seta 3D
-            )
-            return arrow
-
         # Define intervalos para gerar uma grade 3D de vetores
-        x_range = np.arange(-2.0, 2.0, 1.5)
-        y_range = np.arange(-2.5, 1.25, 1.5)
-        z_range = np.arange(-1.5, 1.5, 0.75)
-
-        # Grupo que armazenará todos os vetores do campo
-        vector_field = VGroup()
-
-        # Cria manualmente os vetores em uma grade 3D
-        for x in x_range:
-            for y in y_range:
-                for z in z_range:
-                    vector_field.add(create_vector(x, y, z))
+        x_range = np.arange(*p["x_range"])
+        y_range = np.arange(*p["y_range"])
+        z_range = np.arange(*p["z_range"])
+
+        # Todos os vetores do campo em um único mobject (arrays de início/direção)
+        vector_field = FieldGlyphs(
+            starts=grid_points(x_range, y_range, z_range),
+            directions=np.array([2.0, 0.0, 0.0]) / 2,  # Direção constante (eixo X)
+            color=RED,
+            thickness=0.01,
+            resolution=lod_resolution(8),  # Suavidade da seta 3D (conforme a qualidade)
+        )
 
         vector_field.z_index = -2  # Coloca os vetores atrás de outros objetos
 
-        # Função para atualizar a visibilidade dos vetores (opacidade)
-        def update_visibility(mobject):
-            for arrow in vector_field:
-                start = arrow.get_start()
-                # Verifica se o vetor está dentro do volume do prisma
-                if (-0.75 <= start[0] <= 0.75 and
-                    -2.0 <= start[1] <= 2.0 and
-                    -0.25 <= start[2] <= 0.25):
-                    arrow.set_opacity(0.2)   # Mais transparente se estiver "atrás" da superfície
-                else:
-                    arrow.set_opacity(0.3)   # Mais visível se estiver "fora" da superfície
+        # Atualizador de visibilidade: teste da caixa do prisma para todos os vetores
+        # de uma vez, alterando opacidades só quando a classificação muda
+        update_visibility = BoxVisibility(
+            vector_field,
+            bounds=[[-0.75, -2.0, -0.25], [0.75, 2.0, 0.25]],  # Volume do prisma
+            inside_opacity=0.2,   # Mais transparente se estiver "atrás" da superfície
+            outside_opacity=0.3,  # Mais visível se estiver "fora" da superfície
+        )
 
         # Conecta a função de atualização ao campo vetorial
         vector_field.add_updater(update_visibility)
@@ -231,9 +233,9 @@ class open_flux(ThreeDScene):
         # --- INTRODUÇÃO DOS OBJETOS PRINCIPAIS ---
         self.play(FadeIn(norma_plano))
         self.wait()
-        self.add_fixed_in_frame_mobjects(n_hat)
+        self.add_hud(n_hat)
         self.play(Circumscribe(sq, fade_out=True, time_width=5))  # Destaque na superfície
-        self.add_fixed_in_frame_mobjects(n_area)
+        self.add_hud(n_area)
         self.wait()
 
         # --- MUDANÇA DE VISTA DA CÂMERA ---
@@ -241,24 +243,25 @@ class open_flux(ThreeDScene):
         self.wait(2)
 
         # --- ADIÇÃO DOS DISPLAYS DE INFORMAÇÃO ---
-        self.add_fixed_in_frame_mobjects(angle_label)
-        self.add_fixed_in_frame_mobjects(angle_display)
-        self.add_fixed_in_frame_mobjects(flux_equation)
-        self.add_fixed_in_frame_mobjects(flux_equation_fixed)
+        self.add_hud(angle_label)
+        self.add_hud(angle_display)
+        self.add_hud(flux_equation)
+        self.add_hud(flux_equation_fixed)
 
         self.play(FadeOut(n_area, n_hat))
         self.wait()
 
         # --- INTRODUÇÃO DO CAMPO VETORIAL ---
         self.play(FadeIn(vector_field))
-        self.add_fixed_in_frame_mobjects(campo_E)
+        self.add_hud(campo_E)
         self.wait(3)
         self.play(FadeOut(campo_E))
 
         # --- ROTAÇÕES DA SUPERFÍCIE (VARIAÇÃO DE θ) ---
-        self.play(angle_tracker.animate.set_value(PI/4), run_time=7, rate_func=smooth)
+        first_1, first_2 = p["first_angles"]
+        self.play(angle_tracker.animate.set_value(first_1), run_time=7, rate_func=smooth)
         self.wait(2)
-        self.play(angle_tracker.animate.set_value(0), run_time=7, rate_func=smooth)
+        self.play(angle_tracker.animate.set_value(first_2), run_time=7, rate_func=smooth)
         self.wait(2)
 
         # --- MUDANÇA DE VISTA DA CÂMERA (NOVA PERSPECTIVA) ---
@@ -284,14 +287,15 @@ class open_flux(ThreeDScene):
         self.wait()
 
         # --- ROTAÇÕES COM INDICADOR VISUAL DO ÂNGULO ---
-        self.play(angle_tracker.animate.set_value(PI/4), run_time=7, rate_func=smooth)
+        second_1, second_2, second_3, second_4 = p["second_angles"]
+        self.play(angle_tracker.animate.set_value(second_1), run_time=7, rate_func=smooth)
         self.wait()
         self.play(FadeIn(angle_group))  # Mostra as linhas e o arco do ângulo
-        self.play(angle_tracker.animate.set_value(PI/2), run_time=7, rate_func=smooth)
+        self.play(angle_tracker.animate.set_value(second_2), run_time=7, rate_func=smooth)
         self.wait()
-        self.play(angle_tracker.animate.set_value(3*PI/4), run_time=7, rate_func=smooth)
+        self.play(angle_tracker.animate.set_value(second_3), run_time=7, rate_func=smooth)
         self.wait(2)
-        self.play(angle_tracker.animate.set_value(PI), run_time=7, rate_func=smooth)
+        self.play(angle_tracker.animate.set_value(second_4), run_time=7, rate_func=smooth)
         self.wait(2)
         self.play(FadeOut(angle_group))  # Remove o indicador visual
         self.wait(2)
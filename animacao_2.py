@@ -1,10 +1,25 @@
 # ANIMAÇÃO 2: Fluxo do campo elétrico através de uma superfície fechada
-from manim import *
+from manim import (
+    Arrow3D, BLUE, DEGREES, FadeIn, FadeOut, ORIGIN, Prism, RED, ThreeDScene, WHITE,
+    YELLOW_A,
+)
 import numpy as np
+from glifos import FieldGlyphs, grid_points
+from visibilidade import BoxVisibility
+from lod import lod_resolution
 import math
 
 class cubic_flux(ThreeDScene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "x_range": (-3.75, 3.75, 1.0),  # Grade de vetores: (início, fim, passo)
+        "y_range": (-2.0, 2.0, 1.5),
+        "z_range": (-1.0, 2.0, 1.0),
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ============================================
         # 1. CONFIGURAÇÃO INICIAL DA CENA
         # ============================================
@@ -107,47 +122,28 @@ class cubic_flux(ThreeDScene):
         # 6. CRIAÇÃO DO CAMPO VETORIAL UNIFORME
         # ============================================
         
-        # Função que cria um vetor do campo em um ponto (x, y, z)
-        def create_vector(x, y, z):
-            direction = np.array([2.0, 0.0, 0.0])/2.3  # Direção constante (eixo x) e tamanho ajustado
-            start_point = np.array([x, y, z])
-            end_point = start_point + direction
-            arrow = Arrow3D(
-                start=start_point,
-                end=end_point,
-                color=RED,
-                thickness=0.01,
-                resolution=6,  # Número de segmentos para suavizar a seta
-            )
-            return arrow
-
         # Define intervalos para criar uma grade 3D de vetores
-        x_range = np.arange(-3.75, 3.75, 1.0)
-        y_range = np.arange(-2.0, 2.0, 1.5)
-        z_range = np.arange(-1.0, 2.0, 1.0)
-
-        # Grupo para armazenar todos os vetores do campo
-        vector_field = VGroup()
+        x_range = np.arange(*p["x_range"])
+        y_range = np.arange(*p["y_range"])
+        z_range = np.arange(*p["z_range"])
 
-        # Cria os vetores em cada ponto da grade
-        for x in x_range:
-            for y in y_range:
-                for z in z_range:
-                    vector_field.add(create_vector(x, y, z))
+        # Todos os vetores do campo em um único mobject (arrays de início/direção)
+        vector_field = FieldGlyphs(
+            starts=grid_points(x_range, y_range, z_range),
+            directions=np.array([2.0, 0.0, 0.0])/2.3,  # Direção constante (eixo x) e tamanho ajustado
+            color=RED,
+            thickness=0.01,
+            resolution=lod_resolution(6),  # Segmentos da seta (conforme a qualidade)
+        )
 
-        # Função para atualizar a visibilidade dos vetores (opacidade) com base na posição relativa ao cubo
-        def update_visibility(mobject):
-            for arrow in vector_field:
-                start = arrow.get_start()
-                # Verifica se o vetor está dentro do cubo
-                if (
-                    -1.0 <= start[0] <= 1.0 and
-                    -1.0 <= start[1] <= 1.0 and
-                    -1.0 <= start[2] <= 1.0
-                ):
-                    arrow.set_opacity(0.3)  # Mais transparente se estiver dentro do cubo
-                else:
-                    arrow.set_opacity(0.8)  # Mais visível se estiver fora do cubo
+        # Atualizador de visibilidade com base na posição relativa ao cubo:
+        # máscara vetorizada, opacidades alteradas só quando a classificação muda
+        update_visibility = BoxVisibility(
+            vector_field,
+            bounds=[[-1.0, -1.0, -1.0], [1.0, 1.0, 1.0]],  # Volume do cubo
+            inside_opacity=0.3,   # Mais transparente se estiver dentro do cubo
+            outside_opacity=0.8,  # Mais visível se estiver fora do cubo
+        )
 
         # Conecta a função de atualização ao campo vetorial (será chamada a cada frame)
         vector_field.add_updater(update_visibility)
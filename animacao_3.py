@@ -1,12 +1,29 @@
 # ANIMAÇÃO 3: Fluxo do campo elétrico gerado por uma partícula carregada em uma superfície esférica
-from manim import *
-from manim_physics import *
+from manim import (
+    Arrow3D, BLUE, Create, DEGREES, Dot, Dot3D, FadeIn, FadeOut, GOLD_A, GREEN,
+    LaggedStart, Line, ManimColor, ORIGIN, PI, PURPLE_A, PURPLE_C, RED, RED_A, RED_C,
+    Tex, ThreeDScene, VGroup, WHITE, YELLOW,
+)
+from carregador import Charge  # Só o submódulo de eletrostática
 import numpy as np
+from linhas_de_campo import radial_field_lines
+from superficies import spherical_patch
+from lod import lod_sphere
+from cache_geometria import cached_mobject
 from math import degrees
 import math
 
 class campo_E_3D(ThreeDScene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "radii": (1.5, 3.5, 2.5, 0.75),       # Raios r1..r4 das esferas gaussianas
+        "theta_range": (PI/6, PI/3),          # Ângulo polar do patch
+        "phi_range": (PI/4, PI/2),            # Ângulo azimutal do patch
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ============================================================
         # 1. FUNÇÃO AUXILIAR: CRIAÇÃO DE PATCH ESFÉRICO
         # ============================================================
@@ -22,18 +39,17 @@ class campo_E_3D(ThreeDScene):
             
             Retorna:
             Uma superfície paramétrica representando o patch esférico
+            (malha da esfera unitária avaliada em grade e reaproveitada entre raios;
+            instantâneo em disco entre execuções, ver cache_geometria.py)
             """
-            return Surface(
-                lambda u, v: r * np.array([
-                    np.sin(v) * np.cos(u),  # Coordenada x
-                    np.sin(v) * np.sin(u),  # Coordenada y
-                    np.cos(v)               # Coordenada z
-                ]),
-                u_range=phi_range,    # Intervalo do ângulo azimutal
-                v_range=theta_range,  # Intervalo do ângulo polar
-                resolution=(10, 10),  # Resolução da malha (u_res, v_res)
-                color=GREEN           # Cor base do patch
-            ).set_opacity(0.4)        # Transparência para visualização interna
+            return cached_mobject(
+                spherical_patch,
+                r,
+                theta_range=theta_range,  # Intervalo do ângulo polar
+                phi_range=phi_range,      # Intervalo do ângulo azimutal
+                resolution=(10, 10),      # Resolução da malha (u_res, v_res)
+                color=GREEN               # Cor base do patch
+            ).set_opacity(0.4)            # Transparência para visualização interna
         
         # ============================================================
         # 2. DEFINIÇÃO DAS ESFERAS CONCÊNTRICAS (SUPERFÍCIES GAUSSIANAS)
@@ -41,59 +57,27 @@ class campo_E_3D(ThreeDScene):
         
         # Definindo os raios das esferas concêntricas
         # Cada esfera representa uma superfície gaussiana com diferente raio
-        r1, r2, r3, r4 = 1.5, 3.5, 2.5, 0.75
+        r1, r2, r3, r4 = p["radii"]
         
         # Criação das esferas com diferentes propriedades visuais
         # Todas são centradas na origem e têm baixa opacidade para visualização interna
-        sphere1 = Sphere(radius=r1, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
-        sphere2 = Sphere(radius=r2, resolution=(30,30), stroke_width=0.1).set_opacity(0.1).set_fill_color(RED_A)
-        sphere3 = Sphere(radius=r3, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
-        sphere4 = Sphere(radius=r4, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
+        # (a malha vem do instantâneo de cache_geometria.py a partir da segunda execução)
+        sphere1 = cached_mobject(lod_sphere, radius=r1, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
+        sphere2 = cached_mobject(lod_sphere, radius=r2, resolution=(30,30), stroke_width=0.1).set_opacity(0.1).set_fill_color(RED_A)
+        sphere3 = cached_mobject(lod_sphere, radius=r3, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
+        sphere4 = cached_mobject(lod_sphere, radius=r4, resolution=(30,30), stroke_width=0.4).set_opacity(0.1).set_fill_color(RED_A)
         
         # ============================================================
         # 3. CRIAÇÃO DAS LINHAS DE CAMPO ELÉTRICO RADIAIS
         # ============================================================
         
-        # Definição dos ângulos para distribuição uniforme das linhas de campo
-        theta_range = np.linspace(0, PI, 8)      # Ângulo polar: 0 a π (norte a sul)
-        phi_range = np.linspace(0, 2*PI, 16)     # Ângulo azimutal: 0 a 2π (volta completa)
-        
-        # Grupo para armazenar as linhas de campo da esfera maior (raio 3.5)
-        field_lines = VGroup()
-        
-        # Criação das linhas de campo radiais (excluindo polos para evitar sobreposição)
-        for theta in theta_range[1:-1]:          # Exclui θ=0 e θ=π (polos)
-            for phi in phi_range[1:-1]:          # Exclui φ=0 e φ=2π (para evitar duplicação)
-                # Converte coordenadas esféricas para cartesianas
-                x = 3.5 * np.sin(theta) * np.cos(phi)
-                y = 3.5 * np.sin(theta) * np.sin(phi)
-                z = 3.5 * np.cos(theta)
-                patch_center = np.array([x, y, z])
-                
-                # Calcula vetor normal radial (unitário, apontando para fora)
-                radial_normal = patch_center / np.linalg.norm(patch_center)
-                
-                # Cria seta 3D representando linha de campo
-                field_line = Arrow3D(
-                    start=ORIGIN,                     # Origem no centro da carga
-                    end=patch_center + 1.5*radial_normal,  # Direção radial para fora
-                    thickness=0.01,                   # Espessura fina para visualização clara
-                    color=RED,                        # Vermelho para campo elétrico
-                    resolution=8                      # Resolução da seta 3D
-                )
-                field_lines.add(field_line)
-        
-        # Criação das linhas de campo nos polos (tratamento especial)
-        for theta in [0, 2*PI]:
-            patch_center = np.array([0, 0, 3*np.cos(theta)])
-            radial_normal = np.array([0, 0, np.cos(theta)])
-            field_line = Arrow3D(
-                start=ORIGIN,
-                end=patch_center + 1.5*radial_normal,
-                thickness=0.01,
-                color=RED,
-            )
-            field_lines.add(field_line)
+        # As linhas de campo são geradas por radial_field_lines: todas as direções
+        # (θ em linspace(0, π, 8), φ em linspace(0, 2π, 16), mais os polos) são
+        # calculadas em uma única chamada vetorizada, e o resultado é memorizado
+        # pelos parâmetros.
+        
+        # Linhas de campo da esfera maior (raio 3.5)
+        field_lines = cached_mobject(radial_field_lines, 3.5, extension=1.5)
             
         # Configuração visual comum a todas as linhas de campo
         field_lines.set_opacity(0.15).set_z_index(-2)  # Baixa opacidade e fundo
@@ -101,100 +85,19 @@ class campo_E_3D(ThreeDScene):
         # ============================================================
         # 4. LINHAS DE CAMPO PARA AS OUTRAS ESFERAS CONCÊNTRICAS
         # ============================================================
-        # Nota: O código é repetido para cada raio diferente, mostrando que o
+        # Nota: O mesmo gerador é usado para cada raio diferente, mostrando que o
         # padrão radial é o mesmo independentemente do raio da superfície gaussiana
         
         # Linhas de campo para esfera com raio 2.5
-        field_lines_2 = VGroup()
-        for theta in theta_range[1:-1]:
-            for phi in phi_range[1:-1]:
-                x = 2.5 * np.sin(theta) * np.cos(phi)
-                y = 2.5 * np.sin(theta) * np.sin(phi)
-                z = 2.5 * np.cos(theta)
-                patch_center_2 = np.array([x, y, z])
-                radial_normal_2 = patch_center_2 / np.linalg.norm(patch_center_2)
-                field_line_2 = Arrow3D(
-                    start=ORIGIN,
-                    end=patch_center_2 + 1.5*radial_normal_2,
-                    thickness=0.01,
-                    color=RED,
-                    resolution=8
-                )
-                field_lines_2.add(field_line_2)
-        
-        # Polos para esfera com raio 2.5
-        for theta in [0, PI]:
-            patch_center_2 = np.array([0, 0, 3*np.cos(theta)])
-            radial_normal_2 = np.array([0, 0, np.cos(theta)])
-            field_line_2 = Arrow3D(
-                start=ORIGIN,
-                end=patch_center_2 + 1.5*radial_normal_2,
-                thickness=0.01,
-                color=RED,
-            )
-            field_lines_2.add(field_line_2)
+        field_lines_2 = cached_mobject(radial_field_lines, 2.5, extension=1.5)
         field_lines_2.set_opacity(0.15).set_z_index(-2)
         
         # Linhas de campo para esfera com raio 1.5
-        field_lines_3 = VGroup()
-        for theta in theta_range[1:-1]:
-            for phi in phi_range[1:-1]:
-                x = 1.5 * np.sin(theta) * np.cos(phi)
-                y = 1.5 * np.sin(theta) * np.sin(phi)
-                z = 1.5 * np.cos(theta)
-                patch_center_3 = np.array([x, y, z])
-                radial_normal_3 = patch_center_3 / np.linalg.norm(patch_center_3)
-                field_line_3 = Arrow3D(
-                    start=ORIGIN,
-                    end=patch_center_3 + 1.5*radial_normal_3,
-                    thickness=0.01,
-                    color=RED,
-                    resolution=8
-                )
-                field_lines_3.add(field_line_3)
-        
-        # Polos para esfera com raio 1.5
-        for theta in [0, PI]:
-            patch_center_3 = np.array([0, 0, 3*np.cos(theta)])
-            radial_normal_3 = np.array([0, 0, np.cos(theta)])
-            field_line_3 = Arrow3D(
-                start=ORIGIN,
-                end=patch_center_3 + 1.5*radial_normal_3,
-                thickness=0.01,
-                color=RED,
-            )
-            field_lines_3.add(field_line_3)
+        field_lines_3 = cached_mobject(radial_field_lines, 1.5, extension=1.5)
         field_lines_3.set_opacity(0.15).set_z_index(-2)
         
         # Linhas de campo para esfera com raio 0.75
-        field_lines_4 = VGroup()
-        for theta in theta_range[1:-1]:
-            for phi in phi_range[1:-1]:
-                x = 0.75 * np.sin(theta) * np.cos(phi)
-                y = 0.75 * np.sin(theta) * np.sin(phi)
-                z = 0.75 * np.cos(theta)
-                patch_center_4 = np.array([x, y, z])
-                radial_normal_4 = patch_center_4 / np.linalg.norm(patch_center_4)
-                field_line_4 = Arrow3D(
-                    start=ORIGIN,
-                    end=patch_center_4 + 1.5*radial_normal_4,
-                    thickness=0.01,
-                    color=RED,
-                    resolution=8
-                )
-                field_lines_4.add(field_line_4)
-        
-        # Polos para esfera com raio 0.75
-        for theta in [0, PI]:
-            patch_center_4 = np.array([0, 0, 3*np.cos(theta)])
-            radial_normal_4 = np.array([0, 0, np.cos(theta)])
-            field_line_4 = Arrow3D(
-                start=ORIGIN,
-                end=patch_center_4 + 1.5*radial_normal_4,
-                thickness=0.01,
-                color=RED,
-            )
-            field_lines_4.add(field_line_4)
+        field_lines_4 = cached_mobject(radial_field_lines, 0.75, extension=1.5)
         field_lines_4.set_opacity(0.15).set_z_index(-2)
         
         # ============================================================
@@ -202,8 +105,8 @@ class campo_E_3D(ThreeDScene):
         # ============================================================
         
         # Ângulos que definem o patch (retalho) esférico
-        theta_min, theta_max = PI/6, PI/3   # Intervalo do ângulo polar
-        phi_min, phi_max = PI/4, PI/2       # Intervalo do ângulo azimutal
+        theta_min, theta_max = p["theta_range"]   # Intervalo do ângulo polar
+        phi_min, phi_max = p["phi_range"]         # Intervalo do ângulo azimutal
         
         # Criação dos patches nas duas esferas concêntricas
         patch1 = create_spherical_patch(r1, [theta_min, theta_max], [phi_min, phi_max]).set_fill_color(RED_C)
@@ -236,12 +139,12 @@ class campo_E_3D(ThreeDScene):
         
         # Carga positiva (vermelha)
         charge_pos = Charge(magnitude=+3, color=RED).set_opacity(0)
-        circle_charge = Sphere(radius=0.4, color=RED, resolution=(30,30), stroke_width=0.01).set_opacity(0.9).set_fill_color(RED)
+        circle_charge = cached_mobject(lod_sphere, radius=0.4, color=RED, resolution=(30,30), stroke_width=0.01).set_opacity(0.9).set_fill_color(RED)
         circle = VGroup(center, circle_charge).set_z_index(+2)  # Frente de outros objetos
         
         # Carga negativa (azul)
         charge_neg = Charge(magnitude=-3, color=BLUE)
-        circle_charge_neg = Sphere(radius=0.4, color=BLUE, resolution=(30,30), stroke_width=0.01).set_opacity(0.9).set_fill_color(BLUE)
+        circle_charge_neg = cached_mobject(lod_sphere, radius=0.4, color=BLUE, resolution=(30,30), stroke_width=0.01).set_opacity(0.9).set_fill_color(BLUE)
         circle_neg = VGroup(circle_charge_neg).set_z_index(+2)
 
         # ============================================================
@@ -382,11 +285,11 @@ class campo_E_3D(ThreeDScene):
         self.play(FadeIn(sphere3, field_lines_2))
         self.wait(3)
         
-        self.play(FadeOut(field_line_2, sphere3))
+        self.play(FadeOut(field_lines_2[-1], sphere3))
         self.play(FadeIn(sphere1, field_lines_3))
         self.wait(3)
         
-        self.play(FadeOut(field_line_3, sphere1))
+        self.play(FadeOut(field_lines_3[-1], sphere1))
         self.play(FadeIn(sphere4, field_lines_4))
         self.wait(4)
         
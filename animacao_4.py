@@ -1,11 +1,31 @@
 # ANIMAÇÃO 4: Fluxo do campo elétrico gerado por uma partícula carregada em uma superfície gaussiana genérica
-from manim import *
-from manim_physics import *
+from manim import (
+    BLUE, Circumscribe, Create, DL, DOWN, DR, FadeIn, FadeOut, LEFT, LaggedStart,
+    ORIGIN, PI, Prism, RED, RIGHT, Scene, TAU, Tex, UL, UR, VGroup, WHITE,
+)
+from carregador import Charge  # Só o submódulo de eletrostática
 import numpy as np
+from superficies import GridSurface
+from lod import lod_resolution
+from campos import point_charge_field, dipole_field as dipole_kernel
+from campo_eletrico import CachedElectricField, BatchedStreamLines
+from fluxo import CurveFlux, polar_curve, polygon_curve, charges_flux_function
+from leitura import LiveReadout
+from carga_interna import RegionIndex, EnclosedChargeTracker
 import random 
 
 class carga_2D(Scene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "e": 1.6,               # Carga elementar (unidades arbitrárias)
+        "q_positive": 2,        # Magnitudes das cargas, em múltiplos de e
+        "q_negative": -2,
+        "q_negative_2": -2,
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ============================================================
         # 1. DEFINIÇÃO DAS SUPERFÍCIES GAUSSIANAS
         # ============================================================
@@ -20,22 +40,23 @@ class carga_2D(Scene):
             return np.sin(theta)**3 + np.cos(theta)**3
         
         # Criação de uma superfície fechada complexa em 3D (mas no plano z=0)
-        close_surface = Surface(
-            # Função paramétrica que define a superfície complexa
-            lambda u, v: np.array([
+        close_surface = GridSurface(
+            # Função paramétrica avaliada de uma só vez sobre toda a grade (u, v)
+            lambda u, v: [
                 r(u) * np.cos(u) * np.cos(v),  # Coordenada x
                 r(u) * np.sin(u) * np.cos(v),  # Coordenada y
                 0                              # Coordenada z (mantém no plano XY)
-            ]),
+            ],
             u_range=[0, TAU],      # Ângulo polar completo (0 a 2π)
             v_range=[0, PI / 2],   # Segundo parâmetro para criar volume/espessura
-            resolution=(30,30),    # Resolução da malha (alta para visualização suave)
+            resolution=lod_resolution((30,30), minimum=16),    # Resolução da malha (alta para visualização suave)
             fill_color=BLUE,       # Cor de preenchimento azul
             fill_opacity=0.2,      # Baixa opacidade para ver linhas de campo
             stroke_color=BLUE,     # Cor das linhas da grade
             stroke_width=0.01,     # Linhas muito finas
         )
         # Transformações visuais aplicadas à superfície
+        surface_center = close_surface.get_center()  # Centro de scale/rotate (usado no cálculo do fluxo)
         close_surface.scale(5)                     # Ampliação para preencher cena
         close_surface.rotate(-7*PI/4)              # Rotação inicial para melhor apresentação
         close_surface.set_z_index(-5)              # Coloca no fundo da cena
@@ -43,17 +64,28 @@ class carga_2D(Scene):
         # Criação de uma superfície retangular simples (prisma fino) como alternativa
         sq = Prism([4.5, 3.2, 0]).set_stroke(WHITE).set_opacity(0.2)
         sq.set_z_index(-5)  # Também posicionado no fundo
+
+        # Integradores de fluxo: cada contorno é discretizado uma única vez
+        # (a curva polar percorre o contorno uma vez com θ de 0 a π)
+        close_curve = polar_curve(r, scale=5, angle=-7*PI/4, about_point=surface_center)
+        sq_corners = [sq.get_corner(DL), sq.get_corner(DR), sq.get_corner(UR), sq.get_corner(UL)]
+        close_flux = CurveFlux(close_curve, t_range=(0, PI))
+        sq_flux = CurveFlux(polygon_curve(sq_corners), t_range=(0, 4))
+
+        # Índices das regiões gaussianas para classificar rapidamente as cargas
+        close_region = RegionIndex.from_curve(close_curve, t_range=(0, PI))
+        sq_region = RegionIndex(sq_corners)
         
         # ============================================================
         # 2. DEFINIÇÃO DAS CARGAS ELÉTRICAS
         # ============================================================
         
-        e = 1.6  # Valor da carga elementar (em unidades arbitrárias para visualização)
+        e = p["e"]  # Valor da carga elementar (em unidades arbitrárias para visualização)
         
         # Grupo para a carga positiva (+2e)
         carga_positiva = VGroup()        
         positive_charge = Charge(
-            magnitude=+2*e,  # Carga positiva com magnitude 2 vezes a carga elementar
+            magnitude=p["q_positive"]*e,  # Carga positiva (padrão: 2 vezes a carga elementar)
             color=RED        # Vermelho convencional para cargas positivas
         )
         # Rótulo "+" sobre a carga para identificação visual
@@ -64,7 +96,7 @@ class carga_2D(Scene):
         # Grupo para a primeira carga negativa (-2e)
         carga_negativa = VGroup()  
         negative_charge = Charge(
-            magnitude=-2*e,  # Carga negativa com magnitude -2e
+            magnitude=p["q_negative"]*e,  # Carga negativa (padrão: -2e)
             color=BLUE       # Azul convencional para cargas negativas
         )
         charge_label_neg = Tex("-", color=WHITE, font_size=24).next_to(negative_charge, ORIGIN)
@@ -74,7 +106,7 @@ class carga_2D(Scene):
         # Grupo para a segunda carga negativa (-2e) com posição inicial diferente
         carga_negativa_2 = VGroup()        
         negative_charge_2 = Charge(
-            magnitude=-2*e,     # Mesma magnitude que a primeira carga negativa
+            magnitude=p["q_negative_2"]*e,  # Padrão: mesma magnitude que a primeira carga negativa
             point=RIGHT*1.7,    # Posição inicial à direita da origem
             color=BLUE
         )
@@ -90,19 +122,36 @@ class carga_2D(Scene):
         # ============================================================
         
         # Campo elétrico da primeira carga negativa individual
-        field_neg = always_redraw(lambda: ElectricField(negative_charge))
-        # Atualiza automaticamente se a carga se mover
+        field_neg = CachedElectricField(negative_charge)
+        # Atualiza automaticamente se a carga se mover (e só nesse caso é recalculado)
         
         # Campo elétrico do sistema triplo (três cargas)
-        field_neg_2 = always_redraw(lambda: ElectricField(positive_charge, negative_charge, negative_charge_2))
+        field_neg_2 = CachedElectricField(positive_charge, negative_charge, negative_charge_2)
         # Mostra o campo resultante da superposição de três cargas
     
         # Campo elétrico da carga positiva individual
-        field_pos = always_redraw(lambda: ElectricField(positive_charge))
+        field_pos = CachedElectricField(positive_charge)
        
         # Campo elétrico do dipolo (duas cargas de magnitudes iguais e opostas)
-        field_di = always_redraw(lambda: ElectricField(positive_charge, negative_charge))
+        field_di = CachedElectricField(positive_charge, negative_charge)
         # Representa o campo de um dipolo elétrico
+
+        # Leituras ao vivo do fluxo da carga negativa por cada superfície
+        # (lei de Gauss no plano: Φ = 2π·Q_int, qualquer que seja a forma)
+        flux_close = LiveReadout(
+            r"\Phi_{2D} = ", charges_flux_function(close_flux, [negative_charge]), font_size=36
+        ).to_corner(UL)
+        flux_sq = LiveReadout(
+            r"\Phi_{2D} = ", charges_flux_function(sq_flux, [negative_charge]), font_size=36
+        ).to_corner(UL)
+
+        # Carga interna (Q_int) de cada superfície, exposta como tracker
+        q_enc_close = EnclosedChargeTracker(close_region, [negative_charge])
+        q_enc_sq = EnclosedChargeTracker(sq_region, [negative_charge])
+        q_close = LiveReadout(r"Q_{int} = ", q_enc_close, font_size=36)
+        q_close.next_to(flux_close, DOWN, aligned_edge=LEFT)
+        q_sq = LiveReadout(r"Q_{int} = ", q_enc_sq, font_size=36)
+        q_sq.next_to(flux_sq, DOWN, aligned_edge=LEFT)
     
         # ============================================================
         # 4. FUNÇÕES PERSONALIZADAS PARA CÁLCULO DE CAMPOS VETORIAIS
@@ -116,15 +165,12 @@ class carga_2D(Scene):
             Física: Lei de Coulomb - E ∝ 1/r² na direção radial.
             
             Parâmetros:
-            p: ponto no espaço (array numpy [x, y, z])
+            p: ponto no espaço (array numpy [x, y, z]) ou pontos (N, 3)
             
             Retorna:
             Vetor campo elétrico no ponto p
             """
-            r = np.linalg.norm(p)  # Distância do ponto à origem
-            if r < 0.1:            # Evita divisão por zero próximo à origem
-                return np.zeros(3)
-            return p / (r**3)      # Campo proporcional a 1/r² na direção radial
+            return point_charge_field(p, ORIGIN, 1.0, cutoff=0.1)  # Lei de Coulomb: E ∝ 1/r², em lote
         
         # Função para campo elétrico de um dipolo
         def dipole_field(p):
@@ -133,37 +179,20 @@ class carga_2D(Scene):
             Um dipolo consiste em duas cargas iguais e opostas separadas por uma distância.
             
             Parâmetros:
-            p: ponto onde calcular o campo
+            p: ponto (ou pontos (N, 3)) onde calcular o campo
             
             Retorna:
             Soma vetorial dos campos individuais das duas cargas
             """
-            # Campo da carga positiva
-            r_pos = p - carga_positiva.get_center()  # Vetor da carga positiva ao ponto
-            dist_pos = np.linalg.norm(r_pos)         # Distância até a carga positiva
-            if dist_pos < 0.1:                       # Evita singularidade
-                field_pos = np.zeros(3)
-            else:
-                field_pos = r_pos / (dist_pos**3)    # Campo aponta para fora da carga positiva
-            
-            # Campo da carga negativa
-            r_neg = p - carga_negativa.get_center()  # Vetor da carga negativa ao ponto
-            dist_neg = np.linalg.norm(r_neg)         # Distância até a carga negativa
-            if dist_neg < 0.1:                       # Evita singularidade
-                field_neg = np.zeros(3)
-            else:
-                # Sinal negativo inverte a direção (campo aponta para a carga negativa)
-                field_neg = -r_neg / (dist_neg**3)
-            
-            # Campo total: superposição dos campos individuais
-            return field_pos + field_neg
+            # Superposição das duas cargas, calculada para todos os pontos de uma vez
+            return dipole_kernel(p, carga_positiva.get_center(), carga_negativa.get_center())
         
         # ============================================================
         # 5. LINHAS DE FLUXO PARA VISUALIZAÇÃO ALTERNATIVA
         # ============================================================
         
         # Linhas de fluxo para o campo dipolar
-        stream_lines_dipole = StreamLines(
+        stream_lines_dipole = BatchedStreamLines(
             dipole_field,           # Função do campo a ser visualizado
             stroke_width=0.8,       # Espessura das linhas de fluxo
             n_repeats=5,            # Número de linhas a serem geradas
@@ -174,7 +203,7 @@ class carga_2D(Scene):
         # Nota: Estas stream lines são definidas mas não usadas na animação principal
         
         # Linhas de fluxo para campo radial
-        stream_lines_radial = StreamLines(
+        stream_lines_radial = BatchedStreamLines(
             radial_field,
             stroke_width=1.5,
             n_repeats=2,
@@ -210,16 +239,17 @@ class carga_2D(Scene):
             FadeIn(carga_negativa, field_neg), # Aparecimento simultâneo da carga negativa e seu campo
             lag_ratio=0.1                      # Atraso um pouco maior entre os efeitos
         ))        
+        self.play(FadeIn(flux_close, q_close))  # Fluxo da carga negativa pela superfície complexa
         self.wait()  # Pausa para observação da nova configuração
         
         # E. Transição entre superfícies gaussianas (complexa → retangular)
         self.play(LaggedStart(
-            FadeOut(close_surface),  # Remoção da superfície complexa
+            FadeOut(close_surface, flux_close, q_close),  # Remoção da superfície complexa
             lag_ratio=0.1
         ), run_time=2)  # Duração mais longa para transição suave
         
         # F. Introdução da superfície retangular simples
-        self.play(FadeIn(sq), run_time=2)
+        self.play(FadeIn(sq, flux_sq, q_sq), run_time=2)  # Com a leitura do fluxo pelo retângulo
         self.wait()  # Pausa para observação da nova superfície
         
         # G. Move a carga negativa para dentro da superfície retangular
@@ -1,11 +1,31 @@
 # ANIMAÇÃO 5: Fluxo do campo elétrico gerado por um dipolo elétrico em uma superfície gaussiana genérica
-from manim import *
-from manim_physics import *
+from manim import (
+    BLUE, Circumscribe, FadeIn, FadeOut, LEFT, LaggedStart, ORIGIN, PI, Prism, RED,
+    RIGHT, Scene, TAU, Tex, VGroup, WHITE,
+)
+from carregador import Charge  # Só o submódulo de eletrostática
 import numpy as np
+from superficies import GridSurface
+from lod import lod_resolution
+from campos import point_charge_field, dipole_field as dipole_kernel
+from campo_eletrico import CachedElectricField, BatchedStreamLines
 import random 
 
 class dipolo_2D(Scene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "e": 1.6,                           # Carga elementar (unidades arbitrárias)
+        "q_positive": 2,                    # Magnitudes das cargas, em múltiplos de e
+        "q_negative": -2,
+        "q_negative_2": -3.5,
+        "dipole_offset": 1.7,               # Distância de cada carga do dipolo à origem
+        "negative_2_start": (1.7, 0),       # Posição inicial (x, y) da terceira carga
+        "negative_2_shift": (1.8, 1.8),     # Deslocamento (x, y) da terceira carga
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ============================================================
         # 1. DEFINIÇÃO DAS SUPERFÍCIES GAUSSIANAS
         # ============================================================
@@ -20,15 +40,16 @@ class dipolo_2D(Scene):
             return np.sin(theta)**3 + np.cos(theta)**3
         
         # Criação de superfície fechada complexa (não usada diretamente na animação)
-        close_surface = Surface(
-            lambda u, v: np.array([
+        close_surface = GridSurface(
+            # Função paramétrica avaliada de uma só vez sobre toda a grade (u, v)
+            lambda u, v: [
                 r(u) * np.cos(u) * np.cos(v),  # Coordenada x
                 r(u) * np.sin(u) * np.cos(v),  # Coordenada y
                 0                              # Coordenada z (plano XY)
-            ]),
+            ],
             u_range=[0, TAU],      # Ângulo polar completo (0 a 2π)
             v_range=[0, PI / 2],   # Parâmetro para criar espessura
-            resolution=(30,30),    # Alta resolução para visualização suave
+            resolution=lod_resolution((30,30), minimum=16),    # Alta resolução para visualização suave
             fill_color=BLUE,       # Cor de preenchimento
             fill_opacity=0.25,     # Transparência para ver linhas de campo
             stroke_color=BLUE,     # Cor das linhas da grade
@@ -47,12 +68,12 @@ class dipolo_2D(Scene):
         # 2. DEFINIÇÃO DAS CARGAS ELÉTRICAS
         # ============================================================
         
-        e = 1.6  # Valor da carga elementar (unidades arbitrárias)
+        e = p["e"]  # Valor da carga elementar (unidades arbitrárias)
         
         # Grupo para a carga positiva (+2e)
         carga_positiva = VGroup()        
         positive_charge = Charge(
-            magnitude=+2*e,  # Carga positiva com magnitude 2e
+            magnitude=p["q_positive"]*e,  # Carga positiva (padrão: 2e)
             color=RED        # Vermelho para cargas positivas
         )
         # Rótulo "+" sobre a carga
@@ -63,7 +84,7 @@ class dipolo_2D(Scene):
         # Grupo para a primeira carga negativa (-2e)
         carga_negativa = VGroup()  
         negative_charge = Charge(
-            magnitude=-2*e,  # Carga negativa com magnitude -2e
+            magnitude=p["q_negative"]*e,  # Carga negativa (padrão: -2e)
             color=BLUE       # Azul para cargas negativas
         )
         charge_label_neg = Tex("-", color=WHITE, font_size=24).next_to(negative_charge, ORIGIN)
@@ -73,8 +94,8 @@ class dipolo_2D(Scene):
         # Grupo para a segunda carga negativa (-3.5e) - magnitude diferente
         carga_negativa_2 = VGroup()        
         negative_charge_2 = Charge(
-            magnitude=-3.5*e,    # Carga negativa com magnitude maior
-            point=RIGHT*1.7,     # Posição inicial à direita
+            magnitude=p["q_negative_2"]*e,                # Carga negativa (padrão: magnitude maior)
+            point=np.array([*p["negative_2_start"], 0]),  # Posição inicial (padrão: à direita)
             color=BLUE
         )
         charge_label_neg_2 = Tex("-", color=WHITE, font_size=24).next_to(negative_charge_2, ORIGIN)
@@ -89,19 +110,19 @@ class dipolo_2D(Scene):
         # ============================================================
         
         # Campo da primeira carga negativa individual
-        field_neg = always_redraw(lambda: ElectricField(negative_charge))
+        field_neg = CachedElectricField(negative_charge)
         
         # Campo da segunda carga negativa individual
-        field_neg_2 = always_redraw(lambda: ElectricField(negative_charge_2))
+        field_neg_2 = CachedElectricField(negative_charge_2)
 
         # Campo da carga positiva individual
-        field_pos = always_redraw(lambda: ElectricField(positive_charge))
+        field_pos = CachedElectricField(positive_charge)
        
         # Campo do dipolo (entre as duas cargas)
-        field_di = always_redraw(lambda: ElectricField(positive_charge, negative_charge))
+        field_di = CachedElectricField(positive_charge, negative_charge)
         
         # Campo do sistema triplo (três cargas)
-        field_tri = always_redraw(lambda: ElectricField(positive_charge, negative_charge, negative_charge_2))
+        field_tri = CachedElectricField(positive_charge, negative_charge, negative_charge_2)
     
         # ============================================================
         # 4. FUNÇÕES PERSONALIZADAS PARA CÁLCULO DE CAMPOS
@@ -114,15 +135,12 @@ class dipolo_2D(Scene):
             Segue a lei de Coulomb: E ∝ 1/r² na direção radial.
             
             Parâmetros:
-            p: ponto no espaço (array 3D)
+            p: ponto no espaço (array 3D) ou pontos (N, 3)
             
             Retorna:
             Vetor campo elétrico no ponto p
             """
-            r = np.linalg.norm(p)  # Distância do ponto à origem
-            if r < 0.1:            # Evita divisão por zero próximo à origem
-                return np.zeros(3)
-            return p / (r**3)      # Lei de Coulomb: E ∝ 1/r²
+            return point_charge_field(p, ORIGIN, 1.0, cutoff=0.1)  # Lei de Coulomb: E ∝ 1/r², em lote
         
         # Função para campo elétrico de um dipolo
         def dipole_field(p):
@@ -130,32 +148,15 @@ class dipolo_2D(Scene):
             Calcula campo elétrico total de um dipolo usando superposição.
             Mostra como campos de múltiplas cargas se combinam.
             """
-            # Campo da carga positiva
-            r_pos = p - carga_positiva.get_center()
-            dist_pos = np.linalg.norm(r_pos)
-            if dist_pos < 0.1:
-                field_pos = np.zeros(3)
-            else:
-                field_pos = r_pos / (dist_pos**3)  # Campo que aponta para fora
-            
-            # Campo da carga negativa
-            r_neg = p - carga_negativa.get_center()
-            dist_neg = np.linalg.norm(r_neg)
-            if dist_neg < 0.1:
-                field_neg = np.zeros(3)
-            else:
-                # Sinal negativo inverte direção (campo aponta para dentro)
-                field_neg = -r_neg / (dist_neg**3)
-            
-            # Campo total (soma vetorial dos campos individuais)
-            return field_pos + field_neg
+            # Superposição das duas cargas, calculada para todos os pontos de uma vez
+            return dipole_kernel(p, carga_positiva.get_center(), carga_negativa.get_center())
         
         # ============================================================
         # 5. LINHAS DE FLUXO PARA VISUALIZAÇÃO ALTERNATIVA
         # ============================================================
         
         # Linhas de fluxo para o campo do dipolo
-        stream_lines_dipole = StreamLines(
+        stream_lines_dipole = BatchedStreamLines(
             dipole_field,           # Função do campo
             stroke_width=0.8,       # Espessura das linhas
             n_repeats=5,            # Número de linhas
@@ -165,7 +166,7 @@ class dipolo_2D(Scene):
         )
         
         # Linhas de fluxo para campo radial
-        stream_lines_radial = StreamLines(
+        stream_lines_radial = BatchedStreamLines(
             radial_field,
             stroke_width=1.5,
             n_repeats=2,
@@ -185,7 +186,7 @@ class dipolo_2D(Scene):
         # B. Animação da primeira carga negativa (move para posição)
         self.play(LaggedStart(
             FadeIn(carga_negativa),
-            carga_negativa.animate.shift(RIGHT*1.7),  # Move para direita
+            carga_negativa.animate.shift(RIGHT*p["dipole_offset"]),  # Move para direita
             lag_ratio=0.3  # Pequeno atraso entre os dois efeitos
         ))
         self.wait()    
@@ -193,7 +194,7 @@ class dipolo_2D(Scene):
         # C. Animação da carga positiva (move para posição oposta)
         self.play(LaggedStart(
             FadeIn(carga_positiva),
-            carga_positiva.animate.shift(LEFT*1.7),  # Move para esquerda
+            carga_positiva.animate.shift(LEFT*p["dipole_offset"]),  # Move para esquerda
             lag_ratio=0.3
         ))
         self.wait(2)
@@ -210,7 +211,7 @@ class dipolo_2D(Scene):
         self.play(LaggedStart(
             FadeOut(field_di),                    # Remove campo do dipolo
             FadeIn(carga_negativa_2),             # Adiciona terceira carga
-            carga_negativa_2.animate.shift(UR*1.8),  # Move para canto superior direito
+            carga_negativa_2.animate.shift(np.array([*p["negative_2_shift"], 0])),  # Padrão: canto superior direito
             lag_ratio=0.5
         ))
         self.wait(2)
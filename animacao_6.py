@@ -1,11 +1,29 @@
 # ANIMAÇÃO 6: 	Discussão sobre ângulo sólido
-from manim import *
+from manim import (
+    Arc, Arrow3D, BLUE, BLUE_B, Circle, Create, DEGREES, DOWN, Dot, FadeIn, FadeOut,
+    GREEN, LEFT, LaggedStart, Line, MathTex, ORIGIN, PI, RED, RED_B, RIGHT, Transform, UP, UR,
+    VGroup, WHITE, YELLOW,
+)
 import numpy as np
+from hud import HudScene
+from superficies import GridSurface, spherical_patch
+from lod import lod_sphere
+from angulos_solidos import SolidAngle
+from leitura import LiveReadout
 from math import degrees
 import math
 
-class angulo_solido(ThreeDScene):
+class angulo_solido(HudScene):
+    # Parâmetros da cena (variações em variantes.py)
+    parameters = {
+        "radii": (2.0, 3.0),            # Raios r1, r2 das esferas concêntricas
+        "theta_range": (PI/6, PI/3),    # Ângulo polar do patch: 30° a 60°
+        "phi_range": (PI/4, PI/2),      # Ângulo azimutal do patch: 45° a 90°
+    }
+
     def construct(self):
+        p = self.parameters
+
         # ================== ÂNGULO PLANO 2D ==================
         # Configura a câmera para visão de cima (plano XY)
         self.set_camera_orientation(phi=0, theta=-90*DEGREES)
@@ -46,28 +64,24 @@ class angulo_solido(ThreeDScene):
         # Função para criar um patch esférico retangular
         def create_spherical_patch(r, theta_range, phi_range):
             """Cria um retalho esférico retangular com vértices radiais"""
-            return Surface(
-                lambda u, v: r * np.array([
-                    np.sin(v) * np.cos(u),  # x
-                    np.sin(v) * np.sin(u),  # y
-                    np.cos(v)               # z
-                ]),
-                u_range=phi_range,    # Intervalo do ângulo azimutal
-                v_range=theta_range,  # Intervalo do ângulo polar
-                resolution=(5, 5),    # Resolução baixa para ver os quadrados
+            return spherical_patch(
+                r,
+                theta_range=theta_range,  # Intervalo do ângulo polar
+                phi_range=phi_range,      # Intervalo do ângulo azimutal
+                resolution=(5, 5),        # Resolução baixa para ver os quadrados
                 color=GREEN
             ).set_opacity(0.4).set_color('#00FFFF')  # Cor ciano
 
         # Define dois raios para esferas concêntricas
-        r1, r2 = 2.0, 3.0
+        r1, r2 = p["radii"]
         
         # Cria duas esferas concêntricas com diferentes raios e opacidades
-        sphere1 = Sphere(radius=r1, resolution=(20,20)).set_opacity(0.3)
-        sphere2 = Sphere(radius=r2, resolution=(20,20)).set_opacity(0.2)
+        sphere1 = lod_sphere(radius=r1, resolution=(20,20)).set_opacity(0.3)
+        sphere2 = lod_sphere(radius=r2, resolution=(20,20)).set_opacity(0.2)
         
         # Dimensões angulares para os patches (mesmo para ambas as esferas)
-        theta_min, theta_max = PI/6, PI/3   # Ângulo polar: 30° a 60°
-        phi_min, phi_max = PI/4, PI/2       # Ângulo azimutal: 45° a 90°
+        theta_min, theta_max = p["theta_range"]   # Ângulo polar
+        phi_min, phi_max = p["phi_range"]         # Ângulo azimutal
         
         # Cria patches (retalhos) nas duas esferas
         patch1 = create_spherical_patch(r1, [theta_min, theta_max], [phi_min, phi_max])
@@ -129,15 +143,23 @@ class angulo_solido(ThreeDScene):
             font_size=36
         ).to_edge(UR)
         
-        # Atualizador para manter a equação fixa no quadro durante movimentos da câmera
-        equation.add_updater(lambda v: self.add_fixed_in_frame_mobjects(v))
-        
         # Símbolo do ângulo sólido próximo ao centro
         omega_angle = MathTex(r"\Omega").next_to(center)
-        
-        # Adiciona ambos à cena como objetos fixos no quadro
-        self.add_fixed_in_frame_mobjects(equation)
-        self.add_fixed_in_frame_mobjects(omega_angle)
+
+        # Leituras ao vivo de Ω de cada retalho, visto do centro (todos os
+        # triângulos das malhas avaliados em lote a cada quadro)
+        solid_angle_1 = SolidAngle(patch1, observer=center)
+        solid_angle_2 = SolidAngle(patch2, observer=center)
+        omega_readouts = VGroup(
+            LiveReadout(r"\Omega_1 = ", solid_angle_1.get_value, num_decimal_places=3, font_size=30),
+            LiveReadout(r"\Omega_2 = ", solid_angle_2.get_value, num_decimal_places=3, font_size=30),
+        ).arrange(DOWN, aligned_edge=LEFT).next_to(equation, DOWN, aligned_edge=RIGHT)
+        
+        # Adiciona ambos à cena como objetos fixos no quadro (camada HUD em cache,
+        # mantida fixa durante os movimentos da câmera)
+        self.add_hud(equation)
+        self.add_hud(omega_angle)
+        self.add_hud(omega_readouts)
         
         # Ajusta a câmera para focar na segunda esfera
         self.move_camera(zoom=0.7, focal_point=sphere2.get_center(), run_time=3)
@@ -149,7 +171,27 @@ class angulo_solido(ThreeDScene):
         # ================== TRANSFORMAÇÕES VISUAIS ==================
         # Remove as esferas e o círculo, depois os traz de volta
         self.play(FadeOut(sphere2, sphere1, circle))
-        self.wait(7)
+
+        # Retalho externo deformado (não esférico) sobre o mesmo cone: a borda
+        # não muda, e a leitura de Ω₂ (recalculada a cada quadro a partir dos
+        # triângulos deformados) continua igual - Ω só depende do cone
+        def bulge_radius(phi, theta):
+            """Raio com uma saliência que se anula na borda do retalho"""
+            return r2 * (1 + 0.3
+                         * np.sin(PI * (phi - phi_min) / (phi_max - phi_min))
+                         * np.sin(PI * (theta - theta_min) / (theta_max - theta_min)))
+
+        deformed_patch2 = GridSurface(
+            lambda u, v: bulge_radius(u, v) * np.array([np.sin(v) * np.cos(u), np.sin(v) * np.sin(u), np.cos(v)]),
+            u_range=[phi_min, phi_max],
+            v_range=[theta_min, theta_max],
+            resolution=(5, 5),
+            color=GREEN,
+        ).set_opacity(0.4).set_color('#00FFFF')
+        spherical_patch2 = patch2.copy()
+        self.play(Transform(patch2, deformed_patch2), run_time=3)
+        self.wait()
+        self.play(Transform(patch2, spherical_patch2), run_time=3)
         self.stop_ambient_camera_rotation()
         self.wait()
         self.play(FadeIn(sphere1, sphere2, circle))
@@ -169,11 +211,6 @@ class angulo_solido(ThreeDScene):
             end=patch_center1 + radial_normal1,
             color=WHITE
         )
-        normal_vector_label_1 = MathTex(
-            r"\hat{\mathbf{n}}", 
-            font_size=10
-        ).next_to(normal_vector_1)
-        normal_vector_label_1.add_updater(lambda v: self.add_fixed_in_frame_mobjects(v))
         
         # Cria o vetor normal para o patch externo (com z-index alto)
         normal_vector_2 = Arrow3D(
@@ -181,19 +218,14 @@ class angulo_solido(ThreeDScene):
             end=patch_center2 + radial_normal2,
             color=WHITE
         ).set_z_index(+5)
-        normal_vector_label_2 = MathTex(
-            r"\hat{\mathbf{n}}", 
-            font_size=10
-        ).next_to(normal_vector_2)
-        normal_vector_label_2.add_updater(lambda v: self.add_fixed_in_frame_mobjects(v))
         
         # ================== ANIMAÇÃO DOS VETORES NORMAIS ==================
         # Muda a cor da primeira esfera para vermelho
         self.play(sphere1.animate.set_stroke(color=RED, width=0.5))
         self.wait(2)
         
-        # Remove o patch externo e suas linhas
-        self.play(FadeOut(patch2, lines2))
+        # Remove o patch externo, suas linhas e a leitura de Ω₂
+        self.play(FadeOut(patch2, lines2, omega_readouts[1]))
         self.wait(5)
         
         # Mostra o vetor normal interno
@@ -204,8 +236,8 @@ class angulo_solido(ThreeDScene):
         self.remove(normal_vector_1)
         self.wait(2)
         
-        # Traz de volta o patch externo, linhas e mostra o vetor normal externo
-        self.play(FadeIn(patch2, lines2, normal_vector_2))
+        # Traz de volta o patch externo, linhas, a leitura de Ω₂ e mostra o vetor normal externo
+        self.play(FadeIn(patch2, lines2, omega_readouts[1], normal_vector_2))
         self.wait(5)
         
         # Zoom no vetor normal externo
@@ -0,0 +1,342 @@
+# UTILITÁRIO: Benchmarks sem interface das seis cenas e dos caminhos críticos
+#
+# Uso:
+#   python benchmark.py                           # cenas + micro, grava benchmark.json
+#   python benchmark.py --micro-only              # só os micro-benchmarks
+#   python benchmark.py --save-baseline           # grava a referência
+#   python benchmark.py --baseline benchmark_baseline.json --threshold 0.15
+#
+# Para cada cena (em um processo novo, qualidade e taxa de quadros fixas, sem
+# gravar vídeo) são medidos: tempo do construct fora das animações (montagem
+# dos objetos), tempo total da renderização, tempo por quadro de cada
+# animação, tempo gasto nos updaters e pico de memória (RSS). Os resultados vão
+# para um JSON e podem ser comparados com uma referência: métricas acima de
+# referência × (1 + threshold) são regressões (código de saída 1).
+import argparse
+import json
+import multiprocessing
+import os
+import platform
+import statistics
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from render_lote import QUALITIES, REPO_DIR, discover_scenes, load_scene_class
+
+
+# Arquivo padrão da referência
+BASELINE_FILE = os.path.join(REPO_DIR, "benchmark_baseline.json")
+
+# Métricas comparadas com a referência (menor é melhor)
+SCENE_METRICS = ("construct_time", "render_time", "mean_frame_time", "updater_time", "peak_rss_mb")
+MICRO_METRICS = ("median",)
+
+
+# ============================================================
+# 1. MICRO-BENCHMARKS DOS CAMINHOS CRÍTICOS
+# ============================================================
+
+def _micro_cases():
+    """
+    Casos dos micro-benchmarks: nome -> função sem argumentos.
+    A preparação (grades, cargas) fica fora da medição.
+    """
+    import numpy as np
+    from manim import PI, RED, ORIGIN, RIGHT, LEFT
+    from campos import point_charge_field, dipole_field, SuperpositionGrid
+    from glifos import FieldGlyphs, grid_points
+    from superficies import spherical_patch
+
+    rng = np.random.default_rng(0)
+    points = rng.uniform(-7, 7, size=(10_000, 3))
+    single_points = points[:1_000]
+    positive, negative = LEFT * 1.7, RIGHT * 1.7
+
+    grid = SuperpositionGrid(points, zero_if_any_close=True)
+    positions = np.array([positive, negative, RIGHT * 1.7 + [1.8, 1.8, 0]])
+    magnitudes = np.array([3.2, -3.2, -5.6])
+    grid.update(positions, magnitudes)
+    moved = positions.copy()
+
+    def superposition_update():
+        moved[2, 0] += 1e-3  # Uma carga se move, as outras ficam paradas
+        grid.update(moved, magnitudes)
+
+    # Mesma grade de vetores de open_flux (antigo create_vector em laço triplo)
+    x_range = np.arange(-2.0, 2.0, 1.5)
+    y_range = np.arange(-2.5, 1.25, 1.5)
+    z_range = np.arange(-1.5, 1.5, 0.75)
+
+    return {
+        "radial_field_batched_10k": lambda: point_charge_field(points, ORIGIN, 1.0),
+        "radial_field_pointwise_1k": lambda: [point_charge_field(p, ORIGIN, 1.0) for p in single_points],
+        "dipole_field_batched_10k": lambda: dipole_field(points, positive, negative),
+        "dipole_field_pointwise_1k": lambda: [dipole_field(p, positive, negative) for p in single_points],
+        "superposition_move_one_of_3_10k": superposition_update,
+        "create_vector_grid": lambda: FieldGlyphs(
+            starts=grid_points(x_range, y_range, z_range),
+            directions=np.array([2.0, 0.0, 0.0]) / 2,
+            color=RED,
+            thickness=0.01,
+            resolution=8,
+        ),
+        "create_spherical_patch": lambda: spherical_patch(
+            2.0, theta_range=[PI / 6, PI / 3], phi_range=[PI / 4, PI / 2], resolution=(5, 5)
+        ),
+    }
+
+
+def time_callable(function, repeat=7, min_time=0.05):
+    """
+    Mede uma função: cada repetição executa a função tantas vezes quanto
+    necessário para durar ao menos min_time.
+
+    Retorna:
+    Dicionário com "median", "min" (segundos por chamada) e "calls"
+    """
+    function()  # Aquecimento (caches, importações)
+    number = 1
+    while True:
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        elapsed = time.perf_counter() - start
+        if elapsed >= min_time:
+            break
+        number *= 2
+    samples = [elapsed / number]
+    for _ in range(repeat - 1):
+        start = time.perf_counter()
+        for _ in range(number):
+            function()
+        samples.append((time.perf_counter() - start) / number)
+    return {"median": statistics.median(samples), "min": min(samples), "calls": number}
+
+
+def run_micro_benchmarks(names=None):
+    """Executa os micro-benchmarks (todos ou os nomes dados)."""
+    results = {}
+    for name, function in _micro_cases().items():
+        if names and name not in names:
+            continue
+        results[name] = time_callable(function)
+        print(f"  {name:<36} {results[name]['median'] * 1e3:10.3f} ms", flush=True)
+    return results
+
+
+# ============================================================
+# 2. BENCHMARK DE UMA CENA (EM PROCESSO PRÓPRIO)
+# ============================================================
+
+def benchmark_scene(job):
+    """
+    Renderiza a cena sem gravar vídeo e mede tempos e memória.
+
+    Parâmetros:
+    job: "name", "module", "quality", "frame_rate" e, opcionalmente,
+         "max_animations" (renderiza só as primeiras animações)
+
+    Retorna:
+    Dicionário de métricas (ou "error")
+    """
+    import resource
+    from manim import config, tempconfig
+    from render_segmentos import enable_exact_skipping
+
+    options = {
+        "quality": QUALITIES[job["quality"]],
+        "frame_rate": job["frame_rate"],
+        "progress_bar": "none",
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+    }
+    try:
+        with tempconfig(options):
+            start = time.perf_counter()
+            scene = load_scene_class(job["module"], job["name"])()
+            setup_time = time.perf_counter() - start
+            enable_exact_skipping(scene, job.get("max_animations"))
+            renderer = scene.renderer
+
+            # Tempo por animação
+            plays = []
+            original_play = renderer.play
+
+            def play(scene_, *args, **kwargs):
+                play_start = time.perf_counter()
+                time_start = renderer.time
+                original_play(scene_, *args, **kwargs)
+                seconds = time.perf_counter() - play_start
+                frames = int(round((renderer.time - time_start) * config["frame_rate"]))
+                plays.append({
+                    "index": len(plays),
+                    "seconds": seconds,
+                    "frames": frames,
+                    "frame_time": seconds / max(frames, 1),
+                })
+
+            renderer.play = play
+
+            # Tempo nos updaters (mobjects e cena)
+            updater_time = [0.0]
+
+            def timed(method):
+                def wrapper(*args, **kwargs):
+                    method_start = time.perf_counter()
+                    try:
+                        return method(*args, **kwargs)
+                    finally:
+                        updater_time[0] += time.perf_counter() - method_start
+                return wrapper
+
+            scene.update_mobjects = timed(scene.update_mobjects)
+            scene.update_self = timed(scene.update_self)
+
+            start = time.perf_counter()
+            scene.render()
+            render_time = time.perf_counter() - start
+
+        frames = sum(p["frames"] for p in plays)
+        play_time = sum(p["seconds"] for p in plays)
+        return {
+            "setup_time": setup_time,
+            "construct_time": render_time - play_time,  # Só o código entre as animações
+            "render_time": render_time,
+            "play_time": play_time,
+            "frames": frames,
+            "mean_frame_time": play_time / max(frames, 1),
+            "updater_time": updater_time[0],
+            "peak_rss_mb": resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024,
+            "plays": plays,
+        }
+    except Exception:
+        return {"error": traceback.format_exc()}
+
+
+def run_scene_benchmarks(scenes, quality="l", frame_rate=15, max_animations=None):
+    """Executa cada cena em um processo novo (pico de memória isolado)."""
+    context = multiprocessing.get_context("spawn")
+    results = {}
+    for scene in scenes:
+        job = {
+            "name": scene["name"],
+            "module": scene["module"],
+            "quality": quality,
+            "frame_rate": frame_rate,
+            "max_animations": max_animations,
+        }
+        with ProcessPoolExecutor(max_workers=1, mp_context=context) as pool:
+            results[scene["name"]] = pool.submit(benchmark_scene, job).result()
+        result = results[scene["name"]]
+        if "error" in result:
+            print(f"  {scene['name']:<16} FALHOU\n{result['error']}", flush=True)
+        else:
+            print(
+                f"  {scene['name']:<16} construct {result['construct_time']:7.2f} s  "
+                f"total {result['render_time']:8.2f} s  "
+                f"{result['mean_frame_time'] * 1e3:8.2f} ms/quadro  "
+                f"updaters {result['updater_time']:7.2f} s  {result['peak_rss_mb']:7.1f} MB",
+                flush=True,
+            )
+    return results
+
+
+# ============================================================
+# 3. COMPARAÇÃO COM A REFERÊNCIA
+# ============================================================
+
+def compare(results, baseline, threshold=0.10):
+    """
+    Compara resultados com a referência.
+
+    Retorna:
+    Lista de regressões (dicionários com "benchmark", "metric", "baseline",
+    "current" e "ratio")
+    """
+    regressions = []
+    groups = (("scenes", SCENE_METRICS), ("micro", MICRO_METRICS))
+    for group, metrics in groups:
+        for name, current in results.get(group, {}).items():
+            reference = baseline.get(group, {}).get(name)
+            if not reference or "error" in current or "error" in reference:
+                continue
+            for metric in metrics:
+                if metric not in current or not reference.get(metric):
+                    continue
+                ratio = current[metric] / reference[metric]
+                if ratio > 1 + threshold:
+                    regressions.append({
+                        "benchmark": f"{group}/{name}",
+                        "metric": metric,
+                        "baseline": reference[metric],
+                        "current": current[metric],
+                        "ratio": ratio,
+                    })
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks das cenas e dos caminhos críticos.")
+    parser.add_argument("scenes", nargs="*", help="cenas a medir (padrão: todas)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade fixa")
+    parser.add_argument("--frame-rate", type=int, default=15, help="taxa de quadros fixa")
+    parser.add_argument("--max-animations", type=int, default=None, help="mede só as primeiras N animações")
+    parser.add_argument("--micro-only", action="store_true", help="apenas micro-benchmarks")
+    parser.add_argument("--scenes-only", action="store_true", help="apenas as cenas")
+    parser.add_argument("-o", "--output", default="benchmark.json", help="arquivo JSON de saída")
+    parser.add_argument("--baseline", default=BASELINE_FILE, help="referência para comparação")
+    parser.add_argument("--save-baseline", action="store_true", help="grava os resultados como referência")
+    parser.add_argument("--threshold", type=float, default=0.10, help="tolerância relativa (0.10 = 10%%)")
+    args = parser.parse_args(argv)
+
+    results = {
+        "meta": {
+            "python": platform.python_version(),
+            "machine": platform.machine(),
+            "quality": args.quality,
+            "frame_rate": args.frame_rate,
+            "max_animations": args.max_animations,
+            "date": time.strftime("%Y-%m-%d %H:%M:%S"),
+        },
+    }
+    if not args.scenes_only:
+        print("Micro-benchmarks:")
+        results["micro"] = run_micro_benchmarks()
+    if not args.micro_only:
+        scenes = discover_scenes()
+        if args.scenes:
+            scenes = [scene for scene in scenes if scene["name"] in args.scenes]
+        print("Cenas:")
+        results["scenes"] = run_scene_benchmarks(scenes, args.quality, args.frame_rate, args.max_animations)
+
+    with open(args.output, "w", encoding="utf-8") as out:
+        json.dump(results, out, indent=2)
+    print(f"Resultados gravados em {args.output}")
+
+    if args.save_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as out:
+            json.dump(results, out, indent=2)
+        print(f"Referência gravada em {args.baseline}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print("Sem referência para comparar (use --save-baseline).")
+        return 0
+    with open(args.baseline, encoding="utf-8") as source:
+        baseline = json.load(source)
+    regressions = compare(results, baseline, args.threshold)
+    for regression in regressions:
+        print(
+            f"REGRESSÃO {regression['benchmark']} {regression['metric']}: "
+            f"{regression['baseline']:.4g} -> {regression['current']:.4g} ({regression['ratio']:.2f}x)"
+        )
+    if not regressions:
+        print(f"Sem regressões acima de {args.threshold:.0%}.")
+    return 1 if regressions else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,359 @@
+# UTILITÁRIO: Cache de animações por conteúdo (estado da cena), com remoção LRU por tamanho
+#
+# O hash padrão do manim serializa a cena inteira, inclusive os updaters e as
+# funções de always_redraw com tudo o que elas capturam; na prática ele muda a
+# cada execução e os filmes parciais nunca são reaproveitados. Aqui o hash de
+# cada animação é calculado só a partir das entradas declaradas:
+# - geometria e estilo de todos os mobjects (pontos, cores, z_index);
+# - valores dos ValueTrackers (que são mobjects: o valor fica nos pontos);
+# - estado da câmera (ângulos, zoom, centro, objetos fixos no quadro);
+# - parâmetros das animações (tipo, duração, rate_func, mobjects alvo, eixos e
+#   pontos como arrays, funções pelo código, listas e dicionários recursivamente);
+# - código dos updaters e valores simples e arrays que eles capturam (não os mobjects);
+# - resolução, taxa de quadros e cor de fundo.
+# Uma animação com um parâmetro que não pode ser resumido (objeto sem repr
+# próprio) não é reaproveitada: a chamada recebe um hash único.
+#
+# Uso pela linha de comando (mesmos argumentos do manim):
+#   python cache_animacoes.py animacao_3.py campo_E_3D -ql
+# Ou em código: enable_animation_cache(size_limit_mb=4096) antes de renderizar.
+import hashlib
+import os
+import sys
+import uuid
+from glob import glob
+
+import numpy as np
+
+
+# Limite padrão do cache de filmes parciais (MB)
+DEFAULT_SIZE_LIMIT_MB = 4096
+
+
+# ============================================================
+# 1. HASH DO ESTADO
+# ============================================================
+
+def _code_digest(code, digest):
+    """Atualiza o hash com o bytecode e as constantes de um code object (recursivo)."""
+    digest.update(code.co_code)
+    digest.update(repr(code.co_names).encode())
+    for constant in code.co_consts:
+        if hasattr(constant, "co_code"):
+            _code_digest(constant, digest)
+        else:
+            digest.update(repr(constant).encode())
+
+
+def function_digest(function, digest):
+    """Atualiza o hash com a identidade e o código de uma função ou objeto chamável."""
+    function = getattr(function, "func", function)  # functools.partial
+    code = getattr(function, "__code__", None)
+    if code is None:
+        call = getattr(type(function), "__call__", None)
+        code = getattr(call, "__code__", None)
+        digest.update(type(function).__qualname__.encode())
+    else:
+        digest.update(getattr(function, "__qualname__", "").encode())
+    if code is not None:
+        _code_digest(code, digest)
+    # Valores simples capturados (taxas, constantes); mobjects capturados entram
+    # pelo próprio estado, não pela função
+    captured = [cell.cell_contents for cell in getattr(function, "__closure__", None) or ()]
+    captured += list(getattr(function, "__defaults__", None) or ())
+    for value in captured:
+        if isinstance(value, (int, float, complex, str, bool, np.number)):
+            digest.update(repr(value).encode())
+        elif isinstance(value, np.ndarray):
+            _array_digest(value, digest)
+
+
+def _array_digest(array, digest):
+    array = np.ascontiguousarray(array)
+    digest.update(f"{array.shape}{array.dtype}".encode())
+    digest.update(array.tobytes())
+
+
+def mobject_digest(mobject, digest):
+    """Atualiza o hash com a geometria, o estilo e os updaters de um mobject (sem filhos)."""
+    digest.update(type(mobject).__qualname__.encode())
+    _array_digest(mobject.points, digest)
+    for name in (
+        "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas",
+        "stroke_width", "background_stroke_width", "z_index", "pixel_array",
+    ):
+        value = getattr(mobject, name, None)
+        if value is not None:
+            digest.update(name.encode())
+            _array_digest(np.asarray(value), digest)
+    for updater in mobject.updaters:
+        function_digest(updater, digest)
+
+
+def family_digest(mobjects, digest, positions=None):
+    """
+    Atualiza o hash com as famílias de uma lista de mobjects, na ordem.
+
+    Parâmetros:
+    positions: dicionário id -> posição, preenchido para que outras estruturas
+               (por exemplo os objetos fixos no quadro) possam se referir aos
+               mobjects pela posição, e não pelo id
+    """
+    for mobject in mobjects:
+        digest.update(b"[")
+        for member in mobject.get_family():
+            if positions is not None:
+                positions.setdefault(id(member), len(positions))
+            mobject_digest(member, digest)
+        digest.update(b"]")
+
+
+def camera_digest(camera, digest, positions):
+    """Atualiza o hash com o estado da câmera (2D ou 3D)."""
+    digest.update(type(camera).__qualname__.encode())
+    for name in ("pixel_width", "pixel_height", "frame_width", "frame_height", "frame_rate"):
+        digest.update(repr(getattr(camera, name, None)).encode())
+    _array_digest(np.asarray(getattr(camera, "frame_center", np.zeros(3)), dtype=float), digest)
+    digest.update(repr(getattr(camera, "background_color", None)).encode())
+    digest.update(repr(getattr(camera, "background_opacity", None)).encode())
+    for name in ("phi_tracker", "theta_tracker", "gamma_tracker", "zoom_tracker", "focal_distance_tracker"):
+        tracker = getattr(camera, name, None)
+        if tracker is not None:
+            digest.update(repr(tracker.get_value()).encode())
+            for updater in tracker.updaters:
+                function_digest(updater, digest)
+    for name in ("fixed_in_frame_mobjects", "fixed_orientation_mobjects"):
+        members = getattr(camera, name, None)
+        if members is not None:
+            indices = sorted(positions.get(id(member), -1) for member in members)
+            digest.update(f"{name}{indices}".encode())
+
+
+def animation_digest(animation, digest, positions):
+    """Atualiza o hash com os parâmetros e os mobjects de uma animação (recursivo em grupos)."""
+    digest.update(type(animation).__qualname__.encode())
+    for name in ("run_time", "lag_ratio", "remover", "introducer", "suspend_mobject_updating"):
+        digest.update(repr(getattr(animation, name, None)).encode())
+    rate_func = getattr(animation, "rate_func", None)
+    if rate_func is not None:
+        function_digest(rate_func, digest)
+    for name, value in sorted(vars(animation).items()):
+        digest.update(f"{name}=".encode())
+        _parameter_digest(value, digest, positions)
+
+
+def _parameter_digest(value, digest, positions):
+    """
+    Atualiza o hash com um parâmetro de animação: mobjects pela família,
+    animações (grupos) recursivamente, arrays pelo conteúdo, funções pelo
+    código e coleções item a item. Levanta TypeError se o valor não tiver
+    uma representação estável (objeto sem __repr__ próprio, cujo repr traz o
+    endereço de memória).
+    """
+    if hasattr(value, "get_family"):
+        family_digest([value], digest, positions)
+    elif hasattr(value, "interpolate_mobject"):
+        animation_digest(value, digest, positions)
+    elif isinstance(value, np.ndarray):
+        _array_digest(value, digest)
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[".encode())
+        for item in value:
+            _parameter_digest(item, digest, positions)
+        digest.update(b"]")
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value, key=repr):
+            digest.update(f"{key!r}:".encode())
+            _parameter_digest(value[key], digest, positions)
+        digest.update(b"}")
+    elif value is None or isinstance(value, (int, float, complex, str, bool, np.number)):
+        digest.update(repr(value).encode())
+    elif isinstance(value, type):
+        digest.update(f"{value.__module__}.{value.__qualname__}".encode())
+    elif callable(value):
+        function_digest(value, digest)
+    elif type(value).__repr__ is not object.__repr__:
+        digest.update(f"{type(value).__qualname__}:{value!r}".encode())  # Cores, enums
+    else:
+        raise TypeError(f"Parâmetro de animação sem hash estável: {type(value).__qualname__}")
+
+
+def state_hash(scene, camera, animations, mobjects):
+    """
+    Hash estável de uma chamada a self.play: mesma assinatura de
+    get_hash_from_play_call do manim.
+    """
+    from manim import config
+
+    digest = hashlib.sha256()
+    digest.update(repr((
+        config["pixel_width"], config["pixel_height"], config["frame_rate"],
+        str(config["background_color"]), type(scene).__qualname__,
+    )).encode())
+    positions = {}
+    family_digest(mobjects, digest, positions)
+    camera_digest(camera, digest, positions)
+    try:
+        for animation in animations:
+            animation_digest(animation, digest, positions)
+    except TypeError:
+        # Parâmetro sem hash estável: nunca reaproveitar esta chamada
+        return f"uncached_{uuid.uuid4().hex[:23]}"
+    for updater in getattr(scene, "updaters", []):
+        function_digest(updater, digest)
+    return digest.hexdigest()[:32]
+
+
+# ============================================================
+# 2. REMOÇÃO LRU POR TAMANHO
+# ============================================================
+
+def partial_movie_files():
+    """Filmes parciais de todas as cenas no diretório de mídia do manim."""
+    from manim import config
+
+    pattern = os.path.join(config.get_dir("media_dir"), "videos", "**", "partial_movie_files", "**", "*")
+    return [
+        path for path in glob(pattern, recursive=True)
+        if os.path.isfile(path) and not path.endswith(".txt")
+        and ".tmp" not in os.path.basename(path)  # Em gravação por algum processo
+    ]
+
+
+def evict_lru(size_limit_mb=DEFAULT_SIZE_LIMIT_MB, keep=()):
+    """
+    Remove os filmes parciais usados há mais tempo até o cache caber no limite.
+    O uso é registrado na data de modificação (atualizada a cada acerto).
+
+    Parâmetros:
+    keep: caminhos que não podem ser removidos (a cena em andamento)
+
+    Retorna:
+    Lista dos arquivos removidos
+    """
+    keep = {os.path.abspath(path) for path in keep}
+    files = sorted(
+        ((os.path.getmtime(path), os.path.getsize(path), path) for path in partial_movie_files()),
+        reverse=True,
+    )
+    limit = size_limit_mb * 1024 * 1024
+    total = 0
+    removed = []
+    for _, size, path in files:
+        total += size
+        if total > limit and os.path.abspath(path) not in keep:
+            os.remove(path)
+            removed.append(path)
+            total -= size
+    return removed
+
+
+# ============================================================
+# 3. ATIVAÇÃO
+# ============================================================
+
+_enabled = {}
+
+
+def _temporary_movie_path(path):
+    """Caminho temporário, exclusivo deste processo, ao lado do filme parcial."""
+    root, extension = os.path.splitext(str(path))
+    return f"{root}.tmp{os.getpid()}{extension}"
+
+
+def enable_animation_cache(size_limit_mb=DEFAULT_SIZE_LIMIT_MB, evict=True):
+    """
+    Substitui o hash de animações do manim pelo hash de estado e troca a
+    limpeza por quantidade de arquivos pela remoção LRU por tamanho.
+    Pode ser chamada mais de uma vez (só as opções são atualizadas).
+
+    Cada filme parcial é gravado em um arquivo temporário do processo e
+    renomeado ao final (os.replace): processos que renderizam a mesma
+    animação ao mesmo tempo nunca leem nem concatenam um arquivo pela metade.
+
+    Parâmetros:
+    size_limit_mb: limite do cache de filmes parciais
+    evict: se False, a remoção LRU não é feita ao final de cada cena (quem
+           executa vários processos sobre o mesmo cache chama evict_lru uma
+           única vez, depois que todos terminam)
+    """
+    from manim import config
+    from manim.renderer import cairo_renderer
+    from manim.scene.scene_file_writer import SceneFileWriter
+    from manim.utils import hashing
+
+    _enabled["size_limit_mb"] = size_limit_mb
+    _enabled["evict"] = evict
+    config["disable_caching"] = False
+    config["max_files_cached"] = sys.maxsize  # A limpeza fica a cargo de evict_lru
+    if _enabled.get("patched"):
+        return
+    _enabled["patched"] = True
+
+    hashing.get_hash_from_play_call = state_hash
+    if hasattr(cairo_renderer, "get_hash_from_play_call"):
+        cairo_renderer.get_hash_from_play_call = state_hash
+
+    original_is_already_cached = SceneFileWriter.is_already_cached
+    original_finish = SceneFileWriter.finish
+    original_begin_animation = SceneFileWriter.begin_animation
+    original_end_animation = SceneFileWriter.end_animation
+
+    def begin_animation(self, allow_write=False, file_path=None):
+        self.pending_movie_file = None
+        if allow_write and config["write_to_movie"]:
+            if file_path is None:
+                # Acabou de ser registrado por add_partial_movie_file
+                sections = getattr(self, "sections", None)
+                file_path = (sections[-1].partial_movie_files if sections else self.partial_movie_files)[-1]
+            self.pending_movie_file = (_temporary_movie_path(file_path), file_path)
+            file_path = self.pending_movie_file[0]
+        return original_begin_animation(self, allow_write, file_path=file_path)
+
+    def end_animation(self, allow_write=False):
+        result = original_end_animation(self, allow_write)
+        pending = getattr(self, "pending_movie_file", None)
+        if pending and os.path.exists(pending[0]):
+            os.replace(*pending)
+        self.pending_movie_file = None
+        return result
+
+    def is_already_cached(self, hash_invocation):
+        cached = original_is_already_cached(self, hash_invocation)
+        if cached:
+            # Acerto: marca o arquivo como usado agora (ordem LRU)
+            path = os.path.join(self.partial_movie_directory, f"{hash_invocation}{config['movie_file_extension']}")
+            if os.path.exists(path):
+                os.utime(path)
+        return cached
+
+    def finish(self, *args, **kwargs):
+        result = original_finish(self, *args, **kwargs)
+        if not _enabled["evict"]:
+            return result
+        in_use = [
+            path for section in getattr(self, "sections", [])
+            for path in section.partial_movie_files if path
+        ]
+        evict_lru(_enabled["size_limit_mb"], keep=in_use)
+        return result
+
+    SceneFileWriter.is_already_cached = is_already_cached
+    SceneFileWriter.finish = finish
+    SceneFileWriter.begin_animation = begin_animation
+    SceneFileWriter.end_animation = end_animation
+
+
+def main():
+    """Executa a CLI do manim com o cache por conteúdo ativado."""
+    size_limit_mb = float(os.environ.get("CACHE_ANIMACOES_MB", DEFAULT_SIZE_LIMIT_MB))
+    enable_animation_cache(size_limit_mb)
+    from manim.__main__ import main as manim_main
+
+    sys.argv = ["manim", "render", *sys.argv[1:]]
+    return manim_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+# UTILITÁRIO: Instantâneos da geometria construída, em arquivos NumPy mapeados em memória
+#
+# Uso nas cenas (em vez de chamar o construtor diretamente):
+#   sphere1 = cached_mobject(lod_sphere, radius=r1, resolution=(30,30), zoom=1.8)
+#   field_lines = cached_mobject(radial_field_lines, 3.5, extension=1.5)
+#
+# Na primeira execução o mobject é construído e sua família é gravada em
+# .cache_geometria/: os pontos de todos os membros em um único <chave>.npy e
+# a estrutura (pais, faixas de pontos, cores, espessuras, z_index) em
+# <chave>.npz. Nas execuções seguintes o .npy é aberto com mmap (cópia na
+# escrita): nada é recalculado e só as páginas usadas são lidas do disco.
+#
+# A chave inclui o código do construtor, os argumentos, a resolução, o fator
+# de LOD (lod.py), o modo de prévia (previa.py), a versão do manim e o
+# código-fonte dos módulos do repositório que geram geometria (GEOMETRY_MODULES,
+# mais o módulo do próprio construtor); mudar qualquer um deles gera um novo
+# instantâneo.
+#
+# O mobject restaurado é uma árvore de VGroup/VMobject com a mesma geometria
+# e o mesmo estilo, mas sem os métodos específicos da classe original (por
+# exemplo os arrays de FieldGlyphs): use-o para objetos que a cena só estiliza,
+# move e anima.
+#
+#   python cache_geometria.py --list      # instantâneos gravados
+#   python cache_geometria.py --clear     # remove todos
+import argparse
+import hashlib
+import os
+import sys
+import tempfile
+from functools import lru_cache
+from glob import glob
+
+import numpy as np
+
+from cache_animacoes import function_digest
+
+
+# Diretório dos instantâneos (CACHE_GEOMETRIA_DIR para trocar; CACHE_GEOMETRIA=0 desativa)
+GEOMETRY_CACHE_DIR = os.environ.get(
+    "CACHE_GEOMETRIA_DIR",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache_geometria"),
+)
+
+# Versão do formato (mudar invalida os instantâneos existentes)
+FORMAT_VERSION = 1
+
+# Módulos do repositório cuja geometria os construtores usam: o código-fonte
+# de cada um entra na chave
+GEOMETRY_MODULES = ("glifos", "linhas_de_campo", "superficies", "lod", "previa")
+
+# Arrays de estilo gravados para cada membro da família
+STYLE_ARRAYS = ("fill_rgbas", "stroke_rgbas", "background_stroke_rgbas")
+STYLE_SCALARS = ("stroke_width", "background_stroke_width", "z_index")
+
+
+# ============================================================
+# 1. CHAVE DOS INSTANTÂNEOS
+# ============================================================
+
+def _argument_digest(value, digest):
+    """Atualiza o hash com um argumento (arrays pelo conteúdo, coleções recursivamente)."""
+    if isinstance(value, np.ndarray):
+        digest.update(f"array{value.shape}{value.dtype}".encode())
+        digest.update(np.ascontiguousarray(value).tobytes())
+    elif isinstance(value, (list, tuple)):
+        digest.update(f"{type(value).__name__}[".encode())
+        for item in value:
+            _argument_digest(item, digest)
+        digest.update(b"]")
+    elif isinstance(value, dict):
+        digest.update(b"{")
+        for key in sorted(value):
+            digest.update(f"{key}=".encode())
+            _argument_digest(value[key], digest)
+        digest.update(b"}")
+    elif callable(value):
+        function_digest(value, digest)
+    else:
+        digest.update(f"{type(value).__name__}:{value}".encode())
+
+
+@lru_cache(maxsize=None)
+def source_digest(module_name):
+    """Hash do código-fonte de um módulo do repositório ("" se não houver o arquivo)."""
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)), f"{module_name}.py")
+    if not os.path.exists(path):
+        return ""
+    with open(path, "rb") as source:
+        return hashlib.sha256(source.read()).hexdigest()
+
+
+def geometry_key(builder, args, kwargs):
+    """Chave de um instantâneo: construtor, argumentos e contexto de renderização."""
+    import manim
+    from manim import config
+    from lod import lod_factor
+
+    previa = sys.modules.get("previa")
+    digest = hashlib.sha256()
+    digest.update(repr((
+        FORMAT_VERSION, manim.__version__, config["pixel_width"], config["pixel_height"],
+        lod_factor(), bool(previa and previa.is_preview_enabled()),
+    )).encode())
+    if isinstance(builder, type):
+        digest.update(f"{builder.__module__}.{builder.__qualname__}".encode())
+    else:
+        function_digest(builder, digest)
+    modules = sorted({*GEOMETRY_MODULES, getattr(builder, "__module__", None) or ""} - {""})
+    for module_name in modules:
+        digest.update(f"{module_name}:{source_digest(module_name)}".encode())
+    _argument_digest(list(args), digest)
+    _argument_digest(kwargs, digest)
+    return digest.hexdigest()[:32]
+
+
+# ============================================================
+# 2. GRAVAÇÃO E LEITURA
+# ============================================================
+
+def _pack(arrays, width):
+    """Concatena arrays (k_i, width) e devolve (dados, deslocamentos)."""
+    offsets = np.cumsum([0] + [len(array) for array in arrays])
+    data = np.concatenate(arrays) if arrays and offsets[-1] else np.zeros((0, width))
+    return data.reshape(-1, width), offsets
+
+
+def save_snapshot(mobject, path):
+    """
+    Grava a família de um mobject em path + ".npy" (pontos) e path + ".npz"
+    (estrutura e estilo). O .npz é gravado por último e marca o instantâneo
+    como completo.
+
+    Retorna:
+    False se algum membro não for um VMobject (nada é gravado)
+    """
+    from manim import VMobject
+
+    family = mobject.get_family()
+    if not all(isinstance(member, VMobject) for member in family):
+        return False
+    index = {id(member): i for i, member in enumerate(family)}
+    parents = np.full(len(family), -1)
+    for member in family:
+        for child in member.submobjects:
+            parents[index[id(child)]] = index[id(member)]
+
+    points, point_offsets = _pack([np.asarray(member.points, dtype=float) for member in family], 3)
+    meta = {
+        "parents": parents,
+        "point_offsets": point_offsets,
+        "shade_in_3d": np.array([bool(getattr(member, "shade_in_3d", False)) for member in family]),
+    }
+    for name in STYLE_ARRAYS:
+        arrays = [np.asarray(getattr(member, name), dtype=float).reshape(-1, 4) for member in family]
+        meta[name], meta[f"{name}_offsets"] = _pack(arrays, 4)
+    for name in STYLE_SCALARS:
+        meta[name] = np.array([float(getattr(member, name, 0) or 0) for member in family])
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    for suffix, write in ((".npy", lambda out: np.save(out, points)), (".npz", lambda out: np.savez(out, **meta))):
+        # Arquivo temporário + rename: outro processo nunca vê um arquivo pela metade
+        handle, temporary = tempfile.mkstemp(dir=os.path.dirname(path), suffix=suffix)
+        with os.fdopen(handle, "wb") as out:
+            write(out)
+        os.replace(temporary, path + suffix)
+    return True
+
+
+def load_snapshot(path):
+    """
+    Restaura a família gravada por save_snapshot. Os pontos de cada membro
+    são visões do .npy mapeado em memória (modo "c": alterações ficam só na
+    memória deste processo).
+    """
+    from manim import VGroup, VMobject
+
+    points = np.load(path + ".npy", mmap_mode="c").view(np.ndarray)
+    with np.load(path + ".npz") as source:
+        meta = {name: source[name] for name in source.files}
+
+    offsets = meta["point_offsets"]
+    family = []
+    for i, parent in enumerate(meta["parents"]):
+        start, end = offsets[i], offsets[i + 1]
+        member = VMobject() if end > start else VGroup()
+        member.points = points[start:end]
+        member.shade_in_3d = bool(meta["shade_in_3d"][i])
+        for name in STYLE_ARRAYS:
+            style_offsets = meta[f"{name}_offsets"]
+            setattr(member, name, meta[name][style_offsets[i]:style_offsets[i + 1]].copy())
+        member.stroke_width = meta["stroke_width"][i]
+        member.background_stroke_width = meta["background_stroke_width"][i]
+        member.z_index = meta["z_index"][i]
+        family.append(member)
+        if parent >= 0:
+            family[parent].submobjects.append(member)
+    return family[0]
+
+
+def cached_mobject(builder, *args, **kwargs):
+    """
+    Retorna builder(*args, **kwargs), restaurado de um instantâneo quando
+    existir um para a mesma chave. Na primeira vez o mobject é construído,
+    gravado e relido, para que todas as execuções recebam a mesma estrutura.
+    """
+    if os.environ.get("CACHE_GEOMETRIA") == "0":
+        return builder(*args, **kwargs)
+    path = os.path.join(GEOMETRY_CACHE_DIR, geometry_key(builder, args, kwargs))
+    if not os.path.exists(path + ".npz"):
+        mobject = builder(*args, **kwargs)
+        if not save_snapshot(mobject, path):
+            return mobject
+    return load_snapshot(path)
+
+
+# ============================================================
+# 3. LINHA DE COMANDO
+# ============================================================
+
+def snapshot_files():
+    """Arquivos de instantâneos no diretório do cache."""
+    return sorted(glob(os.path.join(GEOMETRY_CACHE_DIR, "*.np[yz]")))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Instantâneos de geometria das cenas.")
+    parser.add_argument("--list", action="store_true", help="lista os instantâneos e o tamanho de cada um")
+    parser.add_argument("--clear", action="store_true", help="remove todos os instantâneos")
+    args = parser.parse_args(argv)
+
+    files = snapshot_files()
+    if args.clear:
+        for path in files:
+            os.remove(path)
+        print(f"{len(files)} arquivos removidos de {GEOMETRY_CACHE_DIR}")
+        return 0
+    total = 0
+    for path in files:
+        size = os.path.getsize(path)
+        total += size
+        if args.list:
+            print(f"{os.path.basename(path):<40} {size / 1024:10.1f} KB")
+    print(f"{len(files)} arquivos, {total / 1024 / 1024:.1f} MB em {GEOMETRY_CACHE_DIR}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
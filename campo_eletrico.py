@@ -0,0 +1,369 @@
+# UTILITÁRIO: Campo elétrico e linhas de fluxo calculados com os núcleos vetorizados de campos.py
+from manim import (
+    ArrowVectorField, OUT, RIGHT, StreamLines, UP, VGroup, VMobject, Vector, VectorField,
+    config, inverse_interpolate,
+)
+from manim.mobject.vector_field import DEFAULT_SCALAR_FIELD_COLORS
+from carregador import ElectricField  # Só o submódulo de eletrostática
+from PIL import Image
+import numpy as np
+import itertools as it
+from math import ceil, floor
+from campos import superposition_field, SuperpositionGrid
+
+
+# ============================================================
+# 1. CAMPO ELÉTRICO (SETAS) COM AVALIAÇÃO EM LOTE
+# ============================================================
+
+def values_to_rgbs(values, rgbs, min_value=0, max_value=2):
+    """
+    Cores (K, 3) de valores escalares (K,), com a mesma interpolação entre
+    as cores do esquema usada pelo VectorField do manim.
+    """
+    values = np.clip(values, min_value, max_value)
+    alpha = inverse_interpolate(min_value, max_value, values) * (len(rgbs) - 1)
+    low = alpha.astype(int)
+    high = np.minimum(low + 1, len(rgbs) - 1)
+    fraction = (alpha % 1)[:, None]
+    return (1 - fraction) * rgbs[low] + fraction * rgbs[high]
+
+
+class BatchedElectricField(ElectricField):
+    """
+    ElectricField do manim_physics cujo campo é avaliado em uma única chamada
+    vetorizada para toda a grade de setas.
+
+    O ArrowVectorField consulta o campo ponto a ponto (para o vetor e para a
+    cor); aqui essas consultas leem uma tabela preenchida de uma só vez por
+    superposition_field na primeira chamada.
+
+    Parâmetros:
+    *charges: objetos Charge do manim_physics
+    field_values: campo já calculado nos pontos de get_grid_points() (N, 3),
+                  ou função que recebe esses pontos e o retorna; se fornecido,
+                  dispensa a avaliação
+    **kwargs: repassados a ArrowVectorField
+    """
+
+    def __init__(self, *charges, field_values=None, **kwargs):
+        self.charges = charges
+        self.positions = np.array([charge.get_center() for charge in charges], dtype=float)
+        self.magnitudes = np.array([charge.magnitude for charge in charges], dtype=float)
+        self.field_values = field_values
+        self._table = None
+        ArrowVectorField.__init__(self, self._lookup, **kwargs)
+
+    def field_function(self, points):
+        """Campo das cargas em (N, 3) pontos (mesmo corte do ElectricField)."""
+        return superposition_field(
+            points, self.positions, self.magnitudes, cutoff=0.1, zero_if_any_close=True
+        )
+
+    def get_grid_points(self):
+        """Pontos da grade de setas, na mesma ordem e aritmética do ArrowVectorField."""
+        return np.array([
+            x * RIGHT + y * UP + z * OUT
+            for x, y, z in it.product(
+                np.arange(*self.x_range),
+                np.arange(*self.y_range),
+                np.arange(*self.z_range),
+            )
+        ])
+
+    def _lookup(self, point):
+        if self._table is None:
+            grid = self.get_grid_points()
+            values = self.field_values
+            if values is None:
+                values = self.field_function(grid)
+            elif callable(values):
+                values = values(grid)
+            self._table = dict(zip(map(tuple, grid), values))
+        value = self._table.get(tuple(point))
+        if value is None:
+            return self.field_function(point)
+        return value.copy()
+
+
+# ============================================================
+# 2. LINHAS DE FLUXO INTEGRADAS EM LOTE
+# ============================================================
+
+class BatchedStreamLines(StreamLines):
+    """
+    StreamLines cujas linhas são integradas todas ao mesmo tempo.
+
+    O campo deve aceitar arrays (N, 3) e retornar (N, 3) (ver campos.py). A cada
+    passo de integração o campo é avaliado uma só vez para todas as linhas
+    ainda ativas, em vez de uma chamada por ponto por passo. A imagem de fundo
+    usada para colorir as linhas também é calculada em lote.
+
+    Parâmetros: os mesmos de StreamLines (renderizador Cairo).
+    """
+
+    def __init__(
+        self,
+        func,
+        color=None,
+        color_scheme=None,
+        min_color_scheme_value=0,
+        max_color_scheme_value=2,
+        colors=DEFAULT_SCALAR_FIELD_COLORS,
+        x_range=None,
+        y_range=None,
+        z_range=None,
+        three_dimensions=False,
+        noise_factor=None,
+        n_repeats=1,
+        dt=0.05,
+        virtual_time=3,
+        max_anchors_per_line=100,
+        padding=3,
+        stroke_width=1,
+        opacity=1,
+        **kwargs,
+    ):
+        VectorField.__init__(
+            self,
+            func,
+            color,
+            color_scheme,
+            min_color_scheme_value,
+            max_color_scheme_value,
+            colors,
+            **kwargs,
+        )
+        self.batched_func = func
+        self.uses_norm_color_scheme = color_scheme is None
+        self.min_color_scheme_value = min_color_scheme_value
+        self.max_color_scheme_value = max_color_scheme_value
+
+        self.x_range = x_range or [floor(-config["frame_width"] / 2), ceil(config["frame_width"] / 2)]
+        self.y_range = y_range or [floor(-config["frame_height"] / 2), ceil(config["frame_height"] / 2)]
+        self.ranges = [self.x_range, self.y_range]
+        if three_dimensions or z_range:
+            self.z_range = z_range or self.y_range.copy()
+            self.ranges += [self.z_range]
+        else:
+            self.ranges += [[0, 0]]
+        for i in range(len(self.ranges)):
+            if len(self.ranges[i]) == 2:
+                self.ranges[i] += [0.5]
+            self.ranges[i][1] += self.ranges[i][2]
+        self.x_range, self.y_range, self.z_range = self.ranges
+
+        self.noise_factor = noise_factor if noise_factor is not None else self.y_range[2] / 2
+        self.n_repeats = n_repeats
+        self.virtual_time = virtual_time
+        self.max_anchors_per_line = max_anchors_per_line
+        self.padding = padding
+        self.stroke_width = stroke_width
+
+        # Pontos iniciais: mesma grade com ruído do StreamLines
+        half_noise = self.noise_factor / 2
+        np.random.seed(0)
+        start_points = np.array([
+            (x - half_noise) * RIGHT
+            + (y - half_noise) * UP
+            + (z - half_noise) * OUT
+            + self.noise_factor * np.random.random(3)
+            for n in range(self.n_repeats)
+            for x in np.arange(*self.x_range)
+            for y in np.arange(*self.y_range)
+            for z in np.arange(*self.z_range)
+        ])
+
+        max_steps = ceil(virtual_time / dt) + 1
+        trajectories, lengths = self._integrate(start_points, dt, max_steps)
+
+        if not self.single_color:
+            self.background_img = self.get_colored_background_image()
+
+        for index in range(len(start_points)):
+            points = trajectories[:lengths[index], index]
+            line = VMobject()
+            line.duration = max_steps * dt
+            step = max(1, int(len(points) / self.max_anchors_per_line))
+            line.set_points_smoothly(points[::step])
+            if self.single_color:
+                line.set_stroke(self.color, stroke_width, opacity)
+            else:
+                line.color_using_background_image(self.background_img)
+                line.set_stroke(width=self.stroke_width, opacity=opacity)
+            self.add(line)
+        self.stream_lines = [*self.submobjects]
+
+    def _outside_box(self, points):
+        """Máscara dos pontos fora da região de integração (com margem)."""
+        lower = np.array([self.x_range[0], self.y_range[0], self.z_range[0]]) - self.padding
+        upper = np.array([
+            self.x_range[1] - self.x_range[2],
+            self.y_range[1] - self.y_range[2],
+            self.z_range[1] - self.z_range[2],
+        ]) + self.padding
+        return np.any((points < lower) | (points > upper), axis=1)
+
+    def _integrate(self, start_points, dt, max_steps):
+        """
+        Integra (Euler) todas as linhas juntas; cada linha para no primeiro
+        ponto que sai da região.
+
+        Retorna:
+        trajetórias (max_steps + 1, S, 3) e número de pontos válidos por linha (S,)
+        """
+        n_lines = len(start_points)
+        trajectories = np.zeros((max_steps + 1, n_lines, 3))
+        trajectories[0] = start_points
+        lengths = np.ones(n_lines, dtype=int)
+        active = np.ones(n_lines, dtype=bool)
+        for step in range(max_steps):
+            indices = np.flatnonzero(active)
+            if len(indices) == 0:
+                break
+            last = trajectories[step, indices]
+            new = last + dt * np.asarray(self.batched_func(last), dtype=float).reshape(-1, 3)
+            outside = self._outside_box(new)
+            active[indices[outside]] = False
+            inside = indices[~outside]
+            trajectories[step + 1, inside] = new[~outside]
+            lengths[inside] += 1
+        return trajectories, lengths
+
+    def get_colored_background_image(self, sampling_rate=5):
+        """Imagem de fundo das cores do campo, calculada em lote para todos os pixels."""
+        ph = int(config["pixel_height"] / sampling_rate)
+        pw = int(config["pixel_width"] / sampling_rate)
+        fw = config["frame_width"]
+        fh = config["frame_height"]
+        points = np.zeros((ph, pw, 3))
+        points[:, :, 0] = np.linspace(-fw / 2, fw / 2, pw)[None, :]
+        points[:, :, 1] = np.linspace(fh / 2, -fh / 2, ph)[:, None]
+        vectors = np.asarray(self.batched_func(points.reshape(-1, 3)), dtype=float)
+        if self.uses_norm_color_scheme:
+            values = np.linalg.norm(vectors, axis=1)
+        else:
+            values = np.array([self.color_scheme(v) for v in vectors])
+        rgbs = values_to_rgbs(values, self.rgbs, self.min_color_scheme_value, self.max_color_scheme_value)
+        return Image.fromarray((rgbs.reshape(ph, pw, 3) * 255).astype("uint8"))
+
+
+# ============================================================
+# 3. CAMPO ELÉTRICO QUE SÓ É RECONSTRUÍDO QUANDO AS CARGAS MUDAM
+# ============================================================
+
+class CachedElectricField(VGroup):
+    """
+    Substituto de always_redraw(lambda: ElectricField(*charges)).
+
+    A cada quadro compara as posições e os valores das cargas com os do último
+    campo calculado; as setas só são atualizadas quando algum deles muda. Nos
+    quadros parados (self.wait) nada é feito.
+
+    As setas são construídas uma única vez (BatchedElectricField). O campo na
+    grade é mantido por um SuperpositionGrid, semeado pela mesma avaliação que
+    constrói as setas: quando uma carga se move, apenas a contribuição dela é
+    recalculada, e os pontos e as cores das setas existentes são refeitos em
+    lote a partir do total, sem criar novos mobjects.
+
+    Parâmetros:
+    *charges: objetos Charge do manim_physics
+    **kwargs: repassados a BatchedElectricField
+    """
+
+    def __init__(self, *charges, **kwargs):
+        super().__init__()
+        self.charges = charges
+        self.field_kwargs = kwargs
+        self._key = None
+        self.superposition = None
+        self.rebuild_count = 0
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def get_state(self):
+        """Posições (M, 3) e valores (M,) atuais das cargas."""
+        positions = np.array([charge.get_center() for charge in self.charges], dtype=float)
+        magnitudes = np.array([charge.magnitude for charge in self.charges], dtype=float)
+        return positions, magnitudes
+
+    def _build(self, positions, magnitudes):
+        """Constrói as setas; o campo da grade vem do SuperpositionGrid (uma avaliação)."""
+
+        def seed(grid):
+            self.superposition = SuperpositionGrid(grid, cutoff=0.1, zero_if_any_close=True)
+            self.superposition.update(positions, magnitudes)
+            return self.superposition.get_field()
+
+        field = BatchedElectricField(*self.charges, field_values=seed, **self.field_kwargs)
+        self.field = field
+        self.grid_points = field.get_grid_points()
+        self.arrows = list(field.submobjects)
+        self.add(*self.arrows)
+
+        # Seta de referência (comprimento 1, ao longo de +X): todas as setas são
+        # cópias dela giradas, escaladas e deslocadas (exato enquanto a ponta for
+        # proporcional ao comprimento, como nas setas curtas do campo)
+        template = Vector(RIGHT, **field.vector_config)
+        members = [member for member in template.get_family() if len(member.points)]
+        self.template_points = np.concatenate([member.points for member in members])
+        self.template_sizes = [len(member.points) for member in members]
+        self.max_stroke_width = getattr(template, "initial_stroke_width", template.stroke_width)
+        self.stroke_width_ratio = getattr(template, "max_stroke_width_to_length_ratio", 5)
+
+    def _update_arrows(self, vectors):
+        """Refaz, em lote, os pontos e as cores das setas existentes a partir do campo (N, 3)."""
+        field = self.field
+        norms = np.linalg.norm(vectors, axis=1)
+        lengths = np.array([field.length_func(norm) if norm > 0 else 0.0 for norm in norms])
+
+        # Base de cada seta: direção, eixo horizontal perpendicular e o terceiro
+        # vetor (rotação em azimute seguida da inclinação, como Arrow.position_tip)
+        direction = vectors / np.where(norms > 0, norms, 1)[:, None]
+        azimuth = np.arctan2(direction[:, 1], direction[:, 0])
+        side = np.stack([-np.sin(azimuth), np.cos(azimuth), np.zeros_like(azimuth)], axis=1)
+        rotations = np.stack([direction, side, np.cross(direction, side)], axis=2)  # (N, 3, 3)
+        points = (
+            self.grid_points[:, None, :]
+            + lengths[:, None, None] * np.einsum("nij,pj->npi", rotations, self.template_points)
+        )
+        widths = np.minimum(self.max_stroke_width, self.stroke_width_ratio * lengths)
+
+        colors = None
+        if not field.single_color:
+            if "color_scheme" in self.field_kwargs:
+                values = np.array([field.color_scheme(vector) for vector in vectors])
+            else:
+                values = norms
+            colors = values_to_rgbs(
+                values, field.rgbs,
+                self.field_kwargs.get("min_color_scheme_value", 0),
+                self.field_kwargs.get("max_color_scheme_value", 2),
+            )
+
+        for index, arrow in enumerate(self.arrows):
+            members = [member for member in arrow.get_family() if len(member.points)]
+            offset = 0
+            for member, size in zip(members, self.template_sizes):
+                member.points = points[index, offset:offset + size]
+                offset += size
+                if colors is not None:
+                    # Só o RGB: a opacidade de cada membro (haste sem preenchimento) é mantida
+                    member.fill_rgbas[:, :3] = colors[index]
+                    member.stroke_rgbas[:, :3] = colors[index]
+            arrow.stroke_width = widths[index]
+
+    def refresh(self):
+        """Atualiza as setas se (e somente se) alguma carga mudou."""
+        positions, magnitudes = self.get_state()
+        key = np.concatenate([positions.ravel(), magnitudes]).tobytes()
+        if key == self._key:
+            return self
+        self._key = key
+        if self.superposition is None:
+            self._build(positions, magnitudes)
+        else:
+            self.superposition.update(positions, magnitudes)
+            self._update_arrows(self.superposition.get_field())
+        self.rebuild_count += 1
+        return self
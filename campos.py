@@ -0,0 +1,190 @@
+# UTILITÁRIO: Núcleos vetorizados de campo elétrico (entrada e saída em arrays (N, 3))
+from manim import *
+import numpy as np
+
+
+def _as_points(points):
+    """Converte a entrada para (N, 3); indica se era um único ponto."""
+    points = np.asarray(points, dtype=float)
+    return points.reshape(-1, 3), points.ndim == 1
+
+
+def superposition_field(points, positions, magnitudes, cutoff=0.1, zero_if_any_close=False):
+    """
+    Campo elétrico de um conjunto de cargas pontuais (princípio de superposição),
+    calculado para todos os pontos de uma vez.
+
+    Física: Lei de Coulomb - cada carga contribui com q * r / |r|³.
+
+    Parâmetros:
+    points: pontos onde calcular o campo, (N, 3) ou um único ponto (3,)
+    positions: posições das cargas (M, 3)
+    magnitudes: valores das cargas (M,)
+    cutoff: distância mínima; mais perto que isso a contribuição da carga é
+            descartada (evita a singularidade)
+    zero_if_any_close: se True, o campo inteiro é zero nos pontos próximos de
+                       qualquer carga (comportamento do ElectricField do manim_physics)
+
+    Retorna:
+    Campo elétrico (N, 3), ou (3,) se a entrada era um único ponto
+    """
+    points, single = _as_points(points)
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+
+    r = points[:, None, :] - positions[None, :, :]   # (N, M, 3)
+    dist = np.linalg.norm(r, axis=-1)                 # (N, M)
+    close = dist < cutoff
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coefficients = np.where(close, 0.0, magnitudes / dist**3)
+    field = np.einsum("nm,nmk->nk", coefficients, r)
+    if zero_if_any_close:
+        field[close.any(axis=1)] = 0.0
+    return field[0] if single else field
+
+
+def point_charge_field(points, position=ORIGIN, magnitude=1.0, cutoff=0.1):
+    """
+    Campo elétrico radial de uma carga pontual.
+
+    Parâmetros:
+    points: pontos (N, 3) ou um único ponto (3,)
+    position: posição da carga
+    magnitude: valor da carga
+    cutoff: distância mínima à carga (campo nulo mais perto que isso)
+
+    Retorna:
+    Campo elétrico com a mesma forma da entrada
+    """
+    return superposition_field(points, [position], [magnitude], cutoff)
+
+
+def dipole_field(points, positive_position, negative_position, magnitude=1.0, cutoff=0.1):
+    """
+    Campo elétrico de um dipolo: cargas +magnitude e -magnitude.
+
+    Parâmetros:
+    points: pontos (N, 3) ou um único ponto (3,)
+    positive_position: posição da carga positiva
+    negative_position: posição da carga negativa
+    magnitude: valor absoluto das cargas
+    cutoff: distância mínima a cada carga
+
+    Retorna:
+    Campo elétrico com a mesma forma da entrada
+    """
+    return superposition_field(
+        points,
+        [positive_position, negative_position],
+        [magnitude, -magnitude],
+        cutoff,
+    )
+
+
+def charges_field(points, charges, cutoff=0.1, zero_if_any_close=True):
+    """
+    Campo elétrico de uma lista de objetos Charge (posição em get_center()
+    e valor em .magnitude), com o mesmo corte do ElectricField do manim_physics.
+
+    Retorna:
+    Campo elétrico com a mesma forma da entrada
+    """
+    positions = [charge.get_center() for charge in charges]
+    magnitudes = [charge.magnitude for charge in charges]
+    return superposition_field(points, positions, magnitudes, cutoff, zero_if_any_close)
+
+
+# ============================================================
+# SUPERPOSIÇÃO INCREMENTAL EM UMA GRADE FIXA
+# ============================================================
+
+class SuperpositionGrid:
+    """
+    Campo de várias cargas pontuais em uma grade fixa de pontos, mantido de
+    forma incremental.
+
+    Guarda a contribuição de cada carga em um buffer próprio (M, N, 3) e o campo
+    total (N, 3). Quando uma carga muda (posição ou valor), apenas a sua
+    contribuição é recalculada: a antiga é subtraída do total e a nova somada.
+    O custo por carga alterada é O(N), em vez de O(M × N) para refazer tudo.
+
+    Parâmetros:
+    points: pontos da grade (N, 3)
+    cutoff: distância mínima a cada carga (mesmo corte de superposition_field)
+    zero_if_any_close: se True, o campo é zero nos pontos próximos de qualquer
+                       carga (comportamento do ElectricField do manim_physics)
+    resync_every: após quantas atualizações incrementais o total é refeito a
+                  partir dos buffers, para não acumular erro de arredondamento
+    """
+
+    def __init__(self, points, cutoff=0.1, zero_if_any_close=False, resync_every=256):
+        self.points = np.asarray(points, dtype=float).reshape(-1, 3)
+        self.cutoff = cutoff
+        self.zero_if_any_close = zero_if_any_close
+        self.resync_every = resync_every
+        self.positions = np.zeros((0, 3))
+        self.magnitudes = np.zeros(0)
+        self.contributions = np.zeros((0, len(self.points), 3))
+        self.close = np.zeros((0, len(self.points)), dtype=bool)
+        self.total = np.zeros((len(self.points), 3))
+        self.updates_since_resync = 0
+
+    def _contribution(self, position, magnitude):
+        """Campo (N, 3) de uma única carga e a máscara (N,) dos pontos próximos."""
+        r = self.points - position
+        dist = np.linalg.norm(r, axis=1)
+        close = dist < self.cutoff
+        with np.errstate(divide="ignore", invalid="ignore"):
+            coefficients = np.where(close, 0.0, magnitude / dist**3)
+        return coefficients[:, None] * r, close
+
+    def _reset(self, positions, magnitudes):
+        self.positions = positions.copy()
+        self.magnitudes = magnitudes.copy()
+        self.contributions = np.zeros((len(positions), len(self.points), 3))
+        self.close = np.zeros((len(positions), len(self.points)), dtype=bool)
+        for index in range(len(positions)):
+            self.contributions[index], self.close[index] = self._contribution(
+                positions[index], magnitudes[index]
+            )
+        self.total = self.contributions.sum(axis=0)
+        self.updates_since_resync = 0
+
+    def update(self, positions, magnitudes):
+        """
+        Atualiza o campo para as novas posições e valores das cargas.
+        Só as cargas que mudaram têm a contribuição recalculada.
+
+        Retorna:
+        Índices das cargas recalculadas
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+        if len(positions) != len(self.positions):
+            self._reset(positions, magnitudes)
+            return np.arange(len(positions))
+
+        changed = np.flatnonzero(
+            np.any(positions != self.positions, axis=1) | (magnitudes != self.magnitudes)
+        )
+        for index in changed:
+            self.total -= self.contributions[index]
+            self.contributions[index], self.close[index] = self._contribution(
+                positions[index], magnitudes[index]
+            )
+            self.total += self.contributions[index]
+            self.positions[index] = positions[index]
+            self.magnitudes[index] = magnitudes[index]
+
+        self.updates_since_resync += len(changed)
+        if self.updates_since_resync >= self.resync_every:
+            self.total = self.contributions.sum(axis=0)
+            self.updates_since_resync = 0
+        return changed
+
+    def get_field(self):
+        """Retorna o campo total atual na grade (N, 3)."""
+        field = self.total.copy()
+        if self.zero_if_any_close and len(self.close):
+            field[self.close.any(axis=0)] = 0.0
+        return field
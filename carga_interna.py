@@ -0,0 +1,172 @@
+# UTILITÁRIO: Carga interna (Q_int) de regiões gaussianas com classificação rápida de pontos
+from manim import *
+import numpy as np
+
+
+# ============================================================
+# 1. ÍNDICE DE UMA REGIÃO PLANA
+# ============================================================
+
+def _crossing_test(points, starts, ends):
+    """
+    Teste par-ímpar (cruzamentos de um raio horizontal) de pontos contra arestas.
+
+    Parâmetros:
+    points: pontos (N, 2 ou 3)
+    starts, ends: extremos das arestas (E, 2 ou 3)
+
+    Retorna:
+    Máscara (N,) dos pontos dentro
+    """
+    px = points[:, None, 0]
+    py = points[:, None, 1]
+    x1, y1 = starts[None, :, 0], starts[None, :, 1]
+    x2, y2 = ends[None, :, 0], ends[None, :, 1]
+    straddles = (y1 > py) != (y2 > py)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        x_cross = x1 + (py - y1) * (x2 - x1) / (y2 - y1)
+    crossings = straddles & (px < x_cross)
+    return crossings.sum(axis=1) % 2 == 1
+
+
+class RegionIndex:
+    """
+    Região plana (polígono fechado no plano XY) pré-processada para responder
+    rapidamente se pontos estão dentro dela.
+
+    Na construção, a caixa envolvente é dividida em uma grade de células:
+    - células longe do contorno recebem de uma vez a classificação dentro/fora;
+    - células cortadas pelo contorno ficam marcadas como ambíguas;
+    - as arestas são distribuídas em faixas horizontais (edge bins).
+
+    Classificar um ponto custa uma consulta na grade; só os pontos em células
+    ambíguas fazem o teste exato, e apenas contra as arestas da sua faixa.
+
+    Parâmetros:
+    vertices: vértices do polígono (V, 3), em ordem
+    resolution: número de células em cada direção
+    """
+
+    def __init__(self, vertices, resolution=64):
+        vertices = np.asarray(vertices, dtype=float)
+        self.starts = vertices
+        self.ends = np.roll(vertices, -1, axis=0)
+        self.resolution = resolution
+
+        lower = vertices[:, :2].min(axis=0)
+        upper = vertices[:, :2].max(axis=0)
+        margin = 1e-9 + 1e-6 * np.max(upper - lower)
+        self.lower = lower - margin
+        self.cell_size = (upper + margin - self.lower) / resolution
+
+        # Classificação dos centros das células (feita uma única vez)
+        centers = self.lower + (np.indices((resolution, resolution)).reshape(2, -1).T + 0.5) * self.cell_size
+        self.cell_inside = _crossing_test(centers, self.starts, self.ends).reshape(resolution, resolution)
+
+        # Células ambíguas: atravessadas pelo contorno (e suas vizinhas)
+        ambiguous = np.zeros((resolution, resolution), dtype=bool)
+        lengths = np.linalg.norm((self.ends - self.starts)[:, :2] / self.cell_size, axis=1)
+        for start, end, length in zip(self.starts, self.ends, lengths):
+            fractions = np.linspace(0, 1, int(np.ceil(2 * length)) + 2)
+            samples = start[:2] + fractions[:, None] * (end - start)[:2]
+            cells = self._cells(samples)
+            ambiguous[cells[:, 0], cells[:, 1]] = True
+        padded = np.pad(ambiguous, 1)
+        self.ambiguous = np.zeros_like(ambiguous)
+        for di in (0, 1, 2):
+            for dj in (0, 1, 2):
+                self.ambiguous |= padded[di:di + resolution, dj:dj + resolution]
+
+        # Faixas horizontais: arestas que cruzam cada linha de células
+        y_min = np.minimum(self.starts[:, 1], self.ends[:, 1])
+        y_max = np.maximum(self.starts[:, 1], self.ends[:, 1])
+        row_low = np.floor((y_min - self.lower[1]) / self.cell_size[1]).astype(int)
+        row_high = np.floor((y_max - self.lower[1]) / self.cell_size[1]).astype(int)
+        self.row_edges = [
+            np.flatnonzero((row_low <= row) & (row_high >= row)) for row in range(resolution)
+        ]
+
+    @classmethod
+    def from_curve(cls, func, t_range, n_samples=256, resolution=64):
+        """Índice do polígono que aproxima uma curva fechada vetorizada t -> pontos."""
+        t = np.linspace(t_range[0], t_range[1], n_samples, endpoint=False)
+        return cls(np.asarray(func(t), dtype=float).reshape(-1, 3), resolution)
+
+    def _cells(self, points):
+        """Índices (coluna x, linha y) das células dos pontos (sem limitar à grade)."""
+        return np.floor((points[:, :2] - self.lower) / self.cell_size).astype(int)
+
+    def contains(self, points):
+        """
+        Classifica pontos (N, 3) ou um único ponto (3,).
+
+        Retorna:
+        Máscara (N,) dos pontos dentro da região (ou um bool para um único ponto)
+        """
+        points = np.asarray(points, dtype=float)
+        single = points.ndim == 1
+        points = points.reshape(-1, 3)
+
+        cells = self._cells(points)
+        in_grid = np.all((cells >= 0) & (cells < self.resolution), axis=1)
+        inside = np.zeros(len(points), dtype=bool)
+        column, row = cells[in_grid, 0], cells[in_grid, 1]
+        inside[in_grid] = self.cell_inside[column, row]
+
+        # Teste exato só nos pontos ambíguos, contra as arestas da faixa
+        ambiguous = np.flatnonzero(in_grid)[self.ambiguous[column, row]]
+        for index in ambiguous:
+            edges = self.row_edges[cells[index, 1]]
+            inside[index] = _crossing_test(points[index:index + 1], self.starts[edges], self.ends[edges])[0]
+        return bool(inside[0]) if single else inside
+
+
+# ============================================================
+# 2. CARGA INTERNA COMO TRACKER
+# ============================================================
+
+class EnclosedChargeTracker(ValueTracker):
+    """
+    ValueTracker cujo valor é a carga total dentro de uma região (Q_int).
+
+    O valor é recalculado quando alguma carga muda de posição ou de valor;
+    outros mobjects podem se ligar a ele como a qualquer ValueTracker
+    (por exemplo LiveReadout(r"Q_{int} = ", tracker)).
+
+    Parâmetros:
+    region: RegionIndex da superfície gaussiana
+    charges: objetos Charge do manim_physics (posição em get_center(), valor em .magnitude)
+    """
+
+    def __init__(self, region, charges, **kwargs):
+        super().__init__(0, **kwargs)
+        self.region = region
+        self.charges = list(charges)
+        self._key = None
+        self.refresh()
+        self.add_updater(lambda m: m.refresh())
+
+    def refresh(self):
+        """Reclassifica as cargas se alguma delas mudou desde a última consulta."""
+        state = np.array(
+            [[*charge.get_center(), charge.magnitude] for charge in self.charges],
+            dtype=float,
+        ).reshape(-1, 4)
+        key = state.tobytes()
+        if key != self._key:
+            self._key = key
+            inside = self.region.contains(state[:, :3])
+            self.set_value(float(state[inside, 3].sum()))
+        return self
+
+    def get_value(self):
+        """Q_int atual (atualizado na hora, mesmo fora da ordem dos updaters)."""
+        if getattr(self, "region", None) is not None:
+            self.refresh()
+        return super().get_value()
+
+    def get_enclosed_charges(self):
+        """Retorna as cargas atualmente dentro da região."""
+        positions = np.array([charge.get_center() for charge in self.charges]).reshape(-1, 3)
+        inside = self.region.contains(positions)
+        return [charge for charge, is_inside in zip(self.charges, inside) if is_inside]
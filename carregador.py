@@ -0,0 +1,164 @@
+# UTILITÁRIO: Carregamento enxuto do manim_physics e benchmark do tempo de importação das cenas
+#
+# "from manim_physics import *" executa o __init__ do pacote, que importa
+# todos os subsistemas (mecânica de corpos rígidos com pymunk, óptica, ondas,
+# magnetostática) antes de qualquer trabalho. As cenas só usam Charge e
+# ElectricField; aqui esses nomes são resolvidos no primeiro acesso,
+# importando apenas o submódulo que os define:
+#
+#   from carregador import Charge
+#
+# O pacote manim_physics é registrado sem executar o seu __init__; se algum
+# outro código pedir um nome que não veio de um submódulo já importado (ou
+# fizer "from manim_physics import *"), o __init__ real é executado nesse
+# momento e tudo continua funcionando, só sem a economia.
+#
+# Benchmark do tempo de importação (cada medida em um processo novo):
+#   python carregador.py                    # todas as cenas, mediana de 5 execuções
+#   python carregador.py animacao_3 -r 9 --top 10 --json importacao.json
+import argparse
+import importlib
+import importlib.util
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+
+
+# Nomes carregados sob demanda -> submódulo que os define
+LAZY_SYMBOLS = {
+    "Charge": "manim_physics.electromagnetism.electrostatics",
+    "ElectricField": "manim_physics.electromagnetism.electrostatics",
+}
+
+# Importações de referência medidas junto com as cenas
+REFERENCE_IMPORTS = {
+    "manim": "import manim",
+    "manim_physics (completo)": "import manim_physics",
+    "carregador.Charge": "from carregador import Charge",
+}
+
+
+# ============================================================
+# 1. CARREGAMENTO SOB DEMANDA
+# ============================================================
+
+def lazy_package(name):
+    """
+    Registra um pacote em sys.modules sem executar o seu __init__, de modo
+    que os submódulos possam ser importados isoladamente. O __init__ real é
+    executado no primeiro acesso a um atributo que ainda não exista.
+
+    Retorna:
+    O módulo do pacote (o já importado, se for o caso)
+    """
+    if name in sys.modules:
+        return sys.modules[name]
+    spec = importlib.util.find_spec(name)
+    if spec is None:
+        raise ModuleNotFoundError(f"No module named {name!r}", name=name)
+    module = importlib.util.module_from_spec(spec)
+
+    def __getattr__(attribute):
+        # Nome fora dos submódulos já carregados: executa o pacote completo
+        del module.__dict__["__getattr__"]
+        spec.loader.exec_module(module)
+        return getattr(module, attribute)
+
+    module.__getattr__ = __getattr__
+    sys.modules[name] = module
+    return module
+
+
+def __getattr__(name):
+    if name not in LAZY_SYMBOLS:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    module_name = LAZY_SYMBOLS[name]
+    lazy_package(module_name.partition(".")[0])
+    value = getattr(importlib.import_module(module_name), name)
+    globals()[name] = value  # Próximos acessos não passam por aqui
+    return value
+
+
+# ============================================================
+# 2. BENCHMARK DO TEMPO DE IMPORTAÇÃO
+# ============================================================
+
+_TIMED_IMPORT = (
+    "import time\n"
+    "start = time.perf_counter()\n"
+    "{statement}\n"
+    "print(time.perf_counter() - start)\n"
+)
+
+
+def _parse_importtime(stderr):
+    """
+    Lê a saída de "python -X importtime" e retorna os pacotes de primeiro
+    nível com o tempo cumulativo (segundos), do mais pesado ao mais leve.
+    """
+    totals = {}
+    for line in stderr.splitlines():
+        match = re.match(r"import time:\s+(\d+)\s+\|\s+(\d+)\s+\|( *)(\S+)", line)
+        if match and len(match.group(3)) == 1:  # Um espaço: importação de primeiro nível
+            package = match.group(4).partition(".")[0]
+            totals[package] = totals.get(package, 0.0) + int(match.group(2)) / 1e6
+    return sorted(totals.items(), key=lambda item: item[1], reverse=True)
+
+
+def time_import(statement, repeat=5):
+    """
+    Mede uma instrução de importação em processos novos (sem cache de módulos).
+
+    Retorna:
+    Dicionário com "median", "min" (segundos) e "packages" (pacotes de
+    primeiro nível mais pesados na última execução)
+    """
+    repo_dir = os.path.dirname(os.path.abspath(__file__))
+    samples, packages = [], []
+    for _ in range(repeat):
+        completed = subprocess.run(
+            [sys.executable, "-X", "importtime", "-c", _TIMED_IMPORT.format(statement=statement)],
+            cwd=repo_dir, capture_output=True, text=True,
+        )
+        if completed.returncode != 0:
+            return {"error": completed.stderr.strip().splitlines()[-1]}
+        samples.append(float(completed.stdout.strip().splitlines()[-1]))
+        packages = _parse_importtime(completed.stderr)
+    return {"median": statistics.median(samples), "min": min(samples), "packages": packages}
+
+
+def main(argv=None):
+    from render_lote import discover_scenes
+
+    parser = argparse.ArgumentParser(description="Tempo de importação de cada módulo de cena.")
+    parser.add_argument("modules", nargs="*", help="módulos a medir (padrão: todos os animacao_*)")
+    parser.add_argument("-r", "--repeat", type=int, default=5, help="execuções por módulo")
+    parser.add_argument("--top", type=int, default=5, help="pacotes mais pesados listados por módulo")
+    parser.add_argument("--no-reference", action="store_true", help="não mede as importações de referência")
+    parser.add_argument("--json", help="grava os resultados em JSON")
+    args = parser.parse_args(argv)
+
+    modules = args.modules or sorted({scene["module"] for scene in discover_scenes()})
+    statements = {} if args.no_reference else dict(REFERENCE_IMPORTS)
+    statements.update({module: f"import {module}" for module in modules})
+
+    results = {}
+    print(f"{'Importação':<28} {'Mediana (s)':>12} {'Mín. (s)':>10}  Pacotes mais pesados")
+    for name, statement in statements.items():
+        results[name] = result = time_import(statement, args.repeat)
+        if "error" in result:
+            print(f"{name:<28} FALHOU: {result['error']}")
+            continue
+        heaviest = ", ".join(f"{package} {seconds:.2f}" for package, seconds in result["packages"][:args.top])
+        print(f"{name:<28} {result['median']:>12.3f} {result['min']:>10.3f}  {heaviest}", flush=True)
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as out:
+            json.dump(results, out, indent=2)
+    return 0 if all("error" not in result for result in results.values()) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
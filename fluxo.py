@@ -0,0 +1,300 @@
+# UTILITÁRIO: Integração numérica vetorizada do fluxo elétrico em curvas fechadas e malhas
+from manim import *
+import numpy as np
+from angulos_solidos import triangle_solid_angles, mesh_triangles
+
+
+# ============================================================
+# 1. CAMPOS DE CARGAS PONTUAIS (2D E 3D)
+# ============================================================
+
+def planar_charges_field(points, positions, magnitudes, cutoff=0.1):
+    """
+    Campo de cargas pontuais no plano (lei de Gauss em 2D): q * r / |r|².
+
+    Com esse campo o fluxo por uma curva fechada vale 2π·Q_int, para qualquer
+    forma de curva - é o análogo plano de Φ = 4π·Q_int em 3D.
+
+    Parâmetros:
+    points: pontos (N, 3)
+    positions: posições das cargas (M, 3)
+    magnitudes: valores das cargas (M,)
+    cutoff: distância mínima a cada carga (contribuição nula mais perto; só
+            para desenhar o campo - o fluxo das cargas é calculado sem corte,
+            ver CurveFlux.charges_flux)
+
+    Retorna:
+    Campo elétrico (N, 3)
+    """
+    points = np.asarray(points, dtype=float).reshape(-1, 3)
+    positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+    magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+    r = points[:, None, :] - positions[None, :, :]
+    dist = np.linalg.norm(r, axis=-1)
+    with np.errstate(divide="ignore", invalid="ignore"):
+        coefficients = np.where(dist < cutoff, 0.0, magnitudes / dist**2)
+    return np.einsum("nm,nmk->nk", coefficients, r)
+
+
+def _refinement_levels(sample_points, sizes, positions, refine_factor, max_subdivisions):
+    """
+    Número de subdivisões de cada elemento (1 = sem refinamento).
+
+    Um elemento é refinado quando alguma carga está a menos de
+    refine_factor × (tamanho do elemento) do seu ponto de amostragem; quanto
+    mais perto a carga, mais subdivisões (potências de 2, para reaproveitar a
+    geometria em cache).
+    """
+    levels = np.ones(len(sample_points), dtype=int)
+    if len(positions) == 0:
+        return levels
+    dist = np.linalg.norm(sample_points[:, None, :] - positions[None, :, :], axis=-1).min(axis=1)
+    ratio = refine_factor * sizes / np.maximum(dist, 1e-9)
+    flagged = ratio > 1
+    levels[flagged] = 2 ** np.ceil(np.log2(ratio[flagged])).astype(int)
+    return np.minimum(levels, max_subdivisions)
+
+
+# ============================================================
+# 2. FLUXO POR UMA CURVA FECHADA NO PLANO XY
+# ============================================================
+
+class CurveFlux:
+    """
+    Fluxo ∮ E·n ds através de uma curva fechada do plano XY.
+
+    A curva é discretizada uma única vez: pontos médios, elementos de
+    comprimento e normais externas ficam guardados em arrays, e cada cálculo de
+    fluxo é uma única avaliação vetorizada do campo. Segmentos muito próximos de
+    uma carga são subdivididos (refinamento adaptativo), pois ali a regra do
+    ponto médio perde precisão.
+
+    Parâmetros:
+    func: curva vetorizada t (array) -> pontos (len(t), 3)
+    t_range: intervalo do parâmetro que percorre a curva uma vez
+    n_segments: número de segmentos da discretização base
+    refine_factor: distância relativa (em tamanhos de segmento) que dispara o refinamento
+    max_subdivisions: máximo de subdivisões por segmento
+    """
+
+    def __init__(self, func, t_range=(0, TAU), n_segments=256, refine_factor=2.0, max_subdivisions=64):
+        self.func = func
+        self.t_range = t_range
+        self.n_segments = n_segments
+        self.refine_factor = refine_factor
+        self.max_subdivisions = max_subdivisions
+        self.t_edges = np.linspace(t_range[0], t_range[1], n_segments + 1)
+        self.midpoints, self.normal_elements = self._segments(self.t_edges[:-1], self.t_edges[1:], 1)
+        self.lengths = np.linalg.norm(self.normal_elements, axis=1)
+
+        # Orientação: a normal deve apontar para fora (área com sinal positiva = anti-horário)
+        self.vertices = self._points(self.t_edges)
+        vertices = self.vertices
+        signed_area = 0.5 * np.sum(
+            vertices[:-1, 0] * vertices[1:, 1] - vertices[1:, 0] * vertices[:-1, 1]
+        )
+        self.orientation = 1.0 if signed_area >= 0 else -1.0
+        self.normal_elements *= self.orientation
+        self._refined_cache = {}
+
+    def _points(self, t):
+        return np.asarray(self.func(np.asarray(t, dtype=float)), dtype=float).reshape(-1, 3)
+
+    def _segments(self, t_start, t_end, subdivisions):
+        """Pontos médios e vetores n·ds dos sub-segmentos de cada intervalo [t_start, t_end]."""
+        fractions = np.linspace(0, 1, subdivisions + 1)
+        t = t_start[:, None] + (t_end - t_start)[:, None] * fractions[None, :]
+        points = self._points(t.reshape(-1)).reshape(len(t_start), subdivisions + 1, 3)
+        chords = points[:, 1:] - points[:, :-1]
+        midpoints = 0.5 * (points[:, 1:] + points[:, :-1])
+        normal_elements = np.stack(
+            [chords[..., 1], -chords[..., 0], np.zeros_like(chords[..., 0])], axis=-1
+        )
+        return midpoints.reshape(-1, 3), normal_elements.reshape(-1, 3)
+
+    def _refined(self, index, subdivisions):
+        """Geometria (em cache) do segmento index dividido em subdivisions partes."""
+        key = (index, subdivisions)
+        if key not in self._refined_cache:
+            midpoints, normal_elements = self._segments(
+                self.t_edges[index:index + 1], self.t_edges[index + 1:index + 2], subdivisions
+            )
+            self._refined_cache[key] = (midpoints, self.orientation * normal_elements)
+        return self._refined_cache[key]
+
+    def flux(self, field_function, charge_positions=()):
+        """
+        Calcula o fluxo de um campo pela curva.
+
+        Parâmetros:
+        field_function: campo vetorizado pontos (N, 3) -> (N, 3)
+        charge_positions: posições das singularidades do campo, usadas para
+                          decidir onde refinar
+
+        Retorna:
+        Fluxo (float)
+        """
+        positions = np.asarray(charge_positions, dtype=float).reshape(-1, 3)
+        levels = _refinement_levels(
+            self.midpoints, self.lengths, positions, self.refine_factor, self.max_subdivisions
+        )
+        coarse = levels == 1
+        sample_points = [self.midpoints[coarse]]
+        elements = [self.normal_elements[coarse]]
+        for index in np.flatnonzero(~coarse):
+            midpoints, normal_elements = self._refined(index, levels[index])
+            sample_points.append(midpoints)
+            elements.append(normal_elements)
+        sample_points = np.concatenate(sample_points)
+        elements = np.concatenate(elements)
+        return float(np.einsum("nk,nk->", field_function(sample_points), elements))
+
+    def charges_flux(self, positions, magnitudes):
+        """
+        Fluxo do campo plano (q r / |r|²) de cargas pontuais pela curva.
+
+        Para esse campo, o fluxo por um segmento é q vezes o ângulo com sinal que
+        ele subtende visto da carga, então a soma sobre a poligonal é exata, sem
+        corte nem refinamento, mesmo com a carga junto do contorno. Vale 2π·Q_int
+        para as cargas dentro da curva.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+        starts = self.vertices[None, :-1, :2] - positions[:, None, :2]
+        ends = self.vertices[None, 1:, :2] - positions[:, None, :2]
+        cross = starts[..., 0] * ends[..., 1] - starts[..., 1] * ends[..., 0]
+        dot = np.einsum("msk,msk->ms", starts, ends)
+        angles = np.arctan2(cross, dot).sum(axis=1)
+        return float(self.orientation * np.dot(magnitudes, angles))
+
+
+def polar_curve(r, scale=1.0, angle=0.0, about_point=ORIGIN):
+    """
+    Curva polar vetorizada θ -> r(θ)(cos θ, sin θ, 0), com a mesma escala e
+    rotação (em torno de about_point) aplicadas a um mobject por scale/rotate.
+    """
+    matrix = scale * rotation_matrix(angle, OUT)
+    about_point = np.asarray(about_point, dtype=float)
+
+    def func(theta):
+        radius = r(theta)
+        points = np.stack([radius * np.cos(theta), radius * np.sin(theta), np.zeros_like(theta)], axis=-1)
+        return about_point + (points - about_point) @ matrix.T
+
+    return func
+
+
+def polygon_curve(vertices):
+    """
+    Polígono fechado como curva vetorizada t ∈ [0, len(vertices)] -> pontos;
+    cada unidade de t percorre uma aresta.
+    """
+    vertices = np.asarray(vertices, dtype=float)
+    closed = np.concatenate([vertices, vertices[:1]])
+    knots = np.arange(len(closed))
+
+    def func(t):
+        return np.stack([np.interp(t, knots, closed[:, k]) for k in range(3)], axis=-1)
+
+    return func
+
+
+# ============================================================
+# 3. FLUXO POR UMA MALHA FECHADA (3D)
+# ============================================================
+
+class MeshFlux:
+    """
+    Fluxo ∯ E·dA através de uma malha fechada de quadriláteros (por exemplo
+    um GridSurface), com o mesmo esquema de CurveFlux: centros e vetores área
+    das faces guardados em arrays e faces próximas de cargas subdivididas.
+
+    Parâmetros:
+    corners: vértices das faces (F, 4, 3), ou um GridSurface
+    refine_factor, max_subdivisions: como em CurveFlux
+    """
+
+    def __init__(self, corners, refine_factor=2.0, max_subdivisions=16):
+        if hasattr(corners, "get_face_corners"):
+            corners = corners.get_face_corners()
+        self.corners = np.asarray(corners, dtype=float)
+        self.refine_factor = refine_factor
+        self.max_subdivisions = max_subdivisions
+        self.centers, self.area_vectors = self._faces(self.corners)
+        self.sizes = np.sqrt(np.linalg.norm(self.area_vectors, axis=1))
+
+        # Orientação: volume com sinal positivo = normais para fora
+        signed_volume = np.einsum("nk,nk->", self.centers, self.area_vectors) / 3
+        self.orientation = 1.0 if signed_volume >= 0 else -1.0
+        self.area_vectors *= self.orientation
+        self.triangles = mesh_triangles(self.corners)
+        self._refined_cache = {}
+
+    @staticmethod
+    def _faces(corners):
+        """Centros (F, 3) e vetores área (F, 3) de quadriláteros (F, 4, 3)."""
+        centers = corners.mean(axis=1)
+        area_vectors = 0.5 * np.cross(corners[:, 2] - corners[:, 0], corners[:, 3] - corners[:, 1])
+        return centers, area_vectors
+
+    def _refined(self, index, subdivisions):
+        """Face index dividida bilinearmente em subdivisions × subdivisions partes (em cache)."""
+        key = (index, subdivisions)
+        if key not in self._refined_cache:
+            a, b, c, d = self.corners[index]
+            s = np.linspace(0, 1, subdivisions + 1)
+            u, v = np.meshgrid(s, s, indexing="ij")
+            u, v = u[..., None], v[..., None]
+            grid = (1 - u) * (1 - v) * a + u * (1 - v) * b + u * v * c + (1 - u) * v * d
+            sub_corners = np.stack([
+                grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:],
+            ], axis=2).reshape(-1, 4, 3)
+            centers, area_vectors = self._faces(sub_corners)
+            self._refined_cache[key] = (centers, self.orientation * area_vectors)
+        return self._refined_cache[key]
+
+    def flux(self, field_function, charge_positions=()):
+        """Fluxo de um campo vetorizado pela malha (ver CurveFlux.flux)."""
+        positions = np.asarray(charge_positions, dtype=float).reshape(-1, 3)
+        levels = _refinement_levels(
+            self.centers, self.sizes, positions, self.refine_factor, self.max_subdivisions
+        )
+        coarse = levels == 1
+        sample_points = [self.centers[coarse]]
+        elements = [self.area_vectors[coarse]]
+        for index in np.flatnonzero(~coarse):
+            centers, area_vectors = self._refined(index, levels[index])
+            sample_points.append(centers)
+            elements.append(area_vectors)
+        sample_points = np.concatenate(sample_points)
+        elements = np.concatenate(elements)
+        return float(np.einsum("nk,nk->", field_function(sample_points), elements))
+
+    def charges_flux(self, positions, magnitudes):
+        """
+        Fluxo do campo de Coulomb (q r / |r|³) de cargas pontuais pela malha.
+
+        Como em CurveFlux.charges_flux, o fluxo por cada triângulo é q vezes o
+        ângulo sólido que ele subtende visto da carga (exato, sem corte). Vale
+        4π·Q_int para as cargas dentro da superfície.
+        """
+        positions = np.asarray(positions, dtype=float).reshape(-1, 3)
+        magnitudes = np.asarray(magnitudes, dtype=float).reshape(-1)
+        solid_angles = np.array([
+            triangle_solid_angles(*(self.triangles - position).transpose(1, 0, 2)).sum()
+            for position in positions
+        ]).reshape(-1)
+        return float(self.orientation * np.dot(magnitudes, solid_angles))
+
+
+def charges_flux_function(integrator, charges):
+    """
+    Função sem argumentos com o fluxo atual das cargas (objetos Charge) pelo
+    integrador - pronta para LiveReadout.
+    """
+    def current_flux():
+        positions = [charge.get_center() for charge in charges]
+        magnitudes = [charge.magnitude for charge in charges]
+        return integrator.charges_flux(positions, magnitudes)
+
+    return current_flux
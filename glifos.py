@@ -0,0 +1,233 @@
+# UTILITÁRIO: Glifos de campo vetorial em estrutura de arrays (struct-of-arrays)
+from manim import *
+import numpy as np
+
+
+# ============================================================
+# 1. FUNÇÕES AUXILIARES DE GEOMETRIA
+# ============================================================
+
+def grid_points(x_range, y_range, z_range):
+    """
+    Gera os pontos de uma grade 3D na mesma ordem do laço triplo
+    "for x ... for y ... for z" usado nas cenas.
+
+    Parâmetros:
+    x_range, y_range, z_range: valores de cada eixo (arrays 1D)
+
+    Retorna:
+    Array (N, 3) com os pontos da grade
+    """
+    grid = np.meshgrid(x_range, y_range, z_range, indexing="ij")
+    return np.stack(grid, axis=-1).reshape(-1, 3).astype(float)
+
+
+def _orthonormal_frames(directions):
+    """
+    Calcula, para cada direção, uma base ortonormal (u, v, w) em que u é a
+    direção normalizada e v, w são perpendiculares a ela.
+    """
+    norms = np.linalg.norm(directions, axis=1, keepdims=True)
+    u = directions / np.maximum(norms, 1e-8)
+    # Eixo auxiliar: Z, exceto quando a direção é quase paralela a ele
+    helper = np.where(np.abs(u[:, 2:3]) < 0.9, OUT, RIGHT)
+    v = np.cross(u, helper)
+    v /= np.linalg.norm(v, axis=1, keepdims=True)
+    w = np.cross(u, v)
+    return u, v, w
+
+
+def closed_polygons_to_bezier(corners):
+    """
+    Converte polígonos fechados (N, F, K, 3) em pontos de Bézier cúbicas
+    (N, F, K*4, 3): cada polígono no mesmo formato de
+    VMobject.set_points_as_corners.
+    """
+    nxt = np.roll(corners, -1, axis=2)
+    delta = nxt - corners
+    segments = np.stack(
+        [corners, corners + delta / 3, corners + 2 * delta / 3, nxt],
+        axis=3,
+    )
+    n, f = corners.shape[:2]
+    return segments.reshape(n, f, -1, 3)
+
+
+# ============================================================
+# 2. MOBJECT DE GLIFOS DO CAMPO VETORIAL
+# ============================================================
+
+class FieldGlyphs(VGroup):
+    """
+    Conjunto de setas 3D de um campo vetorial armazenado como arrays contíguos.
+
+    Pontos iniciais, direções, cores e opacidades ficam em arrays (N, 3) e (N,);
+    a geometria de todas as setas (haste + cone) é gerada em uma única passada
+    vetorizada. Cada seta é um VGroup com uma face por ThreeDVMobject, como em
+    Arrow3D (faces em um mesmo VMobject se anulam no preenchimento e recebem
+    um único sombreamento), mas com bem menos faces.
+
+    Parâmetros:
+    starts: pontos iniciais das setas (N, 3)
+    directions: vetores das setas, (N, 3) ou um único vetor (3,)
+    color: cor comum a todas as setas
+    colors: cores RGB individuais (N, 3), opcional
+    opacity: opacidade comum ou array (N,)
+    thickness: raio da haste (equivalente ao de Arrow3D)
+    tip_height: altura do cone da ponta
+    tip_radius: raio da base do cone
+    resolution: número de segmentos da circunferência
+    """
+
+    def __init__(
+        self,
+        starts,
+        directions,
+        color=RED,
+        colors=None,
+        opacity=1.0,
+        thickness=0.02,
+        tip_height=0.3,
+        tip_radius=0.08,
+        resolution=8,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.starts = np.array(starts, dtype=float).reshape(-1, 3)
+        n = len(self.starts)
+        self.directions = np.broadcast_to(np.asarray(directions, dtype=float), (n, 3)).copy()
+        if colors is None:
+            colors = color_to_rgb(color)
+        self.colors = np.broadcast_to(np.asarray(colors, dtype=float), (n, 3)).copy()
+        self.opacities = np.broadcast_to(np.asarray(opacity, dtype=float), (n,)).copy()
+
+        self.thickness = thickness
+        self.tip_height = tip_height
+        self.tip_radius = tip_radius
+        self.resolution = resolution
+
+        # Um grupo por seta; a geometria é atribuída em lote
+        self.add(*[self.create_glyph() for _ in range(n)])
+        self.generate_geometry()
+        self.apply_style()
+
+    def create_glyph(self):
+        """Cria o mobject de uma seta: haste, cone e base, uma face por ThreeDVMobject."""
+        return VGroup(*[ThreeDVMobject(stroke_width=0) for _ in range(2 * self.resolution + 1)])
+
+    # ------------------------------------------------------------
+    # Geometria
+    # ------------------------------------------------------------
+
+    def generate_geometry(self):
+        """Gera os pontos de todas as setas em uma única passada vetorizada."""
+        if len(self.starts) == 0:
+            return self
+        u, v, w = _orthonormal_frames(self.directions)
+        angles = np.linspace(0, TAU, self.resolution, endpoint=False)
+        ring = (
+            np.cos(angles)[None, :, None] * v[:, None, :]
+            + np.sin(angles)[None, :, None] * w[:, None, :]
+        )
+        ring_next = np.roll(ring, -1, axis=1)
+
+        start = self.starts[:, None, :]
+        tip = (self.starts + self.directions)[:, None, :]
+        base = tip - self.tip_height * u[:, None, :]
+
+        r, R = self.thickness, self.tip_radius
+        # Haste: faces laterais retangulares do cilindro
+        shaft = np.stack(
+            [start + r * ring, start + r * ring_next, base + r * ring_next, base + r * ring],
+            axis=2,
+        )
+        # Cone: faces laterais triangulares até a ponta
+        cone = np.stack(
+            [base + R * ring, base + R * ring_next, np.broadcast_to(tip, ring.shape)],
+            axis=2,
+        )
+        # Base do cone: um único polígono
+        disk = (base + R * ring)[:, None, :, :]
+
+        # Cada face recebe uma visão dos blocos contíguos de pontos
+        blocks = (
+            closed_polygons_to_bezier(shaft),
+            closed_polygons_to_bezier(cone),
+            closed_polygons_to_bezier(disk),
+        )
+        for i, glyph in enumerate(self.submobjects):
+            faces = iter(glyph.submobjects)
+            for block in blocks:
+                for face_points, face in zip(block[i], faces):
+                    face.points = face_points
+        return self
+
+    def get_starts(self):
+        """Retorna os pontos iniciais das setas (N, 3)."""
+        return self.starts
+
+    def get_ends(self):
+        """Retorna os pontos finais (pontas) das setas (N, 3)."""
+        return self.starts + self.directions
+
+    # ------------------------------------------------------------
+    # Estilo
+    # ------------------------------------------------------------
+
+    def apply_style(self, indices=None):
+        """
+        Copia cores e opacidades dos arrays para as setas.
+
+        Parâmetros:
+        indices: índices das setas a atualizar (todas, se None)
+        """
+        rgbas = np.concatenate([self.colors, self.opacities[:, None]], axis=1)
+        if indices is None:
+            indices = range(len(self.submobjects))
+        for i in indices:
+            for face in self.submobjects[i].submobjects:
+                face.fill_rgbas = rgbas[i:i + 1].copy()
+        return self
+
+    def set_opacities(self, opacities, indices=None):
+        """
+        Define a opacidade de cada seta a partir de um array.
+
+        Parâmetros:
+        opacities: opacidade comum ou array com uma entrada por índice
+        indices: índices das setas a atualizar (todas, se None)
+        """
+        if indices is None:
+            self.opacities[:] = opacities
+        else:
+            self.opacities[indices] = opacities
+        return self.apply_style(indices)
+
+    def set_opacity(self, opacity, family=True):
+        self.opacities[:] = opacity
+        return super().set_opacity(opacity, family=family)
+
+    # ------------------------------------------------------------
+    # Sincronização dos arrays com as transformações do Manim
+    # ------------------------------------------------------------
+
+    def shift(self, *vectors):
+        self.starts = self.starts + np.sum(vectors, axis=0)
+        return super().shift(*vectors)
+
+    def apply_points_function_about_point(self, func, about_point=None, about_edge=None):
+        if about_point is None:
+            if about_edge is None:
+                about_edge = ORIGIN
+            about_point = self.get_critical_point(about_edge)
+        ends = self.get_ends()
+        self.starts = func(self.starts - about_point) + about_point
+        self.directions = func(ends - about_point) + about_point - self.starts
+        return super().apply_points_function_about_point(func, about_point=about_point)
+
+    def interpolate(self, mobject1, mobject2, alpha, *args, **kwargs):
+        if isinstance(mobject1, FieldGlyphs) and isinstance(mobject2, FieldGlyphs):
+            if mobject1.starts.shape == mobject2.starts.shape:
+                self.starts = interpolate(mobject1.starts, mobject2.starts, alpha)
+                self.directions = interpolate(mobject1.directions, mobject2.directions, alpha)
+        return super().interpolate(mobject1, mobject2, alpha, *args, **kwargs)
@@ -0,0 +1,161 @@
+# UTILITÁRIO: Camada de sobreposição 2D (HUD) com cache de rasterização para cenas 3D
+from manim import *
+from manim.utils.family import extract_mobject_family_members
+import numpy as np
+import itertools as it
+
+
+# ============================================================
+# 1. CÂMERA COM CAMADA HUD
+# ============================================================
+
+class HudCamera(ThreeDCamera):
+    """
+    ThreeDCamera que desenha os elementos HUD (fixos no quadro) em camadas
+    RGBA separadas, uma por elemento registrado. Cada camada é rasterizada
+    uma vez e reaproveitada enquanto o conteúdo do seu elemento (pontos e
+    estilo) não mudar; a cada quadro as camadas em cache são apenas compostas
+    sobre a imagem 3D. Uma leitura ao vivo só redesenha a própria camada.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.hud_mobjects = []
+        self._hud_families = {}
+        self._hud_layers = {}
+
+    def add_hud_mobjects(self, *mobjects):
+        """Registra elementos HUD (uma única vez por elemento)."""
+        for mobject in mobjects:
+            if mobject not in self.hud_mobjects:
+                self.hud_mobjects.append(mobject)
+                self._register_family(mobject)
+        return self
+
+    def remove_hud_mobjects(self, *mobjects):
+        """Remove elementos HUD da camada."""
+        for mobject in mobjects:
+            if mobject in self.hud_mobjects:
+                self.hud_mobjects.remove(mobject)
+                self._hud_families.pop(id(mobject), None)
+                self._hud_layers.pop(id(mobject), None)
+        self.remove_fixed_in_frame_mobjects(*mobjects)
+        return self
+
+    def _register_family(self, mobject):
+        """
+        Marca a família do elemento como fixa no quadro. Só é refeito quando a
+        família muda (por exemplo, depois de um become() ou de um
+        DecimalNumber que recria os dígitos); os membros que saíram da família
+        deixam de ser fixos, para que o conjunto não cresça a cada quadro.
+        """
+        family = mobject.get_family()
+        previous = self._hud_families.get(id(mobject))
+        if previous is not None and len(previous) == len(family) and all(
+            old is new for old, new in zip(previous, family)
+        ):
+            return
+        if previous is not None:
+            current = {id(member) for member in family}
+            for member in previous:
+                if id(member) not in current:
+                    self.fixed_in_frame_mobjects.discard(member)
+        self._hud_families[id(mobject)] = family
+        self.add_fixed_in_frame_mobjects(mobject)
+
+    # ------------------------------------------------------------
+    # Captura do quadro
+    # ------------------------------------------------------------
+
+    def capture_mobjects(self, mobjects, **kwargs):
+        if not self.hud_mobjects:
+            return super().capture_mobjects(mobjects, **kwargs)
+
+        present_ids = {id(m) for m in extract_mobject_family_members(mobjects)}
+        layers = []
+        for hud in self.hud_mobjects:
+            self._register_family(hud)
+            members = [m for m in hud.get_family() if id(m) in present_ids]
+            if members:
+                layers.append((hud, members))
+
+        excluded = list(kwargs.pop("excluded_mobjects", None) or [])
+        excluded += [m for _, members in layers for m in members]
+        super().capture_mobjects(mobjects, excluded_mobjects=excluded, **kwargs)
+        for hud, members in layers:
+            self._composite_layer(hud, members)
+
+    def _content_key(self, members):
+        """Assinatura do conteúdo visível (pontos e estilo; sem identidade dos objetos)."""
+        parts = []
+        for m in members:
+            parts.append(m.points.tobytes())
+            for attr in ("fill_rgbas", "stroke_rgbas", "stroke_width"):
+                value = getattr(m, attr, None)
+                if value is not None:
+                    parts.append(np.asarray(value).tobytes())
+        return hash(tuple(parts))
+
+    def _composite_layer(self, hud, members):
+        """Compõe a camada de um elemento HUD, re-rasterizando-a só se o conteúdo mudou."""
+        layer = self._hud_layers.get(id(hud))
+        if layer is None or layer["buffer"].shape != self.pixel_array.shape:
+            layer = {"key": None, "buffer": np.zeros_like(self.pixel_array), "box": None}
+            self._hud_layers[id(hud)] = layer
+
+        key = self._content_key(members)
+        if key != layer["key"]:
+            layer["key"] = key
+            buffer = layer["buffer"]
+            if layer["box"] is not None:
+                buffer[layer["box"]] = 0  # Só a região ocupada antes precisa ser limpa
+            to_display = self.get_mobjects_to_display(members, include_submobjects=False)
+            for group_type, group in it.groupby(to_display, self.type_or_raise):
+                self.display_funcs[group_type](list(group), buffer)
+            alpha = buffer[:, :, 3]
+            rows = np.flatnonzero(alpha.any(axis=1))
+            cols = np.flatnonzero(alpha.any(axis=0))
+            if len(rows) == 0:
+                layer["box"] = None
+            else:
+                layer["box"] = (
+                    slice(rows[0], rows[-1] + 1),
+                    slice(cols[0], cols[-1] + 1),
+                )
+
+        box = layer["box"]
+        if box is None:
+            return
+        # Composição "over" com alfa pré-multiplicado (formato do Cairo)
+        source = layer["buffer"][box].astype(np.uint16)
+        target = self.pixel_array[box]
+        inverse_alpha = 255 - source[:, :, 3:4]
+        rgb = source[:, :, :3] + (target[:, :, :3].astype(np.uint16) * inverse_alpha + 127) // 255
+        target[:, :, :3] = np.minimum(rgb, 255).astype(np.uint8)
+        target[:, :, 3] = np.maximum(target[:, :, 3], source[:, :, 3].astype(np.uint8))
+
+
+# ============================================================
+# 2. CENA 3D COM CAMADA HUD
+# ============================================================
+
+class HudScene(ThreeDScene):
+    """
+    ThreeDScene com camada HUD. Os elementos são registrados uma única vez com
+    add_hud(), sem atualizadores chamando add_fixed_in_frame_mobjects a cada quadro.
+    """
+
+    def __init__(self, camera_class=HudCamera, **kwargs):
+        super().__init__(camera_class=camera_class, **kwargs)
+
+    def add_hud(self, *mobjects):
+        """Adiciona elementos à cena como HUD (fixos no quadro, rasterizados em cache)."""
+        self.add_fixed_in_frame_mobjects(*mobjects)
+        self.renderer.camera.add_hud_mobjects(*mobjects)
+        return self
+
+    def remove_hud(self, *mobjects):
+        """Remove elementos HUD da cena."""
+        self.remove(*mobjects)
+        self.renderer.camera.remove_hud_mobjects(*mobjects)
+        return self
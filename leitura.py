@@ -0,0 +1,95 @@
+# UTILITÁRIO: Leitura numérica rápida (prefixo LaTeX fixo + dígitos de um atlas de glifos)
+from manim import *
+import numpy as np
+
+
+# Caracteres disponíveis no atlas de glifos
+ATLAS_CHARACTERS = "0123456789.-"
+
+
+class LiveReadout(VGroup):
+    """
+    Leitura numérica ao vivo no formato "<prefixo> <valor>", por exemplo
+    "\\Phi = 0.71".
+
+    O prefixo e todos os dígitos são compostos em LaTeX uma única vez (em um
+    mesmo MathTex, para compartilharem a linha de base). A cada quadro o valor
+    é formatado; se o texto mudou, os dígitos são montados copiando os glifos
+    do atlas, sem nova compilação LaTeX nem leitura de SVG.
+
+    Parâmetros:
+    prefix: parte constante em LaTeX (por exemplo r"\\Phi = ")
+    value: função sem argumentos ou ValueTracker com o valor a exibir
+    num_decimal_places: número de casas decimais
+    **kwargs: argumentos repassados ao MathTex (font_size, color, ...)
+    """
+
+    # Atlas compartilhado entre leituras com o mesmo prefixo e estilo
+    _atlas_cache = {}
+
+    def __init__(self, prefix, value, num_decimal_places=2, **kwargs):
+        super().__init__()
+        if isinstance(value, ValueTracker):
+            tracker = value
+            value = tracker.get_value
+        self.value_function = value
+        self.num_decimal_places = num_decimal_places
+
+        atlas = self._get_atlas(prefix, **kwargs)
+        self.prefix = atlas[0].copy()
+        self.templates = {
+            char: glyph.copy() for char, glyph in zip(ATLAS_CHARACTERS, atlas[1:])
+        }
+
+        # Métricas medidas no próprio atlas
+        digits = [self.templates[c] for c in "0123456789"]
+        gaps = [b.get_left()[0] - a.get_right()[0] for a, b in zip(digits, digits[1:])]
+        self.glyph_gap = float(np.median(gaps))
+        self.first_glyph_offset = digits[0].get_left()[0] - self.prefix.get_right()[0]
+        self.reference_left = self.prefix.get_left()
+        self.reference_width = self.prefix.width
+
+        self.digits = VGroup()
+        self.text = None
+        self.add(self.prefix, self.digits)
+        self.update_value()
+        self.add_updater(lambda m: m.update_value())
+
+    @classmethod
+    def _get_atlas(cls, prefix, **kwargs):
+        """Compõe (uma vez) o prefixo e os glifos do atlas em um único MathTex."""
+        key = (prefix, tuple(sorted((k, str(v)) for k, v in kwargs.items())))
+        if key not in cls._atlas_cache:
+            cls._atlas_cache[key] = MathTex(prefix, *ATLAS_CHARACTERS, **kwargs)
+        return cls._atlas_cache[key]
+
+    def format_value(self, value):
+        """Formata o valor com o número de casas decimais definido."""
+        return f"{value:.{self.num_decimal_places}f}"
+
+    def update_value(self):
+        """Atualiza os dígitos; não faz nada se o texto exibido não mudou."""
+        text = self.format_value(self.value_function())
+        if text == self.text:
+            return self
+        self.text = text
+
+        # Monta os dígitos no sistema de coordenadas do atlas
+        glyphs = []
+        cursor = self.reference_left[0] + self.reference_width + self.first_glyph_offset
+        for char in text:
+            if char not in self.templates:
+                continue
+            glyph = self.templates[char].copy()
+            glyph.shift(RIGHT * (cursor - glyph.get_left()[0]))
+            cursor = glyph.get_right()[0] + self.glyph_gap
+            glyphs.append(glyph)
+
+        # Leva os dígitos para a posição e escala atuais do prefixo
+        digits = VGroup(*glyphs)
+        scale = self.prefix.width / self.reference_width
+        digits.shift(self.prefix.get_left() - self.reference_left)
+        digits.scale(scale, about_point=self.prefix.get_left())
+        digits.set_fill(self.prefix.get_fill_color(), opacity=self.prefix.get_fill_opacity())
+        self.digits.set_submobjects(glyphs)
+        return self
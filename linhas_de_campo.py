@@ -0,0 +1,150 @@
+# UTILITÁRIO: Linhas de campo radiais (vetorizadas e memorizadas) de uma carga pontual
+from manim import *
+import numpy as np
+from functools import lru_cache
+from glifos import FieldGlyphs
+
+
+@lru_cache(maxsize=None)
+def radial_directions(n_theta=8, n_phi=16):
+    """
+    Direções unitárias das linhas de campo radiais.
+
+    Usa θ em linspace(0, π, n_theta) e φ em linspace(0, 2π, n_phi), excluindo os
+    extremos de cada intervalo, mais as duas direções dos polos (+Z e -Z).
+
+    Retorna:
+    Array (N, 3) somente leitura, compartilhado entre todas as chamadas
+    """
+    theta = np.linspace(0, PI, n_theta)[1:-1]   # Exclui θ=0 e θ=π (polos)
+    phi = np.linspace(0, 2*PI, n_phi)[1:-1]     # Exclui φ=0 e φ=2π
+    t, p = np.meshgrid(theta, phi, indexing="ij")
+    directions = np.stack([
+        np.sin(t) * np.cos(p),
+        np.sin(t) * np.sin(p),
+        np.cos(t),
+    ], axis=-1).reshape(-1, 3)
+    # Polos tratados à parte
+    directions = np.concatenate([directions, [OUT, IN]])
+    directions.setflags(write=False)
+    return directions
+
+
+def radial_endpoints(radii, extension=1.5, n_theta=8, n_phi=16):
+    """
+    Calcula de uma só vez os pontos finais das linhas de campo para vários raios.
+
+    Cada linha vai da carga até o ponto da esfera de raio r, prolongada por
+    "extension" na direção radial.
+
+    Parâmetros:
+    radii: raios das superfícies gaussianas (sequência de M valores)
+
+    Retorna:
+    Array (M, N, 3) com os vetores das linhas para cada raio
+    """
+    lengths = np.asarray(radii, dtype=float) + extension
+    return lengths[:, None, None] * radial_directions(n_theta, n_phi)[None, :, :]
+
+
+def _members_with_points(mobject):
+    """Membros da família que têm geometria própria (as faces das setas)."""
+    return [member for member in mobject.get_family() if len(member.points)]
+
+
+@lru_cache(maxsize=32)
+def _unit_radial_field_lines(n_theta, n_phi, color, thickness, resolution):
+    """
+    Constrói uma única vez as setas radiais de comprimento 1 a partir da origem.
+
+    Cada ponto de uma seta radial é afim no comprimento L: a ponta e o cone
+    deslizam ao longo da direção e os anéis da haste não mudam. Basta então
+    p(L) = p(1) + (L - 1) * a, com a = p(2) - p(1).
+
+    Retorna:
+    (FieldGlyphs de comprimento 1, pontos p(1) (P, 3), variação a (P, 3))
+    """
+    directions = radial_directions(n_theta, n_phi)
+    glyphs = [
+        FieldGlyphs(
+            starts=np.zeros_like(directions),
+            directions=length * directions,
+            color=color,
+            thickness=thickness,
+            resolution=resolution,
+        )
+        for length in (1.0, 2.0)
+    ]
+    unit_points, double_points = (
+        np.concatenate([member.points for member in _members_with_points(glyph)])
+        for glyph in glyphs
+    )
+    return glyphs[0], unit_points, double_points - unit_points
+
+
+def radial_field_lines_points(radii, extension=1.5, n_theta=8, n_phi=16, center=ORIGIN,
+                              color=RED, thickness=0.01, resolution=8):
+    """
+    Pontos de todas as faces das linhas de campo para vários raios de uma vez,
+    a partir da geometria unitária (mesma ordem das faces do FieldGlyphs).
+
+    Retorna:
+    Array (M, P, 3), um bloco de pontos por raio
+    """
+    _, unit_points, slope = _unit_radial_field_lines(n_theta, n_phi, color, thickness, resolution)
+    lengths = np.asarray(radii, dtype=float) + extension
+    return (
+        unit_points[None, :, :]
+        + (lengths - 1)[:, None, None] * slope[None, :, :]
+        + np.asarray(center, dtype=float)
+    )
+
+
+@lru_cache(maxsize=32)
+def _build_radial_field_lines(radius, extension, n_theta, n_phi, center, color, thickness, resolution):
+    unit, _, _ = _unit_radial_field_lines(n_theta, n_phi, color, thickness, resolution)
+    points = radial_field_lines_points(
+        [radius], extension, n_theta, n_phi, center, color, thickness, resolution,
+    )[0]
+    field_lines = unit.copy()
+    field_lines.starts = np.tile(center, (len(unit.starts), 1))
+    field_lines.directions = radial_endpoints([radius], extension, n_theta, n_phi)[0]
+    offset = 0
+    for member in _members_with_points(field_lines):
+        member.points = points[offset:offset + len(member.points)]
+        offset += len(member.points)
+    return field_lines
+
+
+def radial_field_lines(
+    radius,
+    extension=1.5,
+    n_theta=8,
+    n_phi=16,
+    center=ORIGIN,
+    color=RED,
+    thickness=0.01,
+    resolution=8,
+):
+    """
+    Cria as linhas de campo radiais de uma carga pontual como um FieldGlyphs.
+
+    A geometria das setas é gerada uma única vez para direções unitárias e só
+    deslocada ao longo de cada direção para o raio pedido. O resultado é
+    memorizado pelos parâmetros; chamadas repetidas recebem uma cópia do
+    mobject já construído, sem recalcular a geometria.
+
+    Parâmetros:
+    radius: raio da superfície gaussiana que as linhas atravessam
+    extension: prolongamento das linhas além da superfície
+    n_theta, n_phi: amostragem dos ângulos polar e azimutal
+    center: posição da carga
+    color, thickness, resolution: aparência das setas
+
+    Retorna:
+    FieldGlyphs com uma seta por direção radial
+    """
+    return _build_radial_field_lines(
+        float(radius), float(extension), n_theta, n_phi,
+        tuple(np.asarray(center, dtype=float)), str(color), thickness, resolution,
+    ).copy()
@@ -0,0 +1,69 @@
+# UTILITÁRIO: Nível de detalhe (LOD) das malhas de acordo com a qualidade de renderização
+from manim import *
+import numpy as np
+import os
+
+
+# Fração da resolução pedida usada em cada qualidade de renderização (só os
+# rascunhos são reduzidos; -qh e acima usam a resolução cheia)
+QUALITY_LOD = {
+    "low": 0.35,         # -ql (480p15): rascunho
+    "medium": 0.6,       # -qm (720p30)
+    "high": 1.0,         # -qh (1080p60)
+    "production": 1.0,   # -qp (1440p60) e -qk (2160p60)
+}
+
+# Variável de ambiente para forçar um fator (por exemplo MANIM_LOD=1 para resolução cheia)
+LOD_ENVIRONMENT_VARIABLE = "MANIM_LOD"
+
+
+def quality_level():
+    """Nível de qualidade atual, deduzido da altura em pixels da configuração."""
+    height = config["pixel_height"]
+    if height <= 480:
+        return "low"
+    if height <= 720:
+        return "medium"
+    if height <= 1080:
+        return "high"
+    return "production"
+
+
+def lod_factor():
+    """Fator de LOD atual (variável MANIM_LOD, se definida, ou o da qualidade)."""
+    override = os.environ.get(LOD_ENVIRONMENT_VARIABLE)
+    if override:
+        return float(override)
+    return QUALITY_LOD[quality_level()]
+
+
+def _scale(value, factor, minimum, maximum=None):
+    scaled = max(minimum, int(np.ceil(value * factor)))
+    return scaled if maximum is None else min(scaled, maximum)
+
+
+def lod_resolution(resolution, minimum=4):
+    """
+    Resolução pedida ajustada ao LOD da qualidade atual.
+
+    Parâmetros:
+    resolution: inteiro (segmentos de um Arrow3D/FieldGlyphs) ou par (u_res, v_res)
+    minimum: resolução mínima em cada direção
+
+    Retorna:
+    Inteiro ou tupla, no mesmo formato da entrada
+    """
+    factor = lod_factor()
+    if isinstance(resolution, (int, np.integer)):
+        return min(int(resolution), _scale(resolution, factor, minimum))
+    return tuple(min(int(r), _scale(r, factor, minimum)) for r in resolution)
+
+
+def lod_sphere(radius=1, resolution=(30, 30), minimum=6, **kwargs):
+    """
+    Sphere com a resolução pedida ajustada ao LOD da qualidade atual.
+
+    Parâmetros:
+    **kwargs: repassados a Sphere
+    """
+    return Sphere(radius=radius, resolution=lod_resolution(resolution, minimum), **kwargs)
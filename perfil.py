@@ -0,0 +1,294 @@
+# UTILITÁRIO: Perfil de updaters, always_redraw, self.play e rasterização (opcional)
+#
+# Uso:
+#   python perfil.py open_flux                       # relatório ordenado pelo tempo total
+#   python perfil.py campo_E_3D --sort per_frame --csv perfil.csv
+#   python perfil.py carga_2D --trace carga_2D.speedscope.json
+#
+# O arquivo de trace abre em https://www.speedscope.app (formato "evented"),
+# com os updaters e a rasterização aninhados dentro de cada self.play.
+#
+# Em código: profiler = Profiler(); profiler.instrument(scene); scene.render()
+import argparse
+import csv
+import json
+import sys
+import time
+
+from render_lote import QUALITIES, discover_scenes, load_scene_class
+
+
+# ============================================================
+# 1. COLETOR
+# ============================================================
+
+class Profiler:
+    """
+    Coleta, por item instrumentado, número de chamadas, tempo acumulado, maior
+    chamada e blocos de memória alocados (saldo de sys.getallocatedblocks), e
+    registra os eventos de abertura/fechamento para o trace.
+
+    Parâmetros:
+    trace: se False, não guarda os eventos (menos memória em cenas longas)
+    """
+
+    def __init__(self, trace=True):
+        self.trace = trace
+        self.frames = []            # Quadros do trace (nome, arquivo, linha)
+        self.frame_index = {}
+        self.stats = {}
+        self.events = []
+        self.rendered_frames = 0
+        self.start = time.perf_counter()
+
+    def _frame(self, name, location):
+        key = (name, location)
+        if key not in self.frame_index:
+            self.frame_index[key] = len(self.frames)
+            file, _, line = (location or "").rpartition(":")
+            frame = {"name": name}
+            if file:
+                frame.update({"file": file, "line": int(line)})
+            self.frames.append(frame)
+            self.stats[key] = {"calls": 0, "total": 0.0, "max": 0.0, "allocated_blocks": 0}
+        return self.frame_index[key]
+
+    def measure(self, name, location, function, *args, **kwargs):
+        """Executa function(*args, **kwargs) medindo tempo e alocações."""
+        index = self._frame(name, location)
+        blocks = sys.getallocatedblocks()
+        start = time.perf_counter()
+        if self.trace:
+            self.events.append({"type": "O", "frame": index, "at": (start - self.start) * 1e3})
+        try:
+            return function(*args, **kwargs)
+        finally:
+            end = time.perf_counter()
+            if self.trace:
+                self.events.append({"type": "C", "frame": index, "at": (end - self.start) * 1e3})
+            stats = self.stats[(name, location)]
+            stats["calls"] += 1
+            stats["total"] += end - start
+            stats["max"] = max(stats["max"], end - start)
+            stats["allocated_blocks"] += sys.getallocatedblocks() - blocks
+
+    # ------------------------------------------------------------
+    # Instrumentação
+    # ------------------------------------------------------------
+
+    def wrap_updater(self, mobject, updater):
+        """Envolve um updater preservando a assinatura (com ou sem dt)."""
+        from manim.utils.simple_functions import get_parameters
+
+        if getattr(updater, "_profiled", False):
+            return updater
+        name, location = describe_updater(mobject, updater)
+        if "dt" in get_parameters(updater):
+            def wrapper(m, dt):
+                return self.measure(name, location, updater, m, dt)
+        else:
+            def wrapper(m):
+                return self.measure(name, location, updater, m)
+        wrapper._profiled = True
+        wrapper.__wrapped__ = updater
+        return wrapper
+
+    def instrument_updaters(self, mobjects):
+        """Envolve os updaters ainda não instrumentados das famílias dadas."""
+        for mobject in mobjects:
+            for member in mobject.get_family():
+                if member.updaters and not all(getattr(u, "_profiled", False) for u in member.updaters):
+                    member.updaters = [self.wrap_updater(member, u) for u in member.updaters]
+
+    def instrument(self, scene):
+        """
+        Instrumenta uma cena ainda não renderizada: self.play (inclusive
+        self.wait e move_camera), updaters de mobjects e da cena, rasterização
+        e gravação de quadros.
+        """
+        renderer = scene.renderer
+        original_play = renderer.play
+        original_play_internal = scene.play_internal
+        original_update_frame = renderer.update_frame
+        original_add_frame = renderer.add_frame
+        original_update_self = scene.update_self
+        plays = [0]
+
+        def play(scene_, *args, **kwargs):
+            self.instrument_updaters(scene_.mobjects)
+            names = ", ".join(type(arg).__name__ for arg in args) or "play"
+            name = f"play[{plays[0]}] {names}"
+            plays[0] += 1
+            return self.measure(name, None, original_play, scene_, *args, **kwargs)
+
+        def play_internal(*args, **kwargs):
+            # Mobjects trazidos pelas próprias animações
+            self.instrument_updaters(scene.mobjects)
+            return original_play_internal(*args, **kwargs)
+
+        def update_frame(*args, **kwargs):
+            return self.measure("rasterização (update_frame)", None, original_update_frame, *args, **kwargs)
+
+        def add_frame(frame, num_frames=1):
+            if not renderer.skip_animations:
+                self.rendered_frames += num_frames
+            return self.measure("gravação (add_frame)", None, original_add_frame, frame, num_frames)
+
+        def update_self(dt):
+            for updater in scene.updaters:
+                if not getattr(updater, "_profiled", False):
+                    scene.updaters[scene.updaters.index(updater)] = self._wrap_scene_updater(updater)
+            return original_update_self(dt)
+
+        renderer.play = play
+        scene.play_internal = play_internal
+        renderer.update_frame = update_frame
+        renderer.add_frame = add_frame
+        scene.update_self = update_self
+        return scene
+
+    def _wrap_scene_updater(self, updater):
+        code = getattr(updater, "__code__", None)
+        location = f"{code.co_filename}:{code.co_firstlineno}" if code else None
+
+        def wrapper(dt):
+            return self.measure(f"cena: {getattr(updater, '__qualname__', repr(updater))}", location, updater, dt)
+
+        wrapper._profiled = True
+        return wrapper
+
+    # ------------------------------------------------------------
+    # Saídas
+    # ------------------------------------------------------------
+
+    def report_rows(self, sort="total"):
+        """Linhas do relatório, ordenadas pela coluna dada (decrescente)."""
+        frames = max(self.rendered_frames, 1)
+        rows = []
+        for (name, location), stats in self.stats.items():
+            if not stats["calls"]:
+                continue
+            rows.append({
+                "name": name,
+                "location": location or "",
+                "calls": stats["calls"],
+                "total": stats["total"],
+                "mean": stats["total"] / stats["calls"],
+                "per_frame": stats["total"] / frames,
+                "max": stats["max"],
+                "allocs": stats["allocated_blocks"],
+            })
+        return sorted(rows, key=lambda row: row[sort], reverse=True)
+
+    def print_report(self, sort="total", limit=40):
+        """Imprime o relatório (tempos em ms)."""
+        print(f"Quadros renderizados: {self.rendered_frames}")
+        print(f"{'Item':<56} {'Chamadas':>9} {'Total':>10} {'Média':>9} {'/Quadro':>9} {'Máx':>9} {'Blocos':>9}")
+        for row in self.report_rows(sort)[:limit]:
+            print(
+                f"{row['name'][:56]:<56} {row['calls']:>9} {row['total'] * 1e3:>10.1f} "
+                f"{row['mean'] * 1e3:>9.3f} {row['per_frame'] * 1e3:>9.3f} {row['max'] * 1e3:>9.2f} {row['allocs']:>9}"
+            )
+
+    def write_csv(self, path, sort="total"):
+        """Grava o relatório completo em CSV (para ordenar/filtrar em planilhas)."""
+        rows = self.report_rows(sort)
+        with open(path, "w", newline="", encoding="utf-8") as out:
+            writer = csv.DictWriter(out, fieldnames=list(rows[0]) if rows else ["name"])
+            writer.writeheader()
+            writer.writerows(rows)
+
+    def write_speedscope(self, path, name="manim"):
+        """Grava o trace no formato de arquivo do speedscope (perfil "evented")."""
+        end = self.events[-1]["at"] if self.events else 0.0
+        document = {
+            "$schema": "https://www.speedscope.app/file-format-schema.json",
+            "shared": {"frames": self.frames},
+            "profiles": [{
+                "type": "evented",
+                "name": name,
+                "unit": "milliseconds",
+                "startValue": 0.0,
+                "endValue": end,
+                "events": self.events,
+            }],
+            "name": name,
+            "activeProfileIndex": 0,
+            "exporter": "perfil.py",
+        }
+        with open(path, "w", encoding="utf-8") as out:
+            json.dump(document, out)
+
+
+def describe_updater(mobject, updater):
+    """
+    Nome legível e local (arquivo:linha) de um updater. Para always_redraw,
+    usa a função que recria o mobject.
+    """
+    function = getattr(updater, "func", updater)
+    qualname = getattr(function, "__qualname__", type(function).__qualname__)
+    code = getattr(function, "__code__", None) or getattr(getattr(type(function), "__call__", None), "__code__", None)
+    if qualname.startswith("always_redraw."):
+        for cell in function.__closure__ or ():
+            inner = cell.cell_contents
+            if callable(inner) and hasattr(inner, "__code__"):
+                qualname = f"always_redraw({inner.__qualname__})"
+                code = inner.__code__
+                break
+    location = f"{code.co_filename}:{code.co_firstlineno}" if code else None
+    return f"{type(mobject).__name__}: {qualname}", location
+
+
+# ============================================================
+# 2. LINHA DE COMANDO
+# ============================================================
+
+def profile_scene(name, module, quality="l", max_animations=None, trace=True):
+    """Renderiza a cena (sem gravar vídeo) com a instrumentação ativa."""
+    from manim import tempconfig
+    from render_segmentos import enable_exact_skipping
+
+    options = {
+        "quality": QUALITIES[quality],
+        "progress_bar": "none",
+        "write_to_movie": False,
+        "save_last_frame": False,
+        "disable_caching": True,
+    }
+    profiler = Profiler(trace=trace)
+    with tempconfig(options):
+        scene = load_scene_class(module, name)()
+        if max_animations is not None:
+            enable_exact_skipping(scene, max_animations)
+        profiler.instrument(scene)
+        scene.render()
+    return profiler
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Perfil de updaters, animações e rasterização de uma cena.")
+    parser.add_argument("scene", help="nome da cena (por exemplo open_flux)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade")
+    parser.add_argument("--max-animations", type=int, default=None, help="perfila só as primeiras N animações")
+    parser.add_argument("--sort", default="total", choices=["total", "calls", "mean", "per_frame", "max", "allocs"])
+    parser.add_argument("--limit", type=int, default=40, help="linhas do relatório impresso")
+    parser.add_argument("--csv", help="grava o relatório completo em CSV")
+    parser.add_argument("--trace", help="grava o trace no formato do speedscope")
+    args = parser.parse_args(argv)
+
+    scenes = {scene["name"]: scene for scene in discover_scenes()}
+    if args.scene not in scenes:
+        raise SystemExit(f"Cena desconhecida: {args.scene}")
+    profiler = profile_scene(
+        args.scene, scenes[args.scene]["module"], args.quality, args.max_animations, trace=bool(args.trace)
+    )
+    profiler.print_report(args.sort, args.limit)
+    if args.csv:
+        profiler.write_csv(args.csv, args.sort)
+    if args.trace:
+        profiler.write_speedscope(args.trace, args.scene)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,269 @@
+# UTILITÁRIO: Modo de prévia rápida (rascunho) para as cenas 3D
+#
+# Uso pela linha de comando (mesmos argumentos do manim):
+#   python previa.py animacao_3.py campo_E_3D
+#   python previa.py animacao_1.py open_flux --fps 15     # opções do manim têm precedência
+#
+# Na prévia:
+# - resolução e taxa de quadros reduzidas (PREVIEW_CONFIG);
+# - Arrow3D e as setas de FieldGlyphs viram setas planas (linhas com ponta);
+# - esferas viram malhas de arame (meridianos e paralelos, sem faces);
+# - a câmera 3D não ordena os objetos pela profundidade nem aplica sombreamento.
+# Nenhuma animação é pulada: cada self.play, move_camera e rotação ambiente
+# mantém a duração exata, só com menos quadros por segundo.
+#
+# Em código: enable_preview() ANTES de importar os módulos das cenas.
+import sys
+
+import numpy as np
+
+
+# Configuração da prévia (também usada com tempconfig)
+PREVIEW_CONFIG = {
+    "pixel_width": 480,
+    "pixel_height": 270,
+    "frame_rate": 10,
+}
+
+# Paralelos e meridianos das esferas de arame, e pontos por curva
+WIRE_PARALLELS = 6
+WIRE_MERIDIANS = 12
+WIRE_SAMPLES = 24
+
+# Espessura mínima das linhas (em pixels), para que nada desapareça na prévia
+MIN_STROKE_WIDTH = 1.0
+
+
+# ============================================================
+# 1. FUNÇÕES AUXILIARES
+# ============================================================
+
+def line_width(thickness):
+    """Espessura de linha equivalente ao raio (thickness) de uma haste 3D."""
+    return max(MIN_STROKE_WIDTH, 200 * thickness)
+
+
+def open_polylines_to_bezier(corners):
+    """
+    Converte polilinhas abertas (M, K, 3) em pontos de Bézier cúbicas
+    (M*(K-1)*4, 3); cada polilinha fica em um sub-caminho próprio.
+    """
+    start, end = corners[:, :-1], corners[:, 1:]
+    delta = end - start
+    segments = np.stack([start, start + delta / 3, start + 2 * delta / 3, end], axis=2)
+    return segments.reshape(-1, 3)
+
+
+# ============================================================
+# 2. SUBSTITUTOS DE RASCUNHO
+# ============================================================
+
+def _preview_classes():
+    """Cria as classes de rascunho (depende do manim, importado só aqui)."""
+    from manim import Arrow, ThreeDVMobject, VMobject, ORIGIN, LEFT, RIGHT, TAU, PI, WHITE, BLUE
+    from glifos import FieldGlyphs, _orthonormal_frames
+
+    class PreviewArrow3D(Arrow):
+        """
+        Seta plana com a mesma assinatura de Arrow3D.
+
+        Parâmetros:
+        thickness: convertido em espessura de linha
+        height: comprimento da ponta
+        resolution, base_radius e demais opções de superfície são ignorados
+        """
+
+        def __init__(
+            self,
+            start=LEFT,
+            end=RIGHT,
+            thickness=0.02,
+            height=0.3,
+            base_radius=0.08,
+            color=WHITE,
+            resolution=24,
+            **kwargs,
+        ):
+            for name in ("checkerboard_colors", "fill_opacity", "should_make_jagged"):
+                kwargs.pop(name, None)
+            super().__init__(
+                start,
+                end,
+                buff=0,
+                color=color,
+                stroke_width=line_width(thickness),
+                tip_length=height,
+                max_tip_length_to_length_ratio=0.5,
+                max_stroke_width_to_length_ratio=100,
+                **kwargs,
+            )
+
+    class WireframeSphere(VMobject):
+        """
+        Esfera de arame com a mesma assinatura de Sphere: meridianos e
+        paralelos em um único VMobject, sem faces (nada a preencher).
+        Cor e opacidade de preenchimento pedidas pela cena vão para o traço.
+
+        Parâmetros:
+        resolution: (u_res, v_res) limita o número de meridianos e paralelos
+        """
+
+        min_opacity = 0.3  # Esferas quase transparentes continuam visíveis
+
+        def __init__(
+            self,
+            center=ORIGIN,
+            radius=1,
+            resolution=None,
+            u_range=(0, TAU),
+            v_range=(0, PI),
+            color=BLUE,
+            stroke_width=MIN_STROKE_WIDTH,
+            **kwargs,
+        ):
+            for name in ("checkerboard_colors", "fill_color", "fill_opacity", "should_make_jagged"):
+                kwargs.pop(name, None)
+            super().__init__(stroke_color=color, stroke_width=max(stroke_width, MIN_STROKE_WIDTH), **kwargs)
+            self.radius = radius
+            u_res, v_res = resolution if resolution is not None else (WIRE_MERIDIANS, WIRE_PARALLELS + 1)
+            meridians = np.linspace(*u_range, min(u_res, WIRE_MERIDIANS), endpoint=False)
+            parallels = np.linspace(*v_range, min(v_res, WIRE_PARALLELS + 1) + 1)[1:-1]
+            t_u = np.linspace(*u_range, WIRE_SAMPLES)
+            t_v = np.linspace(*v_range, WIRE_SAMPLES)
+
+            def surface(u, v):
+                return radius * np.stack([np.cos(u) * np.sin(v), np.sin(u) * np.sin(v), np.cos(v)], axis=-1)
+
+            curves = np.concatenate([
+                surface(meridians[:, None], t_v[None, :]),
+                surface(t_u[None, :], parallels[:, None]),
+            ])
+            self.set_points(open_polylines_to_bezier(curves) + np.asarray(center, dtype=float))
+            self.wired = True
+
+        def set_fill(self, color=None, opacity=None, family=True):
+            super().set_fill(opacity=0, family=family)
+            if getattr(self, "wired", False) and (color is not None or opacity is not None):
+                if opacity is not None:
+                    opacity = max(opacity, self.min_opacity)
+                self.set_stroke(color=color, opacity=opacity, family=family)
+            return self
+
+        def set_opacity(self, opacity, family=True):
+            return self.set_stroke(opacity=max(opacity, self.min_opacity), family=family)
+
+    class LineFieldGlyphs(FieldGlyphs):
+        """FieldGlyphs desenhados como setas planas: haste e duas farpas na ponta."""
+
+        def create_glyph(self):
+            return ThreeDVMobject(stroke_width=0)
+
+        def generate_geometry(self):
+            if len(self.starts) == 0:
+                return self
+            u, v, _ = _orthonormal_frames(self.directions)
+            start = self.starts
+            tip = self.starts + self.directions
+            base = tip - self.tip_height * u
+            corners = np.stack([
+                np.stack([start, tip], axis=1),
+                np.stack([base + self.tip_radius * v, tip], axis=1),
+                np.stack([base - self.tip_radius * v, tip], axis=1),
+            ], axis=1)  # (N, 3 linhas, 2, 3)
+            points = open_polylines_to_bezier(corners.reshape(-1, 2, 3)).reshape(len(start), -1, 3)
+            for glyph, glyph_points in zip(self.submobjects, points):
+                glyph.points = glyph_points
+            return self
+
+        def apply_style(self, indices=None):
+            rgbas = np.concatenate([self.colors, self.opacities[:, None]], axis=1)
+            if indices is None:
+                indices = range(len(self.submobjects))
+            width = line_width(self.thickness)
+            for i in indices:
+                glyph = self.submobjects[i]
+                glyph.stroke_rgbas = rgbas[i:i + 1].copy()
+                glyph.fill_rgbas = np.zeros((1, 4))
+                glyph.stroke_width = width
+            return self
+
+    return PreviewArrow3D, WireframeSphere, LineFieldGlyphs
+
+
+# ============================================================
+# 3. ATIVAÇÃO
+# ============================================================
+
+_enabled = {}
+
+
+def _replace_everywhere(original, replacement):
+    """
+    Troca a classe no pacote manim e nos módulos já importados que a
+    trouxeram com "from ... import *" (os módulos internos do manim ficam
+    intactos, para não afetar subclasses como Dot3D).
+    """
+    for name, module in list(sys.modules.items()):
+        if module is None or (name.startswith("manim.") and name != "manim"):
+            continue
+        for attribute, value in list(getattr(module, "__dict__", {}).items()):
+            if value is original:
+                setattr(module, attribute, replacement)
+
+
+def is_preview_enabled():
+    """Indica se os substitutos de rascunho estão ativos neste processo."""
+    return bool(_enabled.get("patched"))
+
+
+def enable_preview(set_config=True):
+    """
+    Ativa o modo de prévia. Deve ser chamada antes de importar os módulos das
+    cenas (que copiam Arrow3D, Sphere e FieldGlyphs ao importar).
+
+    Parâmetros:
+    set_config: se True, aplica PREVIEW_CONFIG à configuração global
+    """
+    import manim
+    from manim import Camera, ThreeDCamera, config
+    import glifos
+
+    if set_config:
+        for key, value in PREVIEW_CONFIG.items():
+            config[key] = value
+    if _enabled.get("patched"):
+        return
+    _enabled["patched"] = True
+
+    PreviewArrow3D, WireframeSphere, LineFieldGlyphs = _preview_classes()
+    _replace_everywhere(manim.Arrow3D, PreviewArrow3D)
+    _replace_everywhere(manim.Sphere, WireframeSphere)
+    _replace_everywhere(glifos.FieldGlyphs, LineFieldGlyphs)
+
+    # Sem ordenação por profundidade (transparência) e sem sombreamento 3D
+    def get_mobjects_to_display(self, *args, **kwargs):
+        return Camera.get_mobjects_to_display(self, *args, **kwargs)
+
+    def modified_rgbas(self, vmobject, rgbas):
+        return rgbas
+
+    ThreeDCamera.get_mobjects_to_display = get_mobjects_to_display
+    ThreeDCamera.modified_rgbas = modified_rgbas
+
+
+def main():
+    """Executa a CLI do manim em modo de prévia."""
+    enable_preview(set_config=False)
+    from manim.__main__ import main as manim_main
+
+    preview_options = [
+        "--resolution", f"{PREVIEW_CONFIG['pixel_width']},{PREVIEW_CONFIG['pixel_height']}",
+        "--frame_rate", str(PREVIEW_CONFIG["frame_rate"]),
+    ]
+    # As opções do usuário vêm depois e prevalecem
+    sys.argv = ["manim", "render", *preview_options, *sys.argv[1:]]
+    return manim_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,304 @@
+# UTILITÁRIO: Renderização em lote de todas as cenas, em paralelo (pool de processos)
+#
+# Uso:
+#   python render_lote.py                      # todas as cenas, qualidade baixa
+#   python render_lote.py -j 6 -q h            # 6 processos, qualidade alta
+#   python render_lote.py -s campo_E_3D=k      # qualidade específica por cena
+#   python render_lote.py carga_2D dipolo_2D   # apenas algumas cenas
+import argparse
+import ast
+import importlib
+import json
+import multiprocessing
+import os
+import statistics
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from glob import glob
+
+
+# Diretório do repositório (as cenas importam os utilitários pelo nome do módulo)
+REPO_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# Arquivo com as durações medidas nas últimas renderizações, por cena e qualidade (para o escalonamento)
+HISTORY_FILE = os.path.join(REPO_DIR, ".render_tempos.json")
+
+# Letras de qualidade da CLI do manim -> valor de config["quality"]
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+# ============================================================
+# 1. DESCOBERTA DAS CENAS (SEM IMPORTAR O MANIM)
+# ============================================================
+
+def _call_duration(call):
+    """Duração estática de self.play / self.wait / self.move_camera (em segundos)."""
+    name = call.func.attr
+    for keyword in call.keywords:
+        if keyword.arg in ("run_time", "duration") and isinstance(keyword.value, ast.Constant):
+            return float(keyword.value.value)
+    if name == "wait" and call.args and isinstance(call.args[0], ast.Constant):
+        return float(call.args[0].value)
+    return 1.0
+
+
+def estimate_duration(class_node):
+    """
+    Estima a duração de uma cena somando os self.play, self.wait e
+    self.move_camera do código (run_time/duração explícitos ou 1 s).
+    """
+    total = 0.0
+    for node in ast.walk(class_node):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Attribute)
+            and isinstance(node.func.value, ast.Name)
+            and node.func.value.id == "self"
+            and node.func.attr in ("play", "wait", "move_camera")
+        ):
+            total += _call_duration(node)
+    return total
+
+
+def discover_scenes(pattern="animacao_*.py"):
+    """
+    Encontra as classes de cena dos arquivos de animação (classes cuja base
+    termina em "Scene"), lendo apenas o código-fonte.
+
+    Retorna:
+    Lista de dicionários {"name", "module", "file", "estimate"}
+    """
+    scenes = []
+    for path in sorted(glob(os.path.join(REPO_DIR, pattern))):
+        with open(path, encoding="utf-8") as source:
+            tree = ast.parse(source.read(), filename=path)
+        for node in tree.body:
+            if not isinstance(node, ast.ClassDef):
+                continue
+            bases = [base.id if isinstance(base, ast.Name) else getattr(base, "attr", "") for base in node.bases]
+            if any(base.endswith("Scene") for base in bases):
+                scenes.append({
+                    "name": node.name,
+                    "module": os.path.splitext(os.path.basename(path))[0],
+                    "file": path,
+                    "estimate": estimate_duration(node),
+                })
+    return scenes
+
+
+def history_key(name, quality):
+    """Chave do histórico: a mesma cena leva tempos muito diferentes em cada qualidade."""
+    return f"{name}@{quality}"
+
+
+def load_history():
+    """Durações (s de relógio) das últimas renderizações, por cena e qualidade."""
+    if not os.path.exists(HISTORY_FILE):
+        return {}
+    with open(HISTORY_FILE, encoding="utf-8") as history:
+        return json.load(history)
+
+
+def save_history(results):
+    """Atualiza o histórico com as durações das cenas renderizadas com sucesso."""
+    history = load_history()
+    for result in results:
+        if result["ok"]:
+            history[history_key(result["name"], result["quality"])] = result["seconds"]
+    with open(HISTORY_FILE, "w", encoding="utf-8") as out:
+        json.dump(history, out, indent=2, sort_keys=True)
+
+
+def predicted_seconds(jobs, history=None):
+    """
+    Prevê o tempo de relógio de cada trabalho: o medido na última renderização
+    da mesma cena na mesma qualidade ou, na falta dele, a estimativa estática
+    (segundos de animação) convertida pela razão mediana medido / estimativa
+    das cenas com histórico (na mesma qualidade; se não houver, em qualquer
+    uma). Sem histórico para nenhum trabalho, todos usam só a estimativa; as
+    previsões ficam sempre na mesma unidade.
+
+    Retorna:
+    Lista com a previsão de cada trabalho, na ordem
+    """
+    history = history or {}
+    measured = [history.get(history_key(job["name"], job["quality"])) for job in jobs]
+    ratios = {}
+    for job, seconds in zip(jobs, measured):
+        if seconds is not None and job["estimate"] > 0:
+            ratios.setdefault(job["quality"], []).append(seconds / job["estimate"])
+    overall = [ratio for values in ratios.values() for ratio in values]
+    predictions = []
+    for job, seconds in zip(jobs, measured):
+        if seconds is None:
+            scale = statistics.median(ratios.get(job["quality"]) or overall or [1.0])
+            seconds = job["estimate"] * scale
+        predictions.append(seconds)
+    return predictions
+
+
+def schedule(jobs, history=None):
+    """Ordena os trabalhos do mais longo para o mais curto (LPT), pelo tempo previsto."""
+    predictions = predicted_seconds(jobs, history)
+    order = sorted(range(len(jobs)), key=lambda index: predictions[index], reverse=True)
+    return [jobs[index] for index in order]
+
+
+# ============================================================
+# 2. RENDERIZAÇÃO DE UMA CENA (EXECUTADA NO PROCESSO FILHO)
+# ============================================================
+
+def load_scene_class(module_name, class_name):
+    """Importa o módulo de animação e retorna a classe da cena."""
+    if REPO_DIR not in sys.path:
+        sys.path.insert(0, REPO_DIR)
+    return getattr(importlib.import_module(module_name), class_name)
+
+
+def render_scene(job):
+    """
+    Renderiza uma cena com a configuração dada.
+
+    Parâmetros:
+    job: dicionário com "name", "module", "quality" e, opcionalmente,
+         "config" (outras chaves de config do manim) e "cache_mb" (limite do
+         cache de animações por conteúdo, ver cache_animacoes.py)
+
+    Retorna:
+    Dicionário com "name", "quality", "ok", "seconds", "output" e "error"
+    """
+    start = time.perf_counter()
+    result = {"name": job["name"], "quality": job["quality"], "output": None, "error": None}
+    try:
+        from manim import tempconfig
+
+        options = {"quality": QUALITIES[job["quality"]], "progress_bar": "none"}
+        options.update(job.get("config", {}))
+        with tempconfig(options):
+            if job.get("cache_mb"):
+                from cache_animacoes import enable_animation_cache
+
+                enable_animation_cache(job["cache_mb"])
+            scene = load_scene_class(job["module"], job["name"])()
+            scene.render()
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+        result["ok"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+# ============================================================
+# 3. EXECUÇÃO EM PARALELO E RESUMO
+# ============================================================
+
+def render_all(jobs, workers=None):
+    """
+    Distribui as cenas entre processos; as mais longas são enviadas primeiro.
+    Cada processo é criado com "spawn" (configuração global do manim isolada).
+
+    Retorna:
+    Lista de resultados na ordem de término
+    """
+    workers = workers or os.cpu_count()
+    context = multiprocessing.get_context("spawn")
+    results = []
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        futures = [pool.submit(render_scene, job) for job in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            status = "ok" if result["ok"] else "FALHOU"
+            print(f"[{status}] {result['name']} ({result['quality']}) em {result['seconds']:.1f} s", flush=True)
+            results.append(result)
+    return results
+
+
+def print_summary(results, wall_time):
+    """Imprime o resumo final da renderização em lote."""
+    cpu_time = sum(result["seconds"] for result in results)
+    print()
+    print(f"{'Cena':<16} {'Qual.':<6} {'Tempo (s)':>10}  Resultado")
+    for result in sorted(results, key=lambda result: result["seconds"], reverse=True):
+        outcome = result["output"] if result["ok"] else result["error"].strip().splitlines()[-1]
+        print(f"{result['name']:<16} {result['quality']:<6} {result['seconds']:>10.1f}  {outcome}")
+    print()
+    print(f"Tempo total (relógio): {wall_time:.1f} s | soma das cenas: {cpu_time:.1f} s "
+          f"| aceleração: {cpu_time / max(wall_time, 1e-9):.2f}x")
+    failures = [result["name"] for result in results if not result["ok"]]
+    if failures:
+        print("Falhas: " + ", ".join(failures))
+
+
+def parse_overrides(items):
+    """Converte ["cena=q", ...] em {"cena": "q"}."""
+    overrides = {}
+    for item in items or []:
+        name, _, quality = item.partition("=")
+        if quality not in QUALITIES:
+            raise SystemExit(f"Qualidade inválida para {name}: {quality!r} (use {', '.join(QUALITIES)})")
+        overrides[name] = quality
+    return overrides
+
+
+def build_jobs(scenes, quality, overrides, config=None, cache_mb=None):
+    """Cria os trabalhos de renderização (qualidade padrão ou específica por cena)."""
+    return [
+        {
+            "name": scene["name"],
+            "module": scene["module"],
+            "quality": overrides.get(scene["name"], quality),
+            "estimate": scene["estimate"],
+            "config": dict(config or {}),
+            "cache_mb": cache_mb,
+        }
+        for scene in scenes
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza todas as cenas em paralelo.")
+    parser.add_argument("scenes", nargs="*", help="cenas a renderizar (padrão: todas)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="número de processos (padrão: núcleos)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade padrão")
+    parser.add_argument("-s", "--scene-quality", action="append", metavar="CENA=Q",
+                        help="qualidade específica de uma cena (pode repetir)")
+    parser.add_argument("--summary", help="grava o resumo em JSON neste arquivo")
+    parser.add_argument("--cache-mb", type=float, default=4096,
+                        help="limite do cache de animações por conteúdo em MB (0 desativa)")
+    args = parser.parse_args(argv)
+
+    scenes = discover_scenes()
+    if args.scenes:
+        unknown = set(args.scenes) - {scene["name"] for scene in scenes}
+        if unknown:
+            raise SystemExit("Cenas desconhecidas: " + ", ".join(sorted(unknown)))
+        scenes = [scene for scene in scenes if scene["name"] in args.scenes]
+
+    jobs = schedule(
+        build_jobs(scenes, args.quality, parse_overrides(args.scene_quality), cache_mb=args.cache_mb or None),
+        load_history(),
+    )
+    start = time.perf_counter()
+    results = render_all(jobs, args.workers)
+    wall_time = time.perf_counter() - start
+
+    save_history(results)
+    print_summary(results, wall_time)
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as out:
+            json.dump({"wall_time": wall_time, "results": results}, out, indent=2)
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,271 @@
+# UTILITÁRIO: Renderização paralela dos quadros de animações determinísticas
+#
+# Uso:
+#   python render_quadros.py open_flux -j 8 -q h
+#
+# A cena é executada normalmente neste processo. Quando um self.play é
+# determinístico (cada quadro depende apenas do instante da animação - sem
+# updaters com dt, sem rotação ambiente da câmera, sem condição de parada),
+# seus quadros são divididos entre processos: cada processo reconstrói o
+# estado da cena até esse self.play (sem rasterizar), rasteriza só a sua fatia
+# de quadros e grava os pixels em disco. Este processo avança o estado da
+# animação sem rasterizar e entrega os quadros, em ordem, ao codificador: cada
+# fatia é codificada assim que fica pronta e seus arquivos são apagados logo
+# em seguida, então o disco guarda no máximo as fatias ainda não entregues.
+#
+# Cada processo paga a reconstrução do estado (as animações anteriores são
+# percorridas sem rasterizar) e a troca de quadros pelo disco; o ganho depende
+# da cena. Para medir contra a renderização serial, sem cache nos dois casos:
+#   python render_quadros.py open_flux -j 8 --compare-serial
+import argparse
+import multiprocessing
+import os
+import shutil
+import sys
+import tempfile
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from render_lote import QUALITIES, discover_scenes, load_scene_class
+from render_segmentos import enable_exact_skipping
+
+
+# Número mínimo de quadros para valer a pena distribuir um self.play
+MIN_FRAMES = 48
+
+
+# ============================================================
+# 1. DETECÇÃO DE ANIMAÇÕES DETERMINÍSTICAS
+# ============================================================
+
+def has_time_dependent_updaters(scene):
+    """Indica se a cena ou algum mobject dela (ou das animações) tem updater com dt."""
+    from manim.utils.simple_functions import get_parameters
+
+    if scene.updaters:  # Updaters da própria cena sempre recebem dt
+        return True
+    mobjects = list(scene.mobjects)
+    mobjects += [animation.mobject for animation in scene.animations or []]
+    for mobject in mobjects:
+        for member in mobject.get_family():
+            for updater in member.updaters:
+                if "dt" in get_parameters(updater):
+                    return True
+    return False
+
+
+def is_deterministic_play(scene):
+    """
+    Um self.play (já compilado) é determinístico quando cada quadro é função
+    apenas do instante t: não é uma espera congelada, não tem condição de
+    parada e nenhum updater depende de dt.
+    """
+    if scene.renderer.skip_animations or scene.stop_condition is not None:
+        return False
+    if scene.is_current_animation_frozen_frame():
+        return False
+    return not has_time_dependent_updaters(scene)
+
+
+def frame_times(scene):
+    """Instantes dos quadros do self.play atual (os mesmos da renderização serial)."""
+    from manim import config
+
+    run_time = scene.get_run_time(scene.animations)
+    return np.arange(0, run_time, 1 / config["frame_rate"])
+
+
+# ============================================================
+# 2. TAREFA DOS PROCESSOS: RASTERIZAR UMA FATIA DE QUADROS
+# ============================================================
+
+def render_frames(job):
+    """
+    Reconstrói a cena até o self.play de índice job["play"] e rasteriza os
+    quadros job["frames"] (índices), gravando cada um em job["directory"].
+
+    Retorna:
+    Dicionário com "frames", "ok", "seconds" e "error"
+    """
+    from manim import tempconfig
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    start_time = time.perf_counter()
+    result = {"frames": job["frames"], "error": None}
+    options = {
+        "quality": QUALITIES[job["quality"]],
+        "progress_bar": "none",
+        "write_to_movie": False,
+        "disable_caching": True,
+        "from_animation_number": job["play"],
+    }
+    options.update(job.get("config", {}))
+    try:
+        with tempconfig(options):
+            scene = load_scene_class(job["module"], job["name"])()
+            enable_exact_skipping(scene)
+            renderer = scene.renderer
+            original_play_internal = scene.play_internal
+
+            def play_internal(skip_rendering=False):
+                if renderer.num_plays != job["play"]:
+                    return original_play_internal(skip_rendering)
+                times = frame_times(scene)
+                for index in job["frames"]:
+                    scene.update_to_time(times[index])
+                    renderer.update_frame(scene, scene.moving_mobjects)
+                    np.save(os.path.join(job["directory"], f"{index:06d}.npy"), renderer.get_frame())
+                raise EndSceneEarlyException()
+
+            scene.play_internal = play_internal
+            scene.render()
+        result["ok"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+
+# ============================================================
+# 3. ORQUESTRAÇÃO NO PROCESSO PRINCIPAL
+# ============================================================
+
+def enable_frame_parallelism(scene, job, pool, workers, min_frames=MIN_FRAMES, log=None):
+    """
+    Faz os self.play determinísticos da cena terem os quadros rasterizados
+    pelo pool de processos. Os demais seguem o caminho normal.
+
+    Parâmetros:
+    scene: cena (neste processo) a ser renderizada
+    job: "name", "module", "quality" e "config" da cena, para os processos
+    pool: ProcessPoolExecutor criado com "spawn"
+    workers: número de fatias de quadros por self.play
+    min_frames: self.play com menos quadros são renderizados aqui mesmo
+    log: lista opcional que recebe um registro por self.play distribuído
+    """
+    renderer = scene.renderer
+    original_play_internal = scene.play_internal
+
+    def play_internal(skip_rendering=False):
+        times = frame_times(scene)
+        if skip_rendering or len(times) < min_frames or not is_deterministic_play(scene):
+            return original_play_internal(skip_rendering)
+
+        play_index = renderer.num_plays
+        start_time = time.perf_counter()
+        directory = tempfile.mkdtemp(prefix=f"{job['name']}_play_{play_index:03d}_")
+        try:
+            slices = [
+                [int(index) for index in frames]
+                for frames in np.array_split(np.arange(len(times)), workers) if len(frames)
+            ]
+            futures = [
+                pool.submit(render_frames, {
+                    **job,
+                    "play": play_index,
+                    "frames": frames,
+                    "directory": directory,
+                })
+                for frames in slices
+            ]
+            # Enquanto os processos rasterizam, o estado da animação avança aqui
+            original_play_internal(skip_rendering=True)
+            # Fatias consumidas na ordem dos quadros: cada uma vai para o
+            # codificador assim que termina, e cada arquivo é apagado em seguida
+            for frames, future in zip(slices, futures):
+                result = future.result()
+                if not result["ok"]:
+                    raise RuntimeError(f"Falha ao renderizar quadros do self.play {play_index}:\n{result['error']}")
+                for index in frames:
+                    path = os.path.join(directory, f"{index:06d}.npy")
+                    renderer.add_frame(np.load(path))
+                    os.remove(path)
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+        if log is not None:
+            log.append({"play": play_index, "frames": len(times), "seconds": time.perf_counter() - start_time})
+
+    scene.play_internal = play_internal
+    return scene
+
+
+def render_frame_parallel(name, module, quality="l", workers=None, config=None, min_frames=MIN_FRAMES):
+    """
+    Renderiza uma cena distribuindo os quadros das animações determinísticas.
+
+    Retorna:
+    Dicionário com "output", "plays" (self.play distribuídos) e "wall_time"
+    """
+    from manim import tempconfig
+
+    workers = workers or os.cpu_count()
+    job = {"name": name, "module": module, "quality": quality, "config": dict(config or {})}
+    options = {"quality": QUALITIES[quality], "progress_bar": "none"}
+    options.update(job["config"])
+    log = []
+    start_time = time.perf_counter()
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        with tempconfig(options):
+            scene = load_scene_class(module, name)()
+            enable_frame_parallelism(scene, job, pool, workers, min_frames, log)
+            scene.render()
+            output = str(scene.renderer.file_writer.movie_file_path)
+    return {"output": output, "plays": log, "wall_time": time.perf_counter() - start_time}
+
+
+def render_serial(name, module, quality="l", config=None):
+    """
+    Renderiza a cena normalmente, neste processo, em um arquivo próprio
+    (<cena>_serial), para comparação de tempo.
+
+    Retorna:
+    Dicionário com "output" e "wall_time"
+    """
+    from manim import tempconfig
+
+    options = {"quality": QUALITIES[quality], "progress_bar": "none", "output_file": f"{name}_serial"}
+    options.update(config or {})
+    start_time = time.perf_counter()
+    with tempconfig(options):
+        scene = load_scene_class(module, name)()
+        scene.render()
+        output = str(scene.renderer.file_writer.movie_file_path)
+    return {"output": output, "wall_time": time.perf_counter() - start_time}
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza uma cena com os quadros das animações determinísticas em paralelo.")
+    parser.add_argument("scene", help="nome da cena (por exemplo open_flux)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="número de processos (padrão: núcleos)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade")
+    parser.add_argument("--min-frames", type=int, default=MIN_FRAMES, help="quadros mínimos para distribuir um self.play")
+    parser.add_argument("--compare-serial", action="store_true",
+                        help="renderiza também em série (ambas sem cache) e compara os tempos")
+    args = parser.parse_args(argv)
+
+    scenes = {scene["name"]: scene for scene in discover_scenes()}
+    if args.scene not in scenes:
+        raise SystemExit(f"Cena desconhecida: {args.scene}")
+    module = scenes[args.scene]["module"]
+    config = {"disable_caching": True} if args.compare_serial else None
+    report = render_frame_parallel(
+        args.scene, module, args.quality, args.workers, config=config, min_frames=args.min_frames
+    )
+    for play in report["plays"]:
+        print(f"self.play {play['play']}: {play['frames']} quadros em paralelo, {play['seconds']:.1f} s")
+    print(f"Arquivo: {report['output']}")
+    print(f"Tempo total (relógio): {report['wall_time']:.1f} s")
+    if args.compare_serial:
+        serial = render_serial(args.scene, module, args.quality, config)
+        print(f"Série: {serial['wall_time']:.1f} s -> {serial['output']}")
+        print(f"Aceleração: {serial['wall_time'] / report['wall_time']:.2f}x")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
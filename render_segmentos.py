@@ -0,0 +1,276 @@
+# UTILITÁRIO: Renderização de uma única cena em paralelo, dividida nos limites dos self.play
+#
+# Uso:
+#   python render_segmentos.py campo_E_3D -j 8 -q h
+#
+# Funcionamento:
+# 1. Levantamento: a cena é executada sem renderizar nada, para medir a duração
+#    de cada animação (self.play / self.wait / self.move_camera).
+# 2. Segmentos: as animações são divididas em faixas contíguas de duração
+#    parecida; cada processo executa a cena desde o início, reproduzindo as
+#    animações anteriores à sua faixa sem rasterizar (mesma sequência de
+#    quadros e de updaters, portanto o mesmo estado) e renderiza só a sua faixa.
+#    Os filmes parciais vão para o cache de animações do manim.
+# 3. Montagem: uma última execução encontra todas as animações no cache e o
+#    próprio manim concatena os filmes parciais sem recodificar - o arquivo
+#    final é idêntico, byte a byte, ao de uma renderização serial.
+#
+# Os processos usam o hash de animações por conteúdo (cache_animacoes.py): o
+# hash padrão do manim muda entre execuções e a montagem não encontraria os
+# filmes parciais das faixas. A montagem confere isso: se alguma animação não
+# estiver no cache, ela falha em vez de renderizar a cena inteira em série.
+import argparse
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+
+from cache_animacoes import DEFAULT_SIZE_LIMIT_MB, enable_animation_cache
+from render_lote import QUALITIES, discover_scenes, load_scene_class
+
+
+# Limite de arquivos no cache do manim (a limpeza automática não pode apagar
+# os filmes parciais de outros processos durante a renderização)
+MAX_FILES_CACHED = 1_000_000
+
+
+# ============================================================
+# 1. REPRODUÇÃO EXATA DAS ANIMAÇÕES PULADAS
+# ============================================================
+
+def enable_exact_skipping(scene, end=None):
+    """
+    Faz as animações puladas avançarem quadro a quadro, como numa renderização
+    normal, mas sem rasterizar nem gravar nada.
+
+    Por padrão o manim pula uma animação em um único passo (dt = run_time), o
+    que altera o resultado de updaters dependentes de dt (rotação ambiente da
+    câmera, por exemplo). Aqui o estado de cada limite entre animações fica
+    igual ao da renderização serial.
+
+    Parâmetros:
+    scene: cena ainda não renderizada
+    end: índice da primeira animação que não deve ser executada (opcional)
+    """
+    from manim.utils.exceptions import EndSceneEarlyException
+
+    renderer = scene.renderer
+    original_progression = scene.get_time_progression
+    original_play_internal = scene.play_internal
+    original_play = renderer.play
+
+    def get_time_progression(run_time, description="", n_iterations=None, override_skip_animations=False):
+        return original_progression(run_time, description, n_iterations, override_skip_animations=True)
+
+    def play_internal(skip_rendering=False):
+        # Todos os quadros são percorridos, mas os pulados não são rasterizados
+        original_play_internal(skip_rendering or renderer.skip_animations)
+        if renderer.skip_animations:
+            scene.update_mobjects(0)  # Passo final que a renderização normal executa
+
+    def play(scene_, *args, **kwargs):
+        if end is not None and renderer.num_plays >= end:
+            raise EndSceneEarlyException()
+        return original_play(scene_, *args, **kwargs)
+
+    scene.get_time_progression = get_time_progression
+    scene.play_internal = play_internal
+    renderer.play = play
+    return scene
+
+
+def _require_cached(scene):
+    """
+    Faz a cena falhar na primeira animação que não estiver no cache (usada na
+    montagem, em que todas já foram renderizadas pelas faixas).
+    """
+    file_writer = scene.renderer.file_writer
+    original_is_already_cached = file_writer.is_already_cached
+
+    def is_already_cached(hash_invocation):
+        if not original_is_already_cached(hash_invocation):
+            raise RuntimeError(
+                f"Animação {scene.renderer.num_plays} ausente do cache ({hash_invocation}): "
+                "o hash mudou entre a faixa e a montagem"
+            )
+        return True
+
+    file_writer.is_already_cached = is_already_cached
+
+
+def _base_options(job):
+    options = {
+        "quality": QUALITIES[job["quality"]],
+        "progress_bar": "none",
+        "disable_caching": False,
+        "max_files_cached": MAX_FILES_CACHED,
+    }
+    options.update(job.get("config", {}))
+    return options
+
+
+# ============================================================
+# 2. TAREFAS DOS PROCESSOS
+# ============================================================
+
+def survey_scene(job):
+    """
+    Executa a cena pulando todas as animações (sem rasterizar nem gravar) e
+    mede a duração de cada uma.
+
+    Retorna:
+    Lista com a duração (s) de cada animação, na ordem
+    """
+    from manim import tempconfig
+
+    options = _base_options(job)
+    options.update({"from_animation_number": sys.maxsize, "write_to_movie": False, "disable_caching": True})
+    with tempconfig(options):
+        scene = load_scene_class(job["module"], job["name"])()
+        renderer = scene.renderer
+        original_play = renderer.play
+        durations = []
+
+        def play(scene_, *args, **kwargs):
+            start = renderer.time
+            original_play(scene_, *args, **kwargs)
+            durations.append(renderer.time - start)
+
+        renderer.play = play
+        scene.render()
+    return durations
+
+
+def render_range(job):
+    """
+    Renderiza as animações [start, end) da cena; as anteriores são
+    reproduzidas sem rasterização (ver enable_exact_skipping).
+
+    Com start = 0 e end = None é a passagem de montagem: tudo já está no cache
+    e o manim apenas concatena os filmes parciais no arquivo final. Uma
+    animação ausente do cache (hash diferente do calculado pela faixa)
+    interrompe a montagem com erro.
+
+    Retorna:
+    Dicionário com "start", "end", "ok", "seconds", "output" e "error"
+    """
+    from manim import tempconfig
+
+    start_time = time.perf_counter()
+    result = {"start": job["start"], "end": job["end"], "output": None, "error": None}
+    options = _base_options(job)
+    options["from_animation_number"] = job["start"]
+    if job["end"] is not None:
+        # Cada faixa gera também o seu próprio filme concatenado; um nome
+        # próprio evita que os processos escrevam no mesmo arquivo
+        options["output_file"] = f"{job['name']}_segmento_{job['start']:03d}_{job['end']:03d}"
+    try:
+        with tempconfig(options):
+            enable_animation_cache(job.get("cache_mb") or DEFAULT_SIZE_LIMIT_MB)
+            scene = load_scene_class(job["module"], job["name"])()
+            enable_exact_skipping(scene, job["end"])
+            if job["end"] is None:
+                _require_cached(scene)
+            scene.render()
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+        result["ok"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start_time
+    return result
+
+
+# ============================================================
+# 3. DIVISÃO EM FAIXAS E EXECUÇÃO
+# ============================================================
+
+def split_ranges(durations, n_ranges):
+    """
+    Divide as animações em até n_ranges faixas contíguas de duração parecida.
+
+    Retorna:
+    Lista de pares (início, fim) de índices de animação
+    """
+    total = sum(durations)
+    target = total / max(n_ranges, 1)
+    ranges = []
+    start = 0
+    accumulated = 0.0
+    for index, duration in enumerate(durations):
+        accumulated += duration
+        remaining_ranges = n_ranges - len(ranges) - 1
+        remaining_animations = len(durations) - index - 1
+        if accumulated >= target * (len(ranges) + 1) and remaining_ranges > 0 and remaining_animations > 0:
+            ranges.append((start, index + 1))
+            start = index + 1
+    ranges.append((start, len(durations)))
+    return ranges
+
+
+def render_segmented(name, module, quality="l", workers=None, config=None):
+    """
+    Renderiza uma cena dividindo suas animações entre processos.
+
+    Retorna:
+    Dicionário com as faixas, os resultados de cada uma, a montagem final e os tempos
+    """
+    workers = workers or os.cpu_count()
+    job = {"name": name, "module": module, "quality": quality, "config": dict(config or {})}
+    context = multiprocessing.get_context("spawn")
+    start_time = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        durations = pool.submit(survey_scene, job).result()
+        ranges = split_ranges(durations, workers)
+        # Faixas mais longas primeiro
+        ranges_by_length = sorted(ranges, key=lambda r: sum(durations[r[0]:r[1]]), reverse=True)
+        futures = [pool.submit(render_range, {**job, "start": a, "end": b}) for a, b in ranges_by_length]
+        segments = sorted((future.result() for future in futures), key=lambda result: result["start"])
+        if all(segment["ok"] for segment in segments):
+            final = pool.submit(render_range, {**job, "start": 0, "end": None}).result()
+        else:
+            final = {"ok": False, "output": None, "error": "faixa com erro", "seconds": 0.0}
+
+    # Os filmes concatenados de cada faixa não são mais necessários
+    for segment in segments:
+        if segment["output"] and os.path.exists(segment["output"]):
+            os.remove(segment["output"])
+    return {
+        "durations": durations,
+        "ranges": ranges,
+        "segments": segments,
+        "final": final,
+        "wall_time": time.perf_counter() - start_time,
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza uma cena em paralelo, por faixas de animações.")
+    parser.add_argument("scene", help="nome da cena (por exemplo campo_E_3D)")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="número de processos (padrão: núcleos)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade")
+    args = parser.parse_args(argv)
+
+    scenes = {scene["name"]: scene for scene in discover_scenes()}
+    if args.scene not in scenes:
+        raise SystemExit(f"Cena desconhecida: {args.scene}")
+    report = render_segmented(args.scene, scenes[args.scene]["module"], args.quality, args.workers)
+
+    for segment in report["segments"]:
+        status = "ok" if segment["ok"] else "FALHOU"
+        print(f"[{status}] animações {segment['start']}-{segment['end'] - 1}: {segment['seconds']:.1f} s")
+        if not segment["ok"]:
+            print(segment["error"])
+    final = report["final"]
+    if final["ok"]:
+        print(f"Montagem: {final['seconds']:.1f} s -> {final['output']}")
+    else:
+        print("Montagem não realizada: " + str(final["error"]))
+    print(f"Tempo total (relógio): {report['wall_time']:.1f} s")
+    return 0 if final["ok"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,227 @@
+# UTILITÁRIO: Saída em fluxo contínuo (MP4 fragmentado ou segmentos HLS) durante a renderização
+#
+# Uso pela linha de comando (mesmos argumentos do manim):
+#   python streaming.py animacao_3.py campo_E_3D -qh                   # MP4 fragmentado
+#   python streaming.py --stream-format hls animacao_3.py campo_E_3D   # HLS (index.m3u8)
+#   python streaming.py --stream-format hls --segment-seconds 2 animacao_1.py open_flux
+#
+# Os quadros vão direto do renderizador para um único processo ffmpeg, pelo
+# stdin, à medida que são produzidos: não há filmes parciais por animação nem
+# a concatenação final. O MP4 fragmentado pode ser aberto enquanto cresce; no
+# HLS, cada segmento fica disponível (e entra na playlist) assim que fecha.
+#
+# Como não há filmes parciais, o cache de animações do manim fica desligado
+# (e a renderização por intervalos de render_segmentos não se aplica).
+#
+# Em código: enable_streaming("hls", segment_seconds=4) antes de renderizar.
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+
+import numpy as np
+
+
+# Formatos de saída
+STREAM_FORMATS = ("fmp4", "hls")
+
+# Duração alvo de cada fragmento/segmento (segundos)
+DEFAULT_SEGMENT_SECONDS = 4.0
+
+# Preset do x264 (velocidade de codificação x tamanho)
+DEFAULT_PRESET = "veryfast"
+
+
+# ============================================================
+# 1. COMANDO DO FFMPEG
+# ============================================================
+
+def ffmpeg_command(output, width, height, frame_rate, stream_format="fmp4",
+                   segment_seconds=DEFAULT_SEGMENT_SECONDS, preset=DEFAULT_PRESET):
+    """
+    Monta o comando do ffmpeg que lê quadros RGBA crus do stdin.
+
+    Parâmetros:
+    output: arquivo .mp4 (fmp4) ou playlist .m3u8 (hls)
+    width, height: tamanho dos quadros em pixels
+    frame_rate: quadros por segundo
+    segment_seconds: intervalo entre quadros-chave (início de cada fragmento/segmento)
+
+    Retorna:
+    Lista de argumentos para subprocess
+    """
+    command = [
+        shutil.which("ffmpeg") or "ffmpeg",
+        "-y", "-loglevel", "error",
+        "-f", "rawvideo", "-pix_fmt", "rgba",
+        "-s", f"{width}x{height}", "-r", str(frame_rate),
+        "-i", "-",
+        "-an",
+        "-c:v", "libx264", "-preset", preset, "-pix_fmt", "yuv420p",
+        # Quadro-chave no início de cada segmento, para que possam ser fechados
+        "-force_key_frames", f"expr:gte(t,n_forced*{segment_seconds})",
+    ]
+    if stream_format == "hls":
+        directory = os.path.dirname(output)
+        command += [
+            "-f", "hls",
+            "-hls_time", str(segment_seconds),
+            "-hls_playlist_type", "event",
+            "-hls_segment_type", "fmp4",
+            "-hls_fmp4_init_filename", "init.mp4",
+            "-hls_segment_filename", os.path.join(directory, "segmento_%05d.m4s"),
+            output,
+        ]
+    else:
+        command += [
+            "-movflags", "frag_keyframe+empty_moov+default_base_moof",
+            "-f", "mp4",
+            output,
+        ]
+    return command
+
+
+def stream_output_path(movie_file_path, stream_format):
+    """Caminho de saída: o próprio .mp4 (fmp4) ou <cena>_hls/index.m3u8 (hls)."""
+    root, _ = os.path.splitext(str(movie_file_path))
+    if stream_format == "hls":
+        return os.path.join(f"{root}_hls", "index.m3u8")
+    return f"{root}.mp4"
+
+
+# ============================================================
+# 2. ESCRITOR DE ARQUIVO EM FLUXO
+# ============================================================
+
+_options = {"stream_format": "fmp4", "segment_seconds": DEFAULT_SEGMENT_SECONDS, "preset": DEFAULT_PRESET}
+
+
+def _streaming_writer_class():
+    """Cria a subclasse de SceneFileWriter (depende do manim, importado só aqui)."""
+    from manim import config, logger
+    from manim.scene.scene_file_writer import SceneFileWriter
+
+    class StreamingFileWriter(SceneFileWriter):
+        """
+        SceneFileWriter que mantém um único processo ffmpeg aberto durante
+        toda a cena e escreve cada quadro no stdin assim que ele é gerado.
+        """
+
+        def __init__(self, *args, **kwargs):
+            self.process = None
+            self.stream_format = _options["stream_format"]
+            self.segment_seconds = _options["segment_seconds"]
+            self.preset = _options["preset"]
+            self.stream_path = None
+            super().__init__(*args, **kwargs)
+
+        def open_stream(self, frame):
+            """Inicia o ffmpeg com o tamanho do primeiro quadro."""
+            self.stream_path = stream_output_path(self.movie_file_path, self.stream_format)
+            os.makedirs(os.path.dirname(self.stream_path), exist_ok=True)
+            height, width = frame.shape[:2]
+            command = ffmpeg_command(
+                self.stream_path, width, height, config["frame_rate"],
+                self.stream_format, self.segment_seconds, self.preset,
+            )
+            self.process = subprocess.Popen(command, stdin=subprocess.PIPE)
+            logger.info("Transmitindo quadros para %s", self.stream_path)
+
+        # Sem filmes parciais: cada animação só acrescenta quadros ao fluxo
+        def begin_animation(self, allow_write=False, file_path=None):
+            pass
+
+        def end_animation(self, allow_write=False):
+            pass
+
+        def add_partial_movie_file(self, hash_animation):
+            pass
+
+        def is_already_cached(self, hash_invocation):
+            return False
+
+        def write_frame(self, frame_or_renderer, num_frames=1):
+            if not config["write_to_movie"]:
+                return
+            frame = frame_or_renderer
+            if not isinstance(frame, np.ndarray):
+                frame = frame.get_frame()  # Renderizador OpenGL
+            if self.process is None:
+                self.open_stream(frame)
+            data = np.ascontiguousarray(frame, dtype=np.uint8).tobytes()
+            for _ in range(num_frames):
+                self.process.stdin.write(data)
+
+        def close_stream(self):
+            """Fecha o stdin e espera o ffmpeg gravar o último segmento."""
+            if self.process is None:
+                return
+            self.process.stdin.close()
+            code = self.process.wait()
+            self.process = None
+            if code != 0:
+                raise RuntimeError(f"ffmpeg terminou com código {code} ao gravar {self.stream_path}")
+
+        def combine_to_movie(self):
+            self.close_stream()
+
+        def combine_to_section_videos(self):
+            pass
+
+        def finish(self):
+            self.close_stream()
+            if self.stream_path:
+                self.print_file_ready_message(self.stream_path)
+            return None
+
+    return StreamingFileWriter
+
+
+# ============================================================
+# 3. ATIVAÇÃO
+# ============================================================
+
+def enable_streaming(stream_format="fmp4", segment_seconds=DEFAULT_SEGMENT_SECONDS, preset=DEFAULT_PRESET):
+    """
+    Faz o renderizador Cairo usar o StreamingFileWriter nas próximas cenas.
+    Pode ser chamada mais de uma vez (só as opções são atualizadas).
+    """
+    from manim import config
+    from manim.renderer.cairo_renderer import CairoRenderer
+
+    if stream_format not in STREAM_FORMATS:
+        raise ValueError(f"Formato desconhecido: {stream_format} (use {', '.join(STREAM_FORMATS)})")
+    _options.update(stream_format=stream_format, segment_seconds=segment_seconds, preset=preset)
+    config["disable_caching"] = True
+    if _options.get("writer_class"):
+        return _options["writer_class"]
+    _options["writer_class"] = writer_class = _streaming_writer_class()
+
+    original_init = CairoRenderer.__init__
+
+    def __init__(self, *args, **kwargs):
+        if not args:
+            kwargs.setdefault("file_writer_class", writer_class)
+        original_init(self, *args, **kwargs)
+
+    CairoRenderer.__init__ = __init__
+    return writer_class
+
+
+def main():
+    """Executa a CLI do manim com a saída em fluxo contínuo."""
+    parser = argparse.ArgumentParser(add_help=False)
+    parser.add_argument("--stream-format", default="fmp4", choices=STREAM_FORMATS)
+    parser.add_argument("--segment-seconds", type=float, default=DEFAULT_SEGMENT_SECONDS)
+    parser.add_argument("--preset", default=DEFAULT_PRESET)
+    args, manim_args = parser.parse_known_args()
+    enable_streaming(args.stream_format, args.segment_seconds, args.preset)
+    from manim.__main__ import main as manim_main
+
+    sys.argv = ["manim", "render", "--disable_caching", *manim_args]
+    return manim_main()
+
+
+if __name__ == "__main__":
+    sys.exit(main())
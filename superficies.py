@@ -0,0 +1,203 @@
+# UTILITÁRIO: Superfícies paramétricas avaliadas em grade (vetorizadas e com cache de malha)
+from manim import *
+import numpy as np
+from glifos import closed_polygons_to_bezier
+
+
+# Cache de malhas: chave -> array (u_res + 1, v_res + 1, 3)
+_mesh_cache = {}
+
+
+# ============================================================
+# 1. AVALIAÇÃO DA MALHA
+# ============================================================
+
+def _normalize_resolution(resolution):
+    if isinstance(resolution, int):
+        return (resolution, resolution)
+    return tuple(resolution)
+
+
+def evaluate_grid(func, u_range, v_range, resolution):
+    """
+    Avalia uma função paramétrica sobre toda a grade (u, v) de uma só vez.
+
+    A função recebe arrays U e V (mesma forma) e pode retornar:
+    - uma lista/tupla [x, y, z] de arrays (ou escalares) compatíveis com U;
+    - um array com forma (3, ...) ou (..., 3).
+
+    Retorna:
+    Array (u_res + 1, v_res + 1, 3) com os vértices da malha
+    """
+    u_res, v_res = _normalize_resolution(resolution)
+    u_values = np.linspace(*u_range[:2], u_res + 1)
+    v_values = np.linspace(*v_range[:2], v_res + 1)
+    U, V = np.meshgrid(u_values, v_values, indexing="ij")
+    result = func(U, V)
+    if isinstance(result, (list, tuple)):
+        coords = np.broadcast_arrays(*[np.asarray(c, dtype=float) for c in result], U)[:3]
+        return np.stack(coords, axis=-1)
+    result = np.asarray(result, dtype=float)
+    if result.shape == (3,) + U.shape:
+        return np.moveaxis(result, 0, -1)
+    return result.reshape(U.shape + (3,))
+
+
+def cached_grid(key, func, u_range, v_range, resolution):
+    """
+    Igual a evaluate_grid, mas memoriza a malha pela chave e pelos parâmetros.
+    A função só é avaliada na primeira chamada com a mesma chave.
+    """
+    full_key = (key, tuple(u_range), tuple(v_range), _normalize_resolution(resolution))
+    if full_key not in _mesh_cache:
+        grid = evaluate_grid(func, u_range, v_range, resolution)
+        grid.setflags(write=False)
+        _mesh_cache[full_key] = grid
+    return _mesh_cache[full_key]
+
+
+# ============================================================
+# 2. SUPERFÍCIE EM GRADE
+# ============================================================
+
+class GridSurface(VGroup):
+    """
+    Superfície paramétrica equivalente a Surface, mas avaliada em uma única
+    chamada NumPy sobre toda a grade (u, v), em vez de ponto a ponto.
+
+    Parâmetros:
+    func: função vetorizada (U, V) -> [x, y, z] (ver evaluate_grid)
+    u_range, v_range: intervalos dos parâmetros
+    resolution: número de faces em u e v (inteiro ou par)
+    mesh_key: chave opcional para memorizar a malha (funções anônimas não
+              podem ser comparadas, por isso a chave é explícita)
+    grid: malha já avaliada (u_res + 1, v_res + 1, 3); dispensa func
+    Demais parâmetros: mesmos estilos de Surface
+    """
+
+    def __init__(
+        self,
+        func=None,
+        u_range=[0, 1],
+        v_range=[0, 1],
+        resolution=32,
+        mesh_key=None,
+        grid=None,
+        fill_color=BLUE_D,
+        fill_opacity=1.0,
+        checkerboard_colors=[BLUE_D, BLUE_E],
+        stroke_color=LIGHT_GREY,
+        stroke_width=0.5,
+        **kwargs,
+    ):
+        super().__init__(**kwargs)
+        self.resolution = _normalize_resolution(resolution)
+        self.u_range = u_range
+        self.v_range = v_range
+        if grid is None:
+            if mesh_key is None:
+                grid = evaluate_grid(func, u_range, v_range, self.resolution)
+            else:
+                grid = cached_grid(mesh_key, func, u_range, v_range, self.resolution)
+        self._build_faces(np.asarray(grid, dtype=float))
+
+        self.set_fill(color=fill_color, opacity=fill_opacity)
+        self.set_stroke(color=stroke_color, width=stroke_width)
+        if checkerboard_colors:
+            self.set_fill_by_checkerboard(*checkerboard_colors, opacity=fill_opacity)
+
+    def _build_faces(self, grid):
+        """Cria as faces (quadriláteros) a partir da malha, em lote."""
+        u_res, v_res = self.resolution
+        corners = np.stack([
+            grid[:-1, :-1],
+            grid[1:, :-1],
+            grid[1:, 1:],
+            grid[:-1, 1:],
+        ], axis=2).reshape(1, u_res * v_res, 4, 3)
+        points = closed_polygons_to_bezier(corners).reshape(u_res * v_res, -1, 3)
+        faces = []
+        for index, face_points in enumerate(points):
+            face = ThreeDVMobject()
+            face.points = face_points
+            face.u_index, face.v_index = divmod(index, v_res)
+            faces.append(face)
+        self.add(*faces)
+
+    def set_fill_by_checkerboard(self, *colors, opacity=None):
+        """Colore as faces alternadamente, como Surface.set_fill_by_checkerboard."""
+        n_colors = len(colors)
+        for face in self:
+            c_index = (face.u_index + face.v_index) % n_colors
+            face.set_fill(colors[c_index], opacity=opacity)
+        return self
+
+    # ------------------------------------------------------------
+    # Grandezas geométricas por face (arrays)
+    # ------------------------------------------------------------
+
+    def get_face_corners(self):
+        """Retorna os vértices atuais de cada face (F, 4, 3)."""
+        return np.array([face.points[[0, 4, 8, 12]] for face in self])
+
+    def get_face_centers(self):
+        """Retorna os centros das faces (F, 3)."""
+        return self.get_face_corners().mean(axis=1)
+
+    def get_face_area_vectors(self):
+        """
+        Retorna os vetores área das faces (F, 3): normal multiplicada pela área,
+        calculados pelo produto vetorial das diagonais de cada quadrilátero.
+        """
+        corners = self.get_face_corners()
+        diagonal_1 = corners[:, 2] - corners[:, 0]
+        diagonal_2 = corners[:, 3] - corners[:, 1]
+        return 0.5 * np.cross(diagonal_1, diagonal_2)
+
+    def get_face_areas(self):
+        """Retorna as áreas das faces (F,)."""
+        return np.linalg.norm(self.get_face_area_vectors(), axis=1)
+
+    def get_face_normals(self):
+        """Retorna as normais unitárias das faces (F, 3)."""
+        vectors = self.get_face_area_vectors()
+        norms = np.linalg.norm(vectors, axis=1, keepdims=True)
+        return vectors / np.maximum(norms, 1e-12)
+
+
+# ============================================================
+# 3. RETALHO ESFÉRICO
+# ============================================================
+
+def _unit_sphere(u, v):
+    """Esfera unitária: u = ângulo azimutal (φ), v = ângulo polar (θ)."""
+    return [np.sin(v) * np.cos(u), np.sin(v) * np.sin(u), np.cos(v)]
+
+
+def spherical_patch(r, theta_range, phi_range, resolution=(10, 10), center=ORIGIN, **kwargs):
+    """
+    Cria um retalho (patch) retangular sobre uma esfera de raio r.
+
+    A malha da esfera unitária é memorizada pelos intervalos angulares e pela
+    resolução; retalhos que diferem apenas pelo raio reaproveitam a mesma
+    malha, apenas escalada.
+
+    Parâmetros:
+    r: raio da esfera
+    theta_range: intervalo do ângulo polar (co-latitude) em radianos
+    phi_range: intervalo do ângulo azimutal (longitude) em radianos
+    resolution: resolução da malha (u_res, v_res)
+    center: centro da esfera
+    **kwargs: estilos repassados a GridSurface
+
+    Retorna:
+    GridSurface do retalho esférico
+    """
+    unit_grid = cached_grid("unit_sphere", _unit_sphere, phi_range, theta_range, resolution)
+    return GridSurface(
+        u_range=phi_range,
+        v_range=theta_range,
+        resolution=resolution,
+        grid=r * unit_grid + np.asarray(center, dtype=float),
+        **kwargs,
+    )
@@ -0,0 +1,34 @@
+# TESTES: Ângulo sólido de uma malha esférica fechada
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from angulos_solidos import triangle_solid_angles, mesh_triangles
+
+
+def sphere_corners(radius=1.0, u_res=24, v_res=12):
+    """Quadriláteros (F, 4, 3) de uma esfera fechada (u em volta, v de polo a polo)."""
+    u = np.linspace(0, 2 * np.pi, u_res + 1)
+    v = np.linspace(0, np.pi, v_res + 1)
+    uu, vv = np.meshgrid(u, v, indexing="ij")
+    grid = radius * np.stack([np.sin(vv) * np.cos(uu), np.sin(vv) * np.sin(uu), np.cos(vv)], axis=-1)
+    return np.stack([
+        grid[:-1, :-1], grid[1:, :-1], grid[1:, 1:], grid[:-1, 1:],
+    ], axis=2).reshape(-1, 4, 3)
+
+
+def total_solid_angle(corners, observer):
+    triangles = mesh_triangles(corners) - np.asarray(observer, dtype=float)
+    return triangle_solid_angles(triangles[:, 0], triangles[:, 1], triangles[:, 2]).sum()
+
+
+def test_closed_sphere_from_centre_is_4pi():
+    assert abs(total_solid_angle(sphere_corners(), [0, 0, 0])) == pytest.approx(4 * np.pi)
+
+
+def test_closed_sphere_from_inside_point_is_4pi():
+    assert abs(total_solid_angle(sphere_corners(radius=2.0), [0.5, -0.3, 0.8])) == pytest.approx(4 * np.pi)
+
+
+def test_closed_sphere_from_outside_is_zero():
+    assert total_solid_angle(sphere_corners(), [3.0, 0, 0]) == pytest.approx(0, abs=1e-9)
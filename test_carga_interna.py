@@ -0,0 +1,45 @@
+# TESTES: Classificação de pontos do RegionIndex contra um teste direto
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from carga_interna import RegionIndex
+
+
+def brute_force_contains(point, vertices):
+    """Teste par-ímpar direto, aresta por aresta, sem grade nem faixas."""
+    x, y = point[0], point[1]
+    inside = False
+    for (x1, y1, _), (x2, y2, _) in zip(vertices, np.roll(vertices, -1, axis=0)):
+        if (y1 > y) != (y2 > y) and x < x1 + (y - y1) * (x2 - x1) / (y2 - y1):
+            inside = not inside
+    return inside
+
+
+def star(n_points=7, inner=0.8, outer=2.0):
+    angles = np.linspace(0, 2 * np.pi, 2 * n_points, endpoint=False)
+    radii = np.where(np.arange(2 * n_points) % 2 == 0, outer, inner)
+    return np.stack([radii * np.cos(angles), radii * np.sin(angles), np.zeros_like(angles)], axis=-1)
+
+
+@pytest.mark.parametrize("vertices", [
+    star(),
+    np.array([[0, 0, 0], [4, 0, 0], [4, 3, 0], [2, 1, 0], [0, 3, 0]], dtype=float),   # côncavo
+    np.array([[0, 0, 0], [0, 2, 0], [3, 2, 0], [3, 0, 0]], dtype=float),              # horário
+])
+def test_matches_brute_force(vertices):
+    rng = np.random.default_rng(0)
+    lower = vertices[:, :2].min(axis=0) - 0.5
+    upper = vertices[:, :2].max(axis=0) + 0.5
+    points = np.zeros((2000, 3))
+    points[:, :2] = rng.uniform(lower, upper, size=(2000, 2))
+
+    region = RegionIndex(vertices, resolution=16)
+    expected = np.array([brute_force_contains(point, vertices) for point in points])
+    np.testing.assert_array_equal(region.contains(points), expected)
+
+
+def test_single_point():
+    region = RegionIndex(star())
+    assert region.contains(np.array([0.1, 0.2, 0])) is True
+    assert region.contains(np.array([5.0, 0, 0])) is False
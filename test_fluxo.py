@@ -0,0 +1,35 @@
+# TESTES: Fluxo de cargas pontuais por curvas fechadas (lei de Gauss no plano)
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+from fluxo import CurveFlux, polygon_curve
+
+
+def circle(t):
+    return np.stack([np.cos(t), np.sin(t), np.zeros_like(t)], axis=-1)
+
+
+def test_charge_inside_gives_2pi_q():
+    flux = CurveFlux(circle)
+    assert flux.charges_flux([[0.2, -0.3, 0]], [1.5]) == pytest.approx(2 * np.pi * 1.5)
+
+
+def test_charge_outside_gives_zero():
+    flux = CurveFlux(circle)
+    assert flux.charges_flux([[3.0, 1.0, 0]], [1.5]) == pytest.approx(0, abs=1e-9)
+
+
+def test_charge_next_to_contour():
+    # Sem corte, a carga colada ao contorno continua contando por inteiro
+    flux = CurveFlux(circle)
+    assert flux.charges_flux([[0.98, 0, 0]], [-2.0]) == pytest.approx(-4 * np.pi)
+    assert flux.charges_flux([[1.02, 0, 0]], [-2.0]) == pytest.approx(0, abs=1e-9)
+
+
+def test_clockwise_polygon_and_several_charges():
+    corners = [[-2, -1, 0], [-2, 1, 0], [2, 1, 0], [2, -1, 0]]   # sentido horário
+    flux = CurveFlux(polygon_curve(corners), t_range=(0, 4))
+    positions = [[0, 0, 0], [1.5, 0.5, 0], [5, 0, 0]]
+    magnitudes = [1.0, -3.0, 7.0]
+    assert flux.charges_flux(positions, magnitudes) == pytest.approx(2 * np.pi * (1.0 - 3.0))
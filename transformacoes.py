@@ -0,0 +1,85 @@
+# UTILITÁRIO: Transformações ligadas a rastreadores (ValueTracker) sem reconstruir a geometria
+from manim import *
+import numpy as np
+
+
+class TrackedTransform:
+    """
+    Atualizador que aplica uma matriz 3x3, derivada de rastreadores, aos pontos
+    de um mobject construído uma única vez em pose canônica.
+
+    Os pontos canônicos de toda a família são guardados em um único array;
+    a cada quadro é feita uma só multiplicação de matrizes, e nada é feito se
+    a matriz não mudou desde o quadro anterior. Não há cópia do mobject nem
+    reconstrução da malha.
+
+    Parâmetros:
+    mobject: mobject na pose canônica
+    matrix_function: função sem argumentos que retorna a matriz 3x3 atual
+    about_point: ponto fixo da transformação
+    """
+
+    def __init__(self, mobject, matrix_function, about_point=ORIGIN):
+        self.matrix_function = matrix_function
+        self.about_point = np.array(about_point, dtype=float)
+        self.members = mobject.family_members_with_points()
+        sizes = [len(m.points) for m in self.members]
+        self.offsets = np.cumsum([0] + sizes)
+        self.canonical = np.concatenate([m.points for m in self.members]) - self.about_point
+        self._last_matrix = None
+
+    def __call__(self, mobject):
+        matrix = np.asarray(self.matrix_function(), dtype=float)
+        if self._last_matrix is not None and np.array_equal(matrix, self._last_matrix):
+            return
+        self._last_matrix = matrix
+        points = self.canonical @ matrix.T + self.about_point
+        for member, start, end in zip(self.members, self.offsets[:-1], self.offsets[1:]):
+            member.points = points[start:end]
+
+
+class TrackedPartial:
+    """
+    Atualizador que exibe uma fração de uma curva canônica construída uma
+    única vez (por exemplo, um arco cujo ângulo final vem de um rastreador).
+
+    Parâmetros:
+    mobject: VMobject com a curva completa
+    proportion_function: função sem argumentos que retorna a fração visível (0 a 1)
+    """
+
+    def __init__(self, mobject, proportion_function):
+        self.proportion_function = proportion_function
+        self.canonical = mobject.copy()
+        self._last_proportion = None
+
+    def __call__(self, mobject):
+        proportion = float(np.clip(self.proportion_function(), 0, 1))
+        if proportion == self._last_proportion:
+            return
+        self._last_proportion = proportion
+        mobject.pointwise_become_partial(self.canonical, 0, proportion)
+
+
+def bind_transform(mobject, matrix_function, about_point=ORIGIN):
+    """
+    Liga o mobject (em pose canônica) a uma matriz derivada de rastreadores.
+
+    Retorna:
+    O próprio mobject, já na pose atual
+    """
+    updater = TrackedTransform(mobject, matrix_function, about_point)
+    updater(mobject)
+    return mobject.add_updater(updater)
+
+
+def bind_partial(mobject, proportion_function):
+    """
+    Liga a fração visível de uma curva canônica a um rastreador.
+
+    Retorna:
+    O próprio mobject, já com a fração atual
+    """
+    updater = TrackedPartial(mobject, proportion_function)
+    updater(mobject)
+    return mobject.add_updater(updater)
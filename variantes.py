@@ -0,0 +1,264 @@
+# UTILITÁRIO: Variantes de cenas a partir dos parâmetros declarados, renderizadas em paralelo
+#
+# Uso:
+#   python variantes.py dipolo_2D --set q_negative_2=-2.5                 # uma variante
+#   python variantes.py dipolo_2D --grid "negative_2_shift=[[1,1],[1.8,1.8],[-2,1]]" --grid "q_negative_2=[-2,-3.5]" -j 8
+#   python variantes.py --file variantes_dipolo.json -q m
+#
+# Cada cena declara seus parâmetros no atributo de classe "parameters"; uma
+# variante é uma subclasse com alguns desses valores trocados. O arquivo JSON
+# tem a forma:
+#   {"scene": "dipolo_2D",
+#    "base": {"e": 1.6},                              # trocas comuns a todas
+#    "variants": [{"name": "forte", "q_positive": 4}],  # variantes explícitas
+#    "grid": {"q_negative_2": [-2, -3.5]}}            # produto cartesiano
+#
+# Reaproveitamento entre variantes:
+# - todas mantêm o nome da classe da cena, então compartilham o diretório de
+#   filmes parciais; com o cache por conteúdo (cache_animacoes.py) toda
+#   animação cujo estado não depende dos parâmetros trocados é renderizada
+#   uma única vez e apenas copiada para as demais;
+# - as fórmulas LaTeX ficam no cache de Tex do manim (mesmo media_dir);
+# - a primeira variante roda sozinha, aquecendo os dois caches antes de as
+#   demais começarem;
+# - cada filme parcial é gravado em um arquivo temporário do processo e
+#   renomeado ao final, então duas variantes que renderizam a mesma animação
+#   ao mesmo tempo não corrompem o arquivo;
+# - a remoção LRU do cache é feita uma única vez, depois que todas terminam
+#   (nenhum processo apaga filmes parciais de que outra variante precisa).
+import argparse
+import hashlib
+import itertools
+import json
+import multiprocessing
+import os
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from cache_animacoes import DEFAULT_SIZE_LIMIT_MB, evict_lru
+from render_lote import QUALITIES, discover_scenes, load_scene_class
+
+
+# ============================================================
+# 1. PARÂMETROS E VARIANTES
+# ============================================================
+
+def make_variant(scene_class, overrides):
+    """
+    Cria a subclasse da cena com os parâmetros trocados.
+
+    Parâmetros:
+    scene_class: classe da cena (com o atributo "parameters")
+    overrides: dicionário nome -> novo valor
+
+    Retorna:
+    Classe com o mesmo nome da cena (mesmo hash de animações e mesmos filmes
+    parciais quando o estado não muda)
+    """
+    defaults = getattr(scene_class, "parameters", {})
+    unknown = set(overrides) - set(defaults)
+    if unknown:
+        raise KeyError(
+            f"Parâmetros desconhecidos em {scene_class.__name__}: {', '.join(sorted(unknown))} "
+            f"(disponíveis: {', '.join(defaults)})"
+        )
+    parameters = {**defaults, **overrides}
+    return type(scene_class.__name__, (scene_class,), {
+        "parameters": parameters,
+        "__module__": scene_class.__module__,
+        "__qualname__": scene_class.__qualname__,
+    })
+
+
+def variant_name(overrides):
+    """Nome curto e estável de uma variante (hash dos valores trocados)."""
+    if not overrides:
+        return "base"
+    text = json.dumps(overrides, sort_keys=True)
+    return hashlib.sha1(text.encode()).hexdigest()[:8]
+
+
+def expand_variants(spec):
+    """
+    Expande a especificação em uma lista de variantes.
+
+    Parâmetros:
+    spec: dicionário com "base", "variants" e "grid" (todos opcionais)
+
+    Retorna:
+    Lista de pares (nome, trocas), sem repetições, na ordem da especificação
+    """
+    base = dict(spec.get("base", {}))
+    variants = []
+    for variant in spec.get("variants", []):
+        variant = dict(variant)
+        name = variant.pop("name", None)
+        variants.append((name, {**base, **variant}))
+    grid = spec.get("grid", {})
+    if grid:
+        names = list(grid)
+        for values in itertools.product(*(grid[name] for name in names)):
+            variants.append((None, {**base, **dict(zip(names, values))}))
+    if not variants:
+        variants.append((None, base))
+
+    unique, seen = [], set()
+    for name, overrides in variants:
+        key = json.dumps(overrides, sort_keys=True)
+        if key not in seen:
+            seen.add(key)
+            unique.append((name or variant_name(overrides), overrides))
+    return unique
+
+
+# ============================================================
+# 2. RENDERIZAÇÃO DE UMA VARIANTE (EM PROCESSO PRÓPRIO)
+# ============================================================
+
+def render_variant(job):
+    """
+    Renderiza uma variante da cena.
+
+    Parâmetros:
+    job: "name", "module", "quality", "variant" (nome), "overrides",
+         "cache_mb" e, opcionalmente, "config"
+
+    Retorna:
+    Dicionário com "variant", "overrides", "ok", "seconds", "output" e "error"
+    """
+    from manim import tempconfig
+    from cache_animacoes import enable_animation_cache
+
+    start = time.perf_counter()
+    result = {"variant": job["variant"], "overrides": job["overrides"], "output": None, "error": None}
+    options = {
+        "quality": QUALITIES[job["quality"]],
+        "progress_bar": "none",
+        "output_file": f"{job['name']}_{job['variant']}",
+    }
+    options.update(job.get("config", {}))
+    try:
+        with tempconfig(options):
+            enable_animation_cache(job.get("cache_mb") or DEFAULT_SIZE_LIMIT_MB, evict=False)
+            scene_class = make_variant(load_scene_class(job["module"], job["name"]), job["overrides"])
+            scene = scene_class()
+            scene.render()
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+        result["ok"] = True
+    except Exception:
+        result["ok"] = False
+        result["error"] = traceback.format_exc()
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+def render_variants(jobs, workers=None):
+    """
+    Renderiza a primeira variante sozinha (aquece os caches) e distribui as
+    demais entre processos criados com "spawn". Ao final, aplica uma única vez
+    a remoção LRU do cache de animações.
+
+    Retorna:
+    Lista de resultados (a primeira variante primeiro, as demais na ordem de término)
+    """
+    workers = workers or os.cpu_count()
+    context = multiprocessing.get_context("spawn")
+    results = []
+
+    def report(result):
+        status = "ok" if result["ok"] else "FALHOU"
+        print(f"[{status}] {result['variant']} {json.dumps(result['overrides'])} em {result['seconds']:.1f} s", flush=True)
+        results.append(result)
+
+    with ProcessPoolExecutor(max_workers=workers, mp_context=context) as pool:
+        if jobs:
+            report(pool.submit(render_variant, jobs[0]).result())
+        futures = [pool.submit(render_variant, job) for job in jobs[1:]]
+        for future in as_completed(futures):
+            report(future.result())
+    if jobs:
+        from manim import tempconfig
+
+        with tempconfig(jobs[0].get("config", {})):  # Mesmo media_dir dos processos
+            evict_lru(jobs[0].get("cache_mb") or DEFAULT_SIZE_LIMIT_MB)
+    return results
+
+
+# ============================================================
+# 3. LINHA DE COMANDO
+# ============================================================
+
+def parse_assignments(items):
+    """Converte ["nome=valor JSON", ...] em {"nome": valor}."""
+    values = {}
+    for item in items or []:
+        name, _, text = item.partition("=")
+        try:
+            values[name] = json.loads(text)
+        except json.JSONDecodeError:
+            raise SystemExit(f"Valor inválido para {name}: {text!r} (use JSON, por exemplo [1.8, 1.8])")
+    return values
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Renderiza variantes de uma cena em paralelo.")
+    parser.add_argument("scene", nargs="?", help="nome da cena (ou \"scene\" no arquivo)")
+    parser.add_argument("--file", help="especificação das variantes em JSON")
+    parser.add_argument("--set", action="append", metavar="NOME=VALOR", help="troca comum a todas as variantes")
+    parser.add_argument("--grid", action="append", metavar="NOME=[V1,V2,...]",
+                        help="valores de um parâmetro; várias --grid formam o produto cartesiano")
+    parser.add_argument("--list", action="store_true", help="lista os parâmetros da cena e sai")
+    parser.add_argument("-j", "--workers", type=int, default=None, help="número de processos (padrão: núcleos)")
+    parser.add_argument("-q", "--quality", default="l", choices=QUALITIES, help="qualidade")
+    parser.add_argument("--cache-mb", type=float, default=DEFAULT_SIZE_LIMIT_MB,
+                        help="limite do cache de animações por conteúdo em MB")
+    parser.add_argument("--summary", help="grava o resumo em JSON neste arquivo")
+    args = parser.parse_args(argv)
+
+    spec = {}
+    if args.file:
+        with open(args.file, encoding="utf-8") as source:
+            spec = json.load(source)
+    spec.setdefault("base", {}).update(parse_assignments(args.set))
+    spec.setdefault("grid", {}).update(parse_assignments(args.grid))
+    name = args.scene or spec.get("scene")
+
+    scenes = {scene["name"]: scene for scene in discover_scenes()}
+    if name not in scenes:
+        raise SystemExit(f"Cena desconhecida: {name}")
+    module = scenes[name]["module"]
+    if args.list:
+        for parameter, value in getattr(load_scene_class(module, name), "parameters", {}).items():
+            print(f"{parameter} = {value!r}")
+        return 0
+
+    jobs = [
+        {
+            "name": name,
+            "module": module,
+            "quality": spec.get("quality", args.quality),
+            "variant": variant,
+            "overrides": overrides,
+            "cache_mb": args.cache_mb,
+        }
+        for variant, overrides in expand_variants(spec)
+    ]
+    start = time.perf_counter()
+    results = render_variants(jobs, args.workers)
+    wall_time = time.perf_counter() - start
+
+    cpu_time = sum(result["seconds"] for result in results)
+    print(f"\n{len(results)} variantes | tempo total (relógio): {wall_time:.1f} s | soma: {cpu_time:.1f} s")
+    for result in results:
+        if not result["ok"]:
+            print(f"Falha em {result['variant']}:\n{result['error']}")
+    if args.summary:
+        with open(args.summary, "w", encoding="utf-8") as out:
+            json.dump({"wall_time": wall_time, "results": results}, out, indent=2)
+    return 0 if all(result["ok"] for result in results) else 1
+
+
+if __name__ == "__main__":
+    sys.exit(main())
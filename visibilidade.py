@@ -0,0 +1,69 @@
+# UTILITÁRIO: Visibilidade (opacidade) vetorizada dos glifos do campo
+from manim import *
+import numpy as np
+
+
+def box_bounds(mobject):
+    """
+    Retorna os limites [mínimo, máximo] da caixa envolvente de um mobject,
+    para usar uma superfície como região de oclusão dinâmica.
+    """
+    return np.array([
+        mobject.get_critical_point(DL + IN),
+        mobject.get_critical_point(UR + OUT),
+    ])
+
+
+class BoxVisibility:
+    """
+    Atualizador que ajusta a opacidade dos glifos conforme o ponto inicial
+    esteja dentro ou fora de uma caixa.
+
+    O teste é feito para todas as setas de uma vez com uma máscara NumPy, e as
+    opacidades só são alteradas nas setas cuja classificação mudou. Se nem a
+    caixa nem os pontos iniciais mudaram desde o último quadro, nada é feito.
+
+    Parâmetros:
+    glyphs: mobject FieldGlyphs
+    bounds: array [[xmin, ymin, zmin], [xmax, ymax, zmax]] ou função que o
+            retorna (por exemplo, lambda: box_bounds(superficie))
+    inside_opacity: opacidade das setas dentro da caixa
+    outside_opacity: opacidade das setas fora da caixa
+    """
+
+    def __init__(self, glyphs, bounds, inside_opacity, outside_opacity):
+        self.glyphs = glyphs
+        self.bounds = bounds
+        self.inside_opacity = inside_opacity
+        self.outside_opacity = outside_opacity
+        self._last_bounds = None
+        self._last_starts = None
+        self._mask = None
+
+    def get_mask(self):
+        """Retorna a máscara booleana (N,) das setas dentro da caixa."""
+        return self._mask
+
+    def __call__(self, mobject):
+        bounds = np.asarray(self.bounds() if callable(self.bounds) else self.bounds, dtype=float)
+        starts = self.glyphs.get_starts()
+        # Nada mudou: a superfície e os glifos estão parados
+        if (
+            starts is self._last_starts
+            and self._last_bounds is not None
+            and np.array_equal(bounds, self._last_bounds)
+        ):
+            return
+        self._last_bounds = bounds.copy()
+        self._last_starts = starts
+
+        mask = np.all((starts >= bounds[0]) & (starts <= bounds[1]), axis=1)
+        if self._mask is None:
+            changed = np.arange(len(mask))
+        else:
+            changed = np.flatnonzero(mask != self._mask)
+        self._mask = mask
+        if len(changed) == 0:
+            return
+        opacities = np.where(mask[changed], self.inside_opacity, self.outside_opacity)
+        self.glyphs.set_opacities(opacities, indices=changed)